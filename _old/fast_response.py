@@ -0,0 +1,659 @@
+# -*- coding: utf-8 -*-
+"""
+Physics Demo / Fast step and frequency responses of linear systems
+
+fastSimulation wraps a systemSimu.systemSimulation : same calls
+(setTimeParams, setFreqParams, setModel, timeResponse, freqResponse).
+The continuous SISO transfer functions are evaluated directly : analytic
+step responses up to the second order, exact discretization (matrix
+exponential) above, evaluation of the polynomials on the jw grid. Any
+other system is simulated by the wrapped systemSimulation.
+
+The time and frequency grids are taken from the wrapped systemSimulation
+(one call with a reference model for each new set of parameters), and
+the fast path is only used when it gives the same response.
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+from collections import OrderedDict
+import numpy as np
+import control as ct
+
+# Number of models of order 2 or higher from which their step responses
+# are computed in one batch (stepResponseBatch). The first order models
+# are always faster with their analytic step response.
+BATCH_THRESHOLD = 2
+
+
+def getCoefficients(model, maxOrder=None):
+    """
+    Returns the coefficients of a continuous SISO linear system
+    (None for any other system)
+
+    Parameters
+    ----------
+    model : control.TransferFunction, control.StateSpace or (num, den)
+        model of the system.
+    maxOrder : integer, optional
+        maximum order of the denominator. The default is None (any order).
+
+    Returns
+    -------
+    num : 1-dimension vector - double
+        coefficients of the numerator, highest power first.
+    den : 1-dimension vector - double
+        coefficients of the denominator, same length as num.
+
+    """
+    if isinstance(model, tuple):
+        num, den = model
+    else:
+        if isinstance(model, ct.StateSpace) and model.issiso() and model.isctime():
+            model = ct.ss2tf(model)
+        if not isinstance(model, ct.TransferFunction) or not model.issiso() \
+                or not model.isctime():
+            return None
+        num, den = model.num[0][0], model.den[0][0]
+    num = np.atleast_1d(np.asarray(num, dtype=float))
+    den = np.atleast_1d(np.asarray(den, dtype=float))
+    # Leading zeros removed (numpy.trim_zeros is much slower on short vectors)
+    nonZero = np.flatnonzero(den)
+    if len(nonZero) == 0:
+        return None
+    den = den[nonZero[0]:]
+    nonZero = np.flatnonzero(num)
+    num = num[nonZero[0]:] if len(nonZero) else num[-1:]
+    if len(num) > len(den) or (maxOrder is not None and len(den) > maxOrder + 1):
+        return None
+    padded = np.zeros(len(den))
+    padded[len(den)-len(num):] = num
+    return padded, den
+
+
+def stepResponseLowOrder(num, den, time):
+    """
+    Step response of a transfer function of order 0, 1 or 2, from the
+    residues of H(s)/s (zero initial state)
+
+    Parameters
+    ----------
+    num : 1-dimension vector - double
+        coefficients of the numerator, same length as den.
+    den : 1-dimension vector - double
+        coefficients of the denominator (order 0, 1 or 2).
+    time : 1-dimension vector - double
+        time vector, the step is applied at time[0].
+
+    Returns
+    -------
+    signal : 1-dimension vector - double
+        step response (None when a pole is 0 : integrator).
+
+    """
+    t = time - time[0]
+    order = len(den) - 1
+    if den[-1] == 0:
+        return None
+    static = num[-1] / den[-1]
+    if order == 0:
+        return np.full(len(t), static)
+    if order == 1:
+        # y(0+) = b1/a1, then exponential convergence to H(0)
+        pole = -den[1] / den[0]
+        return static + (num[0] / den[0] - static) * np.exp(pole * t)
+    p1, p2 = np.roots(den).astype(complex)
+    if abs(p1 - p2) > 1e-6 * abs(p1):
+        # Distinct poles : y = H(0) + sum N(p)/(p.D'(p)) exp(p.t)
+        signal = static
+        for p in (p1, p2):
+            residue = np.polyval(num, p) / (p * np.polyval(np.polyder(den), p))
+            signal = signal + residue * np.exp(p * t)
+        return np.real(signal)
+    # Double pole : y = H(0) + (c1 + c2.t) exp(p.t)
+    p = np.real(p1 + p2) / 2
+    c2 = np.polyval(num, p) / (den[0] * p)
+    c1 = (np.polyval(np.polyder(num), p) * p - np.polyval(num, p)) / (den[0] * p**2)
+    return static + (c1 + c2 * t) * np.exp(p * t)
+
+
+def expmBatch(F, order=10):
+    """
+    Matrix exponentials of a batch of small matrices : Taylor series of
+    F/2^s (norm below 1/4), then squared s times. Much faster than
+    scipy.linalg.expm on a few 3x3 matrices.
+
+    The squares are computed on E = M - I : (I + E)^2 = I + 2E + E^2.
+    The matrices close to I (slow models, scaled as the fastest one)
+    keep their precision.
+
+    Parameters
+    ----------
+    F : 3-dimension array - double
+        matrices, shape (number of matrices, N, N).
+    order : integer, optional
+        order of the Taylor series. The default is 10.
+
+    Returns
+    -------
+    M : 3-dimension array - double
+        exponential of each matrix.
+
+    """
+    norm = np.max(np.sum(np.abs(F), axis=-2))
+    s = max(0, int(np.ceil(np.log2(norm / 0.25)))) if norm > 0 else 0
+    A = F / 2**s
+    identity = np.eye(F.shape[-1])
+    T = identity + A / order
+    for k in range(order - 1, 1, -1):
+        T = identity + (A @ T) / k
+    E = A @ T
+    for _ in range(s):
+        E = 2 * E + E @ E
+    return identity + E
+
+
+def padCoefficients(coefficients):
+    """
+    Returns the coefficients of several transfer functions as matrices,
+    normalized (den[0] = 1) and padded with zeros to the highest order
+
+    Parameters
+    ----------
+    coefficients : list of (num, den)
+        coefficients of each model (see getCoefficients).
+
+    Returns
+    -------
+    num : 2-dimension array - double
+        numerators, one row by model, highest power first.
+    den : 2-dimension array - double
+        denominators, one row by model, highest power first.
+
+    """
+    size = max(len(den) for _, den in coefficients)
+    num = np.zeros((len(coefficients), size))
+    den = np.zeros((len(coefficients), size))
+    for k, (b, a) in enumerate(coefficients):
+        num[k, size-len(b):] = b / a[0]
+        den[k, size-len(a):] = a / a[0]
+    return num, den
+
+
+def stepResponseBatch(coefficients, time):
+    """
+    Step responses of several transfer functions (any order) at once.
+
+    Each model is written in controllable canonical form, all of them are
+    padded to the same number of states. The state equations, extended by
+    the step input, are discretized exactly on the time step :
+    z[k+1] = M.z[k], M = exp([[A, B], [0, 0]].dt). The recurrence is
+    evaluated for all the models and all the samples in log2(samples)
+    steps : z[k+m] = M^m.z[k].
+
+    Parameters
+    ----------
+    coefficients : list of (num, den)
+        coefficients of each model (see getCoefficients).
+    time : 1-dimension vector - double
+        time vector, uniform, the step is applied at time[0].
+
+    Returns
+    -------
+    signals : 2-dimension array - double
+        step responses, shape (len(time), number of models).
+
+    """
+    nbModels = len(coefficients)
+    states = max(len(den) for _, den in coefficients) - 1
+    F = np.zeros((nbModels, states + 1, states + 1))
+    C = np.zeros((nbModels, states + 1))
+    for k, (b, a) in enumerate(coefficients):
+        order = len(a) - 1
+        b, a = b / a[0], a / a[0]
+        F[k, 0, :order] = -a[1:]
+        F[k, np.arange(1, order), np.arange(order - 1)] = 1
+        F[k, 0, states] = 1 if order > 0 else 0
+        C[k, :order] = b[1:] - b[0] * a[1:]
+        C[k, states] = b[0]
+    dt = time[1] - time[0] if len(time) > 1 else 0
+    power = expmBatch(F * dt)
+    z = np.empty((nbModels, len(time), states + 1))
+    z[:, 0] = 0
+    z[:, 0, states] = 1
+    m = 1
+    while m < len(time):
+        length = min(m, len(time) - m)
+        np.matmul(z[:, :length], power.transpose(0, 2, 1), out=z[:, m:m+length])
+        power = power @ power
+        m *= 2
+    return (z @ C[:, :, np.newaxis])[..., 0].T
+
+
+def stepResponse(coefficients, time, uniform=True):
+    """
+    Step response of a transfer function : analytic up to the second
+    order, exact discretization above (uniform time vector only)
+
+    Parameters
+    ----------
+    coefficients : (num, den)
+        coefficients of the model (see getCoefficients).
+    time : 1-dimension vector - double
+        time vector, the step is applied at time[0].
+    uniform : bool, optional
+        the time vector is uniform. The default is True.
+
+    Returns
+    -------
+    signal : 1-dimension vector - double
+        step response (None if it cannot be computed directly).
+
+    """
+    num, den = coefficients
+    if len(den) <= 3:
+        signal = stepResponseLowOrder(num, den, time)
+        if signal is not None:
+            return signal
+    if uniform:
+        return stepResponseBatch([coefficients], time)[:, 0]
+    return None
+
+
+def freqResponse(coefficients, jw):
+    """
+    Frequency response of a transfer function on a jw grid
+
+    Parameters
+    ----------
+    coefficients : (num, den)
+        coefficients of the model (see getCoefficients).
+    jw : 1-dimension vector - complex
+        values of s = jw.
+
+    Returns
+    -------
+    response : 1-dimension vector - complex
+        H(jw).
+
+    """
+    num, den = coefficients
+    return np.polyval(num, jw) / np.polyval(den, jw)
+
+
+'''
+resultCache class : LRU cache (models, responses, grids)
+'''
+class resultCache:
+
+    def __init__(self, maxItems=64):
+        """
+        Parameters
+        ----------
+        maxItems : integer, optional
+            maximum number of items kept. The default is 64.
+
+        """
+        self.maxItems = maxItems
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def clear(self):
+        self.entries.clear()
+
+    def get(self, key, default=None):
+        """
+        Returns the item of a key (default if it is not in the cache)
+        """
+        if key not in self.entries:
+            self.misses += 1
+            return default
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return self.entries[key]
+
+    def put(self, key, value):
+        """
+        Adds an item (the oldest one is removed when the cache is full)
+        """
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxItems:
+            self.entries.popitem(last=False)
+
+
+'''
+fastSimulation class : fast responses around a systemSimulation
+'''
+class fastSimulation:
+
+    def __init__(self, simu, cacheSize=64, batchThreshold=BATCH_THRESHOLD):
+        """
+        Parameters
+        ----------
+        simu : systemSimu.systemSimulation
+            simulation giving the grids, and the responses of the systems
+            without fast path.
+        cacheSize : integer, optional
+            number of models and of responses kept (see cachedModel).
+            The default is 64. 0 : no cache.
+        batchThreshold : integer, optional
+            number of models from which the step responses are computed
+            in one batch. The default is BATCH_THRESHOLD.
+
+        """
+        self.simu = simu
+        self.batchThreshold = batchThreshold
+        self.models = resultCache(cacheSize) if cacheSize > 0 else None
+        self.responses = resultCache(2 * cacheSize) if cacheSize > 0 else None
+        self.grids = resultCache(8)
+        self.timeParams = None
+        self.freqParams = None
+        self.model = None
+        self.coefficients = None
+
+    def setTimeParams(self, *params):
+        self.simu.setTimeParams(*params)
+        self.timeParams = params
+
+    def setFreqParams(self, *params):
+        self.simu.setFreqParams(*params)
+        self.freqParams = params
+
+    def getTimeGrid(self):
+        """
+        Returns the time vector of the wrapped simulation and if it is
+        uniform (None if the fast path does not give its step responses)
+        """
+        key = ('time', self.timeParams)
+        if key not in self.grids:
+            self.simu.setModel(ct.tf([1], [1]))
+            time = np.asarray(self.simu.timeResponse()[0], dtype=float)
+            step = np.diff(time)
+            uniform = len(time) > 1 and np.allclose(step, step[0], rtol=1e-6, atol=0)
+            # Reference : first order, time constant of 1/5 of the grid
+            tau = (time[-1] - time[0]) / 5 if len(time) > 1 else 1
+            self.simu.setModel(ct.tf([1], [tau, 1]))
+            expected = stepResponseLowOrder(np.array([0, 1.0]), np.array([tau, 1]), time)
+            signal = np.asarray(self.simu.timeResponse()[1], dtype=float).ravel()
+            valid = signal.shape == time.shape and np.allclose(signal, expected, atol=1e-6)
+            self.grids.put(key, (time, uniform) if valid else None)
+        return self.grids.get(key)
+
+    def getFreqGrid(self):
+        """
+        Returns the frequency vector of the wrapped simulation, its jw grid
+        and the unit of the phase (None if the fast path does not give
+        its frequency responses)
+        """
+        key = ('freq', self.freqParams)
+        if key not in self.grids:
+            self.simu.setModel(ct.tf([1], [1]))
+            freq = np.asarray(self.simu.freqResponse()[0], dtype=float)
+            # Reference : first order, cut at the middle of the grid
+            omega0 = np.sqrt(freq[0] * freq[-1]) if freq[0] > 0 else freq[-1]
+            self.simu.setModel(ct.tf([1], [1 / omega0, 1]))
+            _, magnitude, phase = self.simu.freqResponse()
+            grid = None
+            # Frequency in Hz or in rad/s, phase in rad or in degrees
+            for scale in (2 * np.pi, 1):
+                expected = 1 / (1j * scale * freq / omega0 + 1)
+                for unit in (1, 180 / np.pi):
+                    if np.allclose(magnitude, np.abs(expected), rtol=1e-6) and \
+                            np.allclose(phase, unit * np.angle(expected), rtol=1e-6, atol=1e-9):
+                        grid = (freq, 1j * scale * freq, unit)
+            self.grids.put(key, grid)
+        return self.grids.get(key)
+
+    def setModel(self, model):
+        """
+        Sets the model (control.TransferFunction or any python-control system)
+        """
+        self.model = model
+        self.coefficients = getCoefficients(model)
+
+    def timeResponse(self):
+        """
+        Step response of the model, as systemSimulation.timeResponse
+        """
+        grid = self.getTimeGrid() if self.coefficients is not None else None
+        if grid is not None:
+            signal = stepResponse(self.coefficients, *grid)
+            if signal is not None:
+                return grid[0], signal
+        self.simu.setModel(self.model)
+        return self.simu.timeResponse()
+
+    def freqResponse(self):
+        """
+        Frequency response of the model, as systemSimulation.freqResponse
+        """
+        grid = self.getFreqGrid() if self.coefficients is not None else None
+        if grid is None:
+            self.simu.setModel(self.model)
+            return self.simu.freqResponse()
+        freq, jw, unit = grid
+        response = freqResponse(self.coefficients, jw)
+        return freq, np.abs(response), unit * np.unwrap(np.angle(response))
+
+    def cachedModel(self, key, build):
+        """
+        Returns the model of a key, built by build() only if it is not
+        in the cache
+
+        Parameters
+        ----------
+        key : hashable
+            parameters of the model (values of the controls).
+        build : function
+            returns the model for these parameters.
+
+        """
+        if self.models is None:
+            return build()
+        model = self.models.get(key)
+        if model is None:
+            model = build()
+            self.models.put(key, model)
+        return model
+
+    def batchTimeResponse(self, models, keys=None):
+        """
+        Step responses of several models. The models of order 2 or higher
+        are computed in one batch when there are at least batchThreshold
+        of them (see stepResponseBatch).
+
+        Parameters
+        ----------
+        models : list of python-control systems
+            models of the systems.
+        keys : list of hashable, optional
+            keys of the models (see cachedModel) : their responses are kept
+            in the cache. The default is None.
+
+        Returns
+        -------
+        time : 2-dimension array - double
+            time vector of each model, shape (samples, len(models)).
+        signal : 2-dimension array - double
+            step response of each model, shape (samples, len(models)).
+
+        """
+        grid = self.getTimeGrid()
+        if grid is None:
+            columns = [self._simulate(model, 'time') for model in models]
+            return np.column_stack([c[0] for c in columns]), np.column_stack([c[1] for c in columns])
+        time, uniform = grid
+        signal = np.empty((len(time), len(models)))
+        pending = self._fillCached('time', models, keys, [signal])
+        batch = [k for k, c in pending.items() if c is not None and len(c[1]) > 2]
+        if uniform and len(batch) >= self.batchThreshold:
+            signal[:, batch] = stepResponseBatch([pending[k] for k in batch], time)
+        else:
+            batch = []
+        for k, coefficients in pending.items():
+            if k not in batch:
+                response = stepResponse(coefficients, time, uniform) \
+                    if coefficients is not None else None
+                signal[:, k] = response if response is not None else \
+                    self._simulate(models[k], 'time')[1]
+            self._putResponse('time', keys, k, signal[:, k])
+        return np.repeat(time[:, np.newaxis], len(models), axis=1), signal
+
+    def batchFreqResponse(self, models, keys=None):
+        """
+        Frequency responses of several models : the polynomials of all the
+        models are evaluated by one product with the powers of jw
+
+        Parameters
+        ----------
+        models : list of python-control systems
+            models of the systems.
+        keys : list of hashable, optional
+            keys of the models (see cachedModel) : their responses are kept
+            in the cache. The default is None.
+
+        Returns
+        -------
+        freq : 2-dimension array - double
+            frequency vector of each model, shape (samples, len(models)).
+        magnitude : 2-dimension array - double
+            gain of each model.
+        phase : 2-dimension array - double
+            phase of each model.
+
+        """
+        grid = self.getFreqGrid()
+        if grid is None:
+            columns = [self._simulate(model, 'freq') for model in models]
+            return tuple(np.column_stack([c[i] for c in columns]) for i in range(3))
+        freq, jw, unit = grid
+        magnitude = np.empty((len(freq), len(models)))
+        phase = np.empty((len(freq), len(models)))
+        pending = self._fillCached('freq', models, keys, [magnitude, phase])
+        batch = [k for k, c in pending.items() if c is not None]
+        if batch:
+            num, den = padCoefficients([pending[k] for k in batch])
+            powers = self.getFreqPowers(num.shape[1])
+            response = (powers @ num.T) / (powers @ den.T)
+            magnitude[:, batch] = np.abs(response)
+            phase[:, batch] = unit * np.unwrap(np.angle(response), axis=0)
+        for k in pending:
+            if pending[k] is None:
+                _, magnitude[:, k], phase[:, k] = self._simulate(models[k], 'freq')
+            self._putResponse('freq', keys, k, (magnitude[:, k], phase[:, k]))
+        return np.repeat(freq[:, np.newaxis], len(models), axis=1), magnitude, phase
+
+    def getFreqPowers(self, size):
+        """
+        Returns the powers (jw)^(size-1) ... (jw)^0 of the frequency grid,
+        one column by power (kept with the grid) : the values of
+        polynomials of the highest power first are getFreqPowers(len(p)) @ p.
+        """
+        key = ('powers', self.freqParams)
+        powers = self.grids.get(key)
+        if powers is None or powers.shape[1] < size:
+            powers = np.vander(self.getFreqGrid()[1], size)
+            self.grids.put(key, powers)
+        return powers[:, powers.shape[1]-size:]
+
+    def _fillCached(self, kind, models, keys, outputs):
+        # Columns of the cached responses, returns the coefficients of the
+        # other models (None : simulated by the wrapped simulation)
+        pending = {}
+        for k, model in enumerate(models):
+            cached = self._getResponse(kind, keys, k)
+            if cached is None:
+                pending[k] = getCoefficients(model)
+            elif kind == 'time':
+                outputs[0][:, k] = cached
+            else:
+                outputs[0][:, k], outputs[1][:, k] = cached
+        return pending
+
+    def _simulate(self, model, kind):
+        # Response given by the wrapped simulation
+        self.simu.setModel(model)
+        return self.simu.timeResponse() if kind == 'time' else self.simu.freqResponse()
+
+    def _getResponse(self, kind, keys, k):
+        if keys is None or self.responses is None:
+            return None
+        params = self.timeParams if kind == 'time' else self.freqParams
+        return self.responses.get((kind, params, keys[k]))
+
+    def _putResponse(self, kind, keys, k, value):
+        # The cached arrays are copied into the matrices, never returned
+        if keys is None or self.responses is None:
+            return
+        params = self.timeParams if kind == 'time' else self.freqParams
+        self.responses.put((kind, params, keys[k]),
+                           value.copy() if isinstance(value, np.ndarray)
+                           else tuple(v.copy() for v in value))
+
+
+if __name__ == '__main__':
+    from time import perf_counter
+    import systemSimu as sS
+
+    ''' Fast path against the wrapped simulation '''
+    simu = sS.systemSimulation()
+    fast = fastSimulation(sS.systemSimulation())
+    for s in (simu, fast):
+        s.setTimeParams(0, 0.1, 1001)
+        s.setFreqParams(0, 6, 1001)
+    models = [ct.tf([10], [1e-4, 1]), ct.tf([0.5], [1]), ct.tf([1], [1e-3, 1e-1, 1]),
+              ct.feedback(ct.tf([10], [1e-4, 1]), ct.tf([0.4], [1e-3, 1])),
+              ct.tf([1], [1e-6, 3e-4, 3e-2, 1]), ct.ss(ct.tf([1], [1e-2, 1]))]
+    _, batchSignal = fast.batchTimeResponse(models)
+    _, batchMagnitude, _ = fast.batchFreqResponse(models)
+    for k, model in enumerate(models):
+        simu.setModel(model)
+        signal = np.ravel(simu.timeResponse()[1])
+        magnitude = simu.freqResponse()[1]
+        print(f'Order {len(getCoefficients(model)[1]) - 1} : step error '
+              f'{np.max(np.abs(batchSignal[:, k] - signal)) / np.max(np.abs(signal)):.1e} / '
+              f'gain error {np.max(np.abs(batchMagnitude[:, k] / magnitude - 1)):.1e}')
+
+    ''' Events of the ALI demo (gain feedback) : 6 models, zoom on 3 models '''
+    def event(fast, gain, gainFB, keyed):
+        keys, models = [], []
+        for name, params, build in (
+                ('ALI', (10, 1e5), lambda: ct.tf([10], [10 / (2*np.pi*1e5), 1])),
+                ('ALI', (gain, 1e5), lambda: ct.tf([gain], [gain / (2*np.pi*1e5), 1])),
+                ('gain', (0.5,), lambda: ct.tf([0.5], [1])),
+                ('gain', (gainFB,), lambda: ct.tf([gainFB], [1]))):
+            keys.append((name,) + params)
+            models.append(fast.cachedModel(keys[-1], build) if keyed else build())
+        for k in (0, 1):
+            keys.append(('closedLoop', keys[k], keys[k + 2]))
+            models.append(fast.cachedModel(keys[-1], lambda: ct.feedback(models[k], models[k + 2]))
+                          if keyed else ct.feedback(models[k], models[k + 2]))
+        fast.setTimeParams(0, 0.1, 1001)
+        fast.batchTimeResponse(models, keys if keyed else None)
+        fast.batchFreqResponse(models, keys if keyed else None)
+        fast.setTimeParams(0, 0.001, 1001)
+        fast.batchTimeResponse(models[1::2], keys[1::2] if keyed else None)
+
+    positions = np.linspace(1, 20, 50)
+    for label, cacheSize, keyed, values in (
+            ('no cache', 0, False, positions),
+            ('cache, new values', 64, True, positions),
+            ('cache, slider back and forth', 64, True, np.concatenate([positions, positions[::-1]]*4))):
+        fast = fastSimulation(sS.systemSimulation(), cacheSize=cacheSize)
+        fast.setFreqParams(0, 6, 1001)
+        event(fast, 1, 1, keyed)
+        for slider in ('ALI gain', 'feedback gain'):
+            start = perf_counter()
+            for v in values:
+                event(fast, v, 0.5, keyed) if slider == 'ALI gain' else event(fast, 10, v / 20, keyed)
+            duration = (perf_counter() - start) / len(values)
+            print(f'{label} / {slider} : {duration*1e3:.2f} ms by event')
@@ -10,21 +10,35 @@ Created on 17/mar/2023
 @author: julien.villemejane
 """
 
-from PyQt5.QtWidgets import QMainWindow, QApplication
+from PyQt5.QtWidgets import QMainWindow, QApplication, QLabel, QCheckBox
 from PyQt5.uic import loadUi
+from PyQt5.QtCore import QRectF, pyqtSignal
 
 import numpy as np
-from pyqtgraph import PlotWidget, plot, mkPen
-from signal_processing.signal_processing import generate_sinus_time
+from pyqtgraph import PlotWidget, plot, mkPen, ImageItem
 
 import sys  # We need sys so that we can pass argv to QApplication
 import os
+import importlib.util
+
+if importlib.util.find_spec('signal_processing') is None:
+    # Shared package of the signal demos, not installed (see ../pyproject.toml)
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from signal_processing.stft import stft_stream, iterate_blocks
+from signal_processing.pipeline import (Pipeline, Stage, OscillatorSource, MixStage,
+                                        SpectrumStage, DemodulateStage, ToneTrackingStage,
+                                        DisplaySink)
+from signal_processing.cache import ComputationCache
+from signal_processing.plotting import plot_envelope, remove_envelope
 
 """
 MainWindow class
 """
 class MainWindow(QMainWindow):
 
+    # A new frame is waiting at the end of the pipeline
+    frameReady = pyqtSignal()
     
     def __init__(self):
         super().__init__(parent=None)
@@ -51,6 +65,21 @@ class MainWindow(QMainWindow):
 
         self.plotFFTWidget.setYRange(-.1, 0.6, padding=0)
         
+        """ Tracked tones """
+        self.tonesLabel = QLabel('')
+        self.rightLayout.addWidget(self.tonesLabel)
+        
+        """ Spectrogram Widget """
+        self.plotSpectroWidget = PlotWidget(title='Spectrogram')
+        self.rightLayout.addWidget(self.plotSpectroWidget)
+        self.plotSpectroWidget.setBackground('w')
+        self.plotSpectroWidget.setLabel('bottom', 'Time (s)')
+        self.plotSpectroWidget.setLabel('left', 'Frequency (Hz)')
+        self.spectroImage = ImageItem()
+        self.plotSpectroWidget.addItem(self.spectroImage)
+        self.spectroSize = 256      # samples per frame
+        self.spectroBlock = 4096    # samples per block given to the STFT
+        
         """ Sampling Widget """
         self.sampFreqValues = ['1000', '5000', '10000']
         self.samplingFreqCombo.addItems(self.sampFreqValues)
@@ -62,6 +91,7 @@ class MainWindow(QMainWindow):
         self.sampling_freq = 1000
         self.sin_freq1 = 20
         self.sin_freq2 = 0
+        self.zoom_points = 1000     # minimum number of frequencies of the displayed spectrum
         self.freq1Slider.setValue(self.sin_freq1)
         self.freq1Value.setText(f'{self.sin_freq1} Hz')
         if(self.onSig2.isChecked()):
@@ -70,10 +100,15 @@ class MainWindow(QMainWindow):
         else:
             self.freq2Value.setText(f'OFF')
         
-        """ Signals generation"""
-        self.time, self.signal, self.freq, self.s_fft = self.generate_signals()
-        self.plotSig = self.plotSignalWidget.plot(self.time, self.signal, pen=self.pen)
-        self.plotFFT = self.plotFFTWidget.plot(self.freq, self.s_fft, pen=self.pen)
+        """ Streaming """
+        self.streamBt = QCheckBox('Continuous stream')
+        self.leftLayout.addWidget(self.streamBt)
+        self.pipeline = self.build_pipeline()
+        self.frameReady.connect(self.refreshFrame)
+        # Displayed data and curves
+        self.signal = self.s_fft = self.iq_demod = self.spectrogram = None
+        self.plotSig = self.plotFFT = None
+        self.demodItems = []
         
         """ Events """        
         self.freq1Slider.valueChanged.connect(self.freqChanged)
@@ -82,6 +117,7 @@ class MainWindow(QMainWindow):
         self.samplingFreqCombo.currentIndexChanged.connect(self.freqChanged)
         self.samplesCombo.currentIndexChanged.connect(self.freqChanged)
         self.demodBt.stateChanged.connect(self.refreshGraph)
+        self.streamBt.stateChanged.connect(self.streamChanged)
         
         
         self.refreshGraph()
@@ -107,59 +143,136 @@ class MainWindow(QMainWindow):
             self.freq2Value.setText(f'{self.sin_freq2} Hz')
         else:
             self.freq2Value.setText(f'OFF')
-            
-        
-        """ Signals generation"""
-        self.time, self.signal, self.freq, self.s_fft = self.generate_signals()
         
+        """ New parameters of the pipeline """
+        self.configure_pipeline()
+        if not self.pipeline.running:
+            # One frame, displayed by the sink of the pipeline
+            self.pipeline.process()
+    
+    def build_pipeline(self):
+        """
+        Pipeline of the demo : oscillators -> product -> spectrum ->
+        spectrogram / tracked tones -> demodulation -> display
+
+        Each change of a control processes one frame : the result of each
+        stage is cached with its parameters, so only the stages after the
+        changed one are computed (the demodulation overlay is the last one).
+        """
+        self.source = OscillatorSource([self.sin_freq1, self.sin_freq2],
+                                       self.sampling_freq, self.samples, period=0.1)
+        self.mixStage = MixStage('product')
+        self.spectrumStage = SpectrumStage(points=self.zoom_points)
+        self.tonesStage = ToneTrackingStage([self.sin_freq1])
+        self.demodStage = DemodulateStage(1, self.sampling_freq, enabled=False)
+        self.demodSpectrumStage = SpectrumStage(points=self.zoom_points, key='iq',
+                                                output='iq_spectrum', real=True,
+                                                enabled=False)
+        self.display = DisplaySink(self.frameReady.emit)
+        stages = [self.mixStage, self.spectrumStage,
+                  Stage(self.computeSpectrogram,
+                        cache_key=lambda: (self.spectroSize, self.spectroBlock)),
+                  self.tonesStage,
+                  self.demodStage, self.demodSpectrumStage]
+        self.cache = ComputationCache()
+        return Pipeline(self.source, stages, [self.display], cache=self.cache)
+    
+    def configure_pipeline(self):
+        """ Parameters of each stage, from the controls """
+        self.source.configure(frequencies=[self.sin_freq1, self.sin_freq2],
+                              Fe=self.sampling_freq, block_size=self.samples)
+        self.mixStage.configure(channels=[0, 1] if self.onSig2.isChecked() else [0])
+        """ Zoom for displaying : only the displayed band is computed """
+        f_range = min(self.max_freq, self.sampling_freq/2)
+        self.spectrumStage.configure(f_min=-f_range, f_max=f_range)
         """ Demodulaton """
-        if(self.demodBt.isChecked()):
-            carrierSig = generate_sinus_time(self.sin_freq2, self.time)
-            self.signal_demod = self.signal * carrierSig
-            self.s_demod_fft = np.abs(np.fft.fftshift(np.fft.fft(self.signal_demod)))/self.samples
-            
-        """ Zoom for displaying """
-        freq_half = int(self.samples/2)        
-        f_range = self.max_freq / self.sampling_freq * self.samples
-        if(f_range > self.samples/2):
-            f_range = int(self.samples/2)
+        demod = self.demodBt.isChecked()
+        if demod:
+            self.demodStage.configure(**self.get_demod_params())
+            f_range = min(self.max_freq, self.demod_freq/2)
+            self.demodSpectrumStage.configure(f_min=-f_range, f_max=f_range)
+        self.demodStage.configure(enabled=demod)
+        self.demodSpectrumStage.configure(enabled=demod)
+        if(self.onSig2.isChecked()):
+            # Sidebands of the modulated carrier
+            self.tonesStage.configure(frequencies=[abs(self.sin_freq2 - self.sin_freq1),
+                                                   self.sin_freq2 + self.sin_freq1])
         else:
-            f_range = int(f_range)
-        
-        self.freq = self.freq[freq_half-f_range:freq_half+f_range]
-        self.s_fft = self.s_fft[freq_half-f_range:freq_half+f_range]
-        if(self.demodBt.isChecked()):
-            self.s_demod_fft = self.s_demod_fft[freq_half-f_range:freq_half+f_range]
-        
-        """ Displaying data """
-        self.plotSignalWidget.removeItem(self.plotSig)
-        self.plotSig = self.plotSignalWidget.plot(self.time, self.signal, pen=self.pen)
-        self.plotFFTWidget.clear()
-        self.plotFFTWidget.removeItem(self.plotFFT)
-        if(self.demodBt.isChecked()):
-            self.plotFFTWidget.removeItem(self.plotFFT)
-        self.plotFFT = self.plotFFTWidget.plot(self.freq, self.s_fft, pen=self.pen)
-        if(self.demodBt.isChecked()):
-            penDemod = mkPen(color=(0, 128, 128), width=4)
-            self.plotFFTWidget.plot(self.freq, self.s_demod_fft, pen=penDemod)
-            
+            self.tonesStage.configure(frequencies=[self.sin_freq1])
     
-    def generate_signals(self):
-        final_time = self.samples / self.sampling_freq
-        time = np.linspace(0, final_time, self.samples)
-        
-        dataSig = generate_sinus_time(self.sin_freq1, time)
-        if(self.onSig2.isChecked()):
-            carrierSig = generate_sinus_time(self.sin_freq2, time)
-            dataSig = dataSig * carrierSig
+    def get_demod_params(self):
+        """ IQ demodulation of the signal, with the carrier of the second signal """
+        carrier = max(self.sin_freq2, 1)
+        # Low-pass at the carrier frequency : between the message (f1 < f2)
+        # and the image at 2.f2 - f1
+        cutoff = min(carrier, 0.4 * self.sampling_freq)
+        decimation = max(1, self.sampling_freq // (4 * carrier))
+        numtaps = 2 * int(2 * self.sampling_freq / carrier) + 1
+        self.demod_freq = self.sampling_freq / decimation
+        return dict(carrier=carrier, Fe=self.sampling_freq, cutoff=cutoff,
+                    decimation=decimation, numtaps=numtaps, phase=-np.pi/2)
+    
+    def streamChanged(self):
+        """ Continuous stream : the pipeline runs in its own thread """
+        if self.streamBt.isChecked():
+            self.configure_pipeline()
+            self.pipeline.start()
+        else:
+            self.pipeline.stop()
+            self.refreshGraph()
+    
+    def refreshFrame(self):
+        """ Last frame of the pipeline (thread of the interface) """
+        frame = self.display.get()
+        if frame is None:
+            return
         
-        freq = np.fft.fftfreq(self.samples, time[1]-time[0])
-        freq = np.fft.fftshift(freq)
-        dataFFT = np.abs(np.fft.fftshift(np.fft.fft(dataSig)))/self.samples
-        return time, dataSig, freq, dataFFT
-
+        """ Displaying data : only the curves whose data changed """
+        # The results of the cache are the same arrays from one frame to the next
+        if frame['signal'] is not self.signal:
+            self.time, self.signal = frame['time'], frame['signal']
+            if self.plotSig is not None:
+                remove_envelope(self.plotSignalWidget, self.plotSig)
+            self.plotSig = plot_envelope(self.plotSignalWidget, self.time, self.signal, pen=self.pen)
+        if frame['spectrum'][1] is not self.s_fft:
+            self.freq, self.s_fft = frame['spectrum']
+            if self.plotFFT is not None:
+                remove_envelope(self.plotFFTWidget, self.plotFFT)
+            self.plotFFT = plot_envelope(self.plotFFTWidget, self.freq, self.s_fft, pen=self.pen)
+        if frame.get('iq') is not self.iq_demod:
+            self.iq_demod = frame.get('iq')
+            for widget, item in self.demodItems:
+                remove_envelope(widget, item)
+            self.demodItems = []
+            if self.iq_demod is not None:
+                penDemod = mkPen(color=(0, 128, 128), width=4)
+                penEnvelope = mkPen(color=(200, 0, 0), width=2)
+                self.demodItems = [
+                    (self.plotSignalWidget, plot_envelope(self.plotSignalWidget, frame['iq_time'],
+                                                          self.iq_demod.real, pen=penDemod)),
+                    (self.plotSignalWidget, plot_envelope(self.plotSignalWidget, frame['iq_time'],
+                                                          np.abs(self.iq_demod), pen=penEnvelope)),
+                    (self.plotFFTWidget, plot_envelope(self.plotFFTWidget, *frame['iq_spectrum'],
+                                                       pen=penDemod))]
+        if frame['spectrogram'] is not self.spectrogram:
+            self.spectrogram = frame['spectrogram']
+            # ImageItem : first axis is X (time), second axis is Y (frequency)
+            self.spectroImage.setImage(self.spectrogram.T)
+            self.spectroImage.setRect(QRectF(self.time[0], 0, len(self.time) / frame['Fe'],
+                                             frame['Fe'] / 2))
+        text = ' | '.join(f'{f} Hz : {a:.3f}' for f, a in frame['tones_amplitudes'])
+        self.tonesLabel.setText(f'Tracked tones - {text}')
+    
+    def computeSpectrogram(self, frame):
+        """ Spectrogram of the signal, computed block by block """
+        nperseg = min(self.spectroSize, len(frame['signal']))
+        blocks = iterate_blocks(frame['signal'], self.spectroBlock)
+        columns = [col for _, col in stft_stream(blocks, frame['Fe'], nperseg)]
+        frame['spectrogram'] = np.concatenate(columns, axis=1)
+        return frame
     
     def closeEvent(self, event):
+        self.pipeline.stop()
         QApplication.quit()
 
 
@@ -9,15 +9,25 @@ Created on 11/mar/2023
 @author: julien.villemejane
 """
 
-from PyQt6.QtWidgets import QMainWindow, QApplication
+from PyQt6.QtWidgets import QMainWindow, QApplication, QLabel, QCheckBox
 from PyQt6.uic import loadUi
+from PyQt6.QtCore import pyqtSignal
 
 import numpy as np
 from pyqtgraph import PlotWidget, plot, mkPen
-from signal_processing.signal_processing import generate_sinus_time
 
 import sys  # We need sys so that we can pass argv to QApplication
 import os
+import importlib.util
+
+if importlib.util.find_spec('signal_processing') is None:
+    # Shared package of the signal demos, not installed (see ../pyproject.toml)
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from signal_processing.pipeline import (Pipeline, OscillatorSource, MixStage, SpectrumStage,
+                                        ToneTrackingStage, WindowedSpectraStage, DisplaySink)
+from signal_processing.windows import WINDOW_TYPES, window_metrics
+from signal_processing.plotting import plot_envelope, remove_envelope
 
 
 """
@@ -25,6 +35,8 @@ MainWindow class
 """
 class MainWindow(QMainWindow):
 
+    # A new frame is waiting at the end of the pipeline
+    frameReady = pyqtSignal()
     
     def __init__(self):
         super().__init__(parent=None)
@@ -50,6 +62,21 @@ class MainWindow(QMainWindow):
 
         self.plotFFTWidget.setYRange(-.1, 1.1, padding=0)
         
+        """ Tracked tones """
+        self.tonesLabel = QLabel('')
+        self.rightLayout.addWidget(self.tonesLabel)
+        
+        """ Windows comparison Widget """
+        self.plotWindowsWidget = PlotWidget(title='Windows comparison (dB)')
+        self.rightLayout.addWidget(self.plotWindowsWidget)
+        self.plotWindowsWidget.setBackground('w')
+        self.plotWindowsWidget.addLegend()
+        self.plotWindowsWidget.setYRange(-120, 5, padding=0)
+        self.windowsColors = [(128, 128, 0), (0, 0, 255), (255, 0, 0),
+                              (0, 160, 0), (160, 0, 160)]
+        self.windowsLabel = QLabel('')
+        self.rightLayout.addWidget(self.windowsLabel)
+        
         """ Sampling Widget """
         self.sampFreqValues = ['125', '250', '500', '1000', '5000', '10000']
         self.samplingFreqCombo.addItems(self.sampFreqValues)
@@ -61,6 +88,7 @@ class MainWindow(QMainWindow):
         self.sampling_freq = 1000
         self.sin_freq1 = 20
         self.sin_freq2 = 0
+        self.zoom_points = 1000     # minimum number of frequencies of the displayed spectrum
         self.freq1Slider.setValue(self.sin_freq1)
         self.freq1Value.setText(f'{self.sin_freq1} Hz')
         if(self.onSig2.isChecked()):
@@ -69,10 +97,13 @@ class MainWindow(QMainWindow):
         else:
             self.freq2Value.setText(f'OFF')
         
-        """ Signals generation"""
-        self.time, self.signal, self.freq, self.s_fft = self.generate_signals()
-        self.plotSig = self.plotSignalWidget.plot(self.time, self.signal, pen=self.pen)
-        self.plotFFT = self.plotFFTWidget.plot(self.freq, self.s_fft, pen=self.pen)
+        """ Streaming """
+        self.streamBt = QCheckBox('Continuous stream')
+        self.leftLayout.addWidget(self.streamBt)
+        self.pipeline = self.build_pipeline()
+        self.frameReady.connect(self.refreshFrame)
+        self.plotSig = None
+        self.plotFFT = None
         
         """ Events """        
         self.refreshPlotsBt.clicked.connect(self.refreshGraph)
@@ -81,6 +112,7 @@ class MainWindow(QMainWindow):
         self.onSig2.stateChanged.connect(self.freqChanged)
         self.samplingFreqCombo.currentIndexChanged.connect(self.freqChanged)
         self.samplesCombo.currentIndexChanged.connect(self.freqChanged)
+        self.streamBt.stateChanged.connect(self.streamChanged)
         
         self.refreshGraph()
 
@@ -101,40 +133,83 @@ class MainWindow(QMainWindow):
             self.freq2Value.setText(f'OFF')
             
         
-        """ Signals generation"""
-        self.time, self.signal, self.freq, self.s_fft = self.generate_signals()
-        """ Zoom for displaying """
-        freq_half = int(self.samples/2)        
-        max_freq = self.freq1Slider.maximum()
-        f_range = max_freq / self.sampling_freq * self.samples
-        if(f_range > self.samples/2):
-            f_range = int(self.samples/2)
+        """ New parameters of the pipeline """
+        self.configure_pipeline()
+        if not self.pipeline.running:
+            # One frame, displayed by the sink of the pipeline
+            self.pipeline.process()
+    
+    def build_pipeline(self):
+        """
+        Pipeline of the demo : oscillators -> sum -> spectrum ->
+        tracked tones / windows comparison -> display
+        """
+        self.source = OscillatorSource([self.sin_freq1, self.sin_freq2],
+                                       self.sampling_freq, self.samples, period=0.1)
+        self.spectrumStage = SpectrumStage(points=self.zoom_points)
+        self.tonesStage = ToneTrackingStage([self.sin_freq1])
+        self.windowsStage = WindowedSpectraStage()
+        self.display = DisplaySink(self.frameReady.emit)
+        stages = [MixStage('sum'), self.spectrumStage, self.tonesStage, self.windowsStage]
+        return Pipeline(self.source, stages, [self.display])
+    
+    def configure_pipeline(self):
+        """ Parameters of each stage, from the controls """
+        self.source.configure(frequencies=[self.sin_freq1, self.sin_freq2],
+                              amplitudes=[1, int(self.onSig2.isChecked())],
+                              Fe=self.sampling_freq, block_size=self.samples)
+        """ Zoom for displaying : only the displayed band is computed """
+        f_range = min(self.freq1Slider.maximum(), self.sampling_freq/2)
+        self.spectrumStage.configure(f_min=-f_range, f_max=f_range)
+        self.windowsStage.configure(f_max=f_range)
+        if(self.onSig2.isChecked()):
+            self.tonesStage.configure(frequencies=[self.sin_freq1, self.sin_freq2])
         else:
-            f_range = int(f_range)
-        
-        self.freq = self.freq[freq_half-f_range:freq_half+f_range]
-        self.s_fft = self.s_fft[freq_half-f_range:freq_half+f_range]
+            self.tonesStage.configure(frequencies=[self.sin_freq1])
+    
+    def streamChanged(self):
+        """ Continuous stream : the pipeline runs in its own thread """
+        if self.streamBt.isChecked():
+            self.configure_pipeline()
+            self.pipeline.start()
+        else:
+            self.pipeline.stop()
+            self.refreshGraph()
+    
+    def refreshFrame(self):
+        """ Last frame of the pipeline (thread of the interface) """
+        frame = self.display.get()
+        if frame is None:
+            return
         
         """ Displaying data """
-        self.plotSignalWidget.removeItem(self.plotSig)
-        self.plotSig = self.plotSignalWidget.plot(self.time, self.signal, pen=self.pen)
-        self.plotFFTWidget.removeItem(self.plotFFT)
-        self.plotFFT = self.plotFFTWidget.plot(self.freq, self.s_fft, pen=self.pen)
+        self.time, self.signal = frame['time'], frame['signal']
+        self.freq, self.s_fft = frame['spectrum']
+        if self.plotSig is not None:
+            remove_envelope(self.plotSignalWidget, self.plotSig)
+            remove_envelope(self.plotFFTWidget, self.plotFFT)
+        self.plotSig = plot_envelope(self.plotSignalWidget, self.time, self.signal, pen=self.pen)
+        self.plotFFT = plot_envelope(self.plotFFTWidget, self.freq, self.s_fft, pen=self.pen)
+        text = ' | '.join(f'{f} Hz : {a:.3f}' for f, a in frame['tones_amplitudes'])
+        self.tonesLabel.setText(f'Tracked tones - {text}')
+        self.refreshWindows(frame)
     
-    def generate_signals(self):
-        final_time = self.samples / self.sampling_freq
-        time = np.linspace(0, final_time, self.samples)
-        
-        dataSig = generate_sinus_time(self.sin_freq1, time)
-        if(self.onSig2.isChecked()):
-            dataSig+= generate_sinus_time(self.sin_freq2, time)
-        
-        freq = np.fft.fftfreq(self.samples, time[1]-time[0])
-        freq = np.fft.fftshift(freq)
-        dataFFT = np.abs(np.fft.fftshift(np.fft.fft(dataSig)))/self.samples
-        return time, dataSig, freq, dataFFT
+    def refreshWindows(self, frame):
+        """ Spectra of the signal with each window """
+        freq, spectra = frame['windows']
+        spectra_dB = 20 * np.log10(np.maximum(spectra, 1e-12) / 0.5)
+        self.plotWindowsWidget.clear()
+        text = []
+        for window, spectrum, color in zip(WINDOW_TYPES, spectra_dB, self.windowsColors):
+            plot_envelope(self.plotWindowsWidget, freq, spectrum, name=window,
+                          pen=mkPen(color=color, width=2))
+            metrics = window_metrics(window, len(frame['signal']))
+            text.append(f'{window} : ENBW {metrics["enbw"]:.2f} bins, '
+                        f'scalloping {metrics["scalloping_loss"]:.2f} dB')
+        self.windowsLabel.setText('\n'.join(text))
     
     def closeEvent(self, event):
+        self.pipeline.stop()
         QApplication.quit()
 
 
@@ -1,13 +0,0 @@
-# -*- coding: utf-8 -*-
-"""
-Signal Processing libraries of functions
-
-Author : Julien VILLEMEJANE
-Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
-Version : 1.0 - 2022-12-01
-"""
-
-from .signal_processing import *
-
-if __name__ == '__main__':
-    print("Signal Processing libraries of functions")
\ No newline at end of file
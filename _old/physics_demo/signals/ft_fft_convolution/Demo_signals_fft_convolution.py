@@ -10,6 +10,7 @@ Created on 11/mar/2023
 """
 
 from PyQt6.QtWidgets import QMainWindow, QApplication
+from PyQt6.QtWidgets import QComboBox, QSlider, QLabel, QGridLayout
 from PyQt6.uic import loadUi
 from PyQt6.QtGui import QPixmap, QImage
 from PyQt6 import QtCore
@@ -17,10 +18,19 @@ from PyQt6 import QtCore
 
 import numpy as np
 from pyqtgraph import PlotWidget, plot, mkPen
-from signal_processing.signal_processing import generate_sinus_time
 
 import sys  # We need sys so that we can pass argv to QApplication
 import os
+import importlib.util
+
+if importlib.util.find_spec('signal_processing') is None:
+    # Shared package of the signal demos, not installed (see ../pyproject.toml)
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from signal_processing.signal_processing import generate_sinus_time
+from signal_processing.convolution import convolve, benchmark_convolution, get_cost_model
+from signal_processing.resampling import sinc_reconstruct
+from signal_processing.plotting import plot_envelope
 
 
 
@@ -66,12 +76,34 @@ class MainWindow(QMainWindow):
         self.plotSignalWidget.setBackground('w')
         self.plotSignalWidget.setYRange(-0.3, 1.1)
         
+        """ Convolution kernel """
+        self.kernelTypes = ['None', 'Rectangle', 'Triangle', 'Gaussian', 'Exponential']
+        self.kernelCombo = QComboBox()
+        self.kernelCombo.addItems(self.kernelTypes)
+        self.kernelSlider = QSlider(QtCore.Qt.Orientation.Horizontal)
+        self.kernelSlider.setMinimum(3)
+        self.kernelSlider.setMaximum(self.maxNumber//2)
+        self.kernelSlider.setValue(51)
+        self.kernelValue = QLabel(f'{self.kernelSlider.value()} samples')
+        kernelLayout = QGridLayout()
+        kernelLayout.addWidget(QLabel('Convolution Kernel'), 0, 0, 1, 2)
+        kernelLayout.addWidget(self.kernelCombo, 1, 0, 1, 2)
+        kernelLayout.addWidget(self.kernelSlider, 2, 0)
+        kernelLayout.addWidget(self.kernelValue, 2, 1)
+        self.horizontalLayout.insertLayout(2, kernelLayout)
+        self.timingLabel = QLabel('')
+        self.signalLayout.addWidget(self.timingLabel)
+        # Calibration of the convolution methods on this computer
+        get_cost_model()
+        
         
         """ Events """        
         self.offsetSlider.valueChanged.connect(self.freqChanged)
         self.numberSlider.valueChanged.connect(self.freqChanged)
         self.onSig.stateChanged.connect(self.freqChanged)
         self.absSig.stateChanged.connect(self.freqChanged)
+        self.kernelCombo.currentIndexChanged.connect(self.freqChanged)
+        self.kernelSlider.valueChanged.connect(self.freqChanged)
         self.resetBt.clicked.connect(self.resetGraph)
         
         self.refreshGraph()
@@ -88,6 +120,7 @@ class MainWindow(QMainWindow):
         self.numberSlider.setValue(self.number)
         self.absSig.setChecked(False)
         self.onSig.setChecked(False)
+        self.kernelCombo.setCurrentIndex(0)
         self.refreshGraph()
         
         
@@ -106,9 +139,51 @@ class MainWindow(QMainWindow):
         penSinC = mkPen(color=(128, 128, 0), width=3)
         penSinCFT = mkPen(color=(0, 0, 255), width=4)
         
-        self.plotSignalWidget.plot(self.x, self.signal, pen=penSinC)
+        plot_envelope(self.plotSignalWidget, self.x, self.signal, pen=penSinC)
         if(self.onSig.isChecked()):
-            self.plotSignalWidget.plot(self.xFT, self.signalFT, pen=penSinCFT)
+            self.plotSignalWidget.plot(self.xFT, self.signalFT, pen=penSinCFT,
+                                       symbol='o', symbolBrush=(0, 0, 255))
+            """ Reconstruction from the samples (Whittaker-Shannon) """
+            Ts = self.xFT[1] - self.xFT[0]
+            step = self.x[1] - self.x[0]
+            xRec, signalRec = sinc_reconstruct(self.signalFT, self.xFT[0], Ts,
+                                               self.x[0], step, len(self.x))
+            penRec = mkPen(color=(0, 160, 0), width=2)
+            plot_envelope(self.plotSignalWidget, xRec, signalRec, pen=penRec)
+        
+        """ Convolution """
+        kernel = self.generate_kernel()
+        if kernel is None:
+            self.timingLabel.setText('')
+        else:
+            size = len(kernel)
+            self.kernelValue.setText(f'{size} samples')
+            signalConv = convolve(self.signal, kernel)
+            # Same size as the signal : center of the full convolution
+            signalConv = signalConv[(size-1)//2:(size-1)//2 + len(self.signal)]
+            penConv = mkPen(color=(255, 0, 0), width=3)
+            plot_envelope(self.plotSignalWidget, self.x, signalConv, pen=penConv)
+            times = benchmark_convolution(self.signal, kernel, repeat=3)
+            method = get_cost_model().choose_method(len(self.signal), size)
+            text = ' | '.join(f'{m} : {t*1e3:.3f} ms' for m, t in times.items())
+            self.timingLabel.setText(f'{text} | auto : {method}')
+    
+    def generate_kernel(self):
+        """ Kernel of the convolution, normalized to a sum of 1 """
+        kind = self.kernelCombo.currentText()
+        size = self.kernelSlider.value()
+        n = np.arange(size) - (size-1)/2
+        if kind == 'Rectangle':
+            kernel = np.ones(size)
+        elif kind == 'Triangle':
+            kernel = 1 - np.abs(n) / (size/2 + 1)
+        elif kind == 'Gaussian':
+            kernel = np.exp(-0.5 * (n / (size/6))**2)
+        elif kind == 'Exponential':
+            kernel = np.exp(-np.arange(size) / (size/5))
+        else:
+            return None
+        return kernel / np.sum(kernel)
     
     def generate_signals(self):
         x = np.linspace(-10, 10, self.maxNumber)
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+Signal Processing libraries of functions
+Shared by the signal demos (am_modulation, ft_fft, ft_fft_convolution)
+and the python examples : pip install -e _old/physics_demo/signals
+The SciPy submodules are imported at their first use (see _lazy).
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+from .signal_processing import *
+from .spectral import *
+from .stft import *
+from .psd import *
+from .noise import *
+from .oscillator import *
+from .synthesis import *
+from .zoom import *
+from .demodulation import *
+from .convolution import *
+from .resampling import *
+from .tracking import *
+from .windows import *
+from .envelope import *
+from .pipeline import *
+from .cache import *
+from .statistics import *
+
+if __name__ == '__main__':
+    print("Signal Processing libraries of functions")
\ No newline at end of file
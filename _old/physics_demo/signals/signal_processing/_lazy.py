@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Signal Processing libraries of functions
+Lazy import of the SciPy submodules : importing scipy.signal takes
+almost one second, the demos start before it is needed
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import importlib
+
+
+class LazyModule:
+    """
+    Module imported at the first access to one of its attributes.
+
+    The attributes are then kept in the object itself : the next
+    accesses cost no more than for the module.
+    """
+
+    def __init__(self, name):
+        """
+        Parameters
+        ----------
+        name : string
+            full name of the module (for example 'scipy.signal').
+
+        """
+        self._name = name
+
+    def __getattr__(self, attribute):
+        # Only called for the attributes not yet kept
+        value = getattr(importlib.import_module(self._name), attribute)
+        setattr(self, attribute, value)
+        return value
+
+    def __repr__(self):
+        return f'<lazy module {self._name!r}>'
+
+
+def lazy_import(name):
+    """
+    Returns a module imported at its first use
+
+    Parameters
+    ----------
+    name : string
+        full name of the module (for example 'scipy.signal').
+
+    Returns
+    -------
+    module : LazyModule
+        proxy of the module.
+
+    """
+    return LazyModule(name)
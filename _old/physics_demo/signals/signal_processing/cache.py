@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+Signal Processing libraries of functions
+Keyed cache of computation results, bounded in memory
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+from collections import OrderedDict
+import threading
+import numpy as np
+
+
+def get_nbytes(value):
+    """
+    Returns the memory used by the arrays of a value (array, or tuple,
+    list or dictionary of arrays), each array counted once
+    """
+    return sum(array.nbytes for array in get_arrays(value).values())
+
+
+def get_arrays(value, arrays=None):
+    """
+    Returns the arrays of a value (array, or tuple, list or dictionary
+    of arrays), as a dictionary id : array
+    """
+    if arrays is None:
+        arrays = {}
+    if isinstance(value, np.ndarray):
+        arrays[id(value)] = value
+    elif isinstance(value, dict):
+        for v in value.values():
+            get_arrays(v, arrays)
+    elif isinstance(value, (tuple, list)):
+        for v in value:
+            get_arrays(v, arrays)
+    return arrays
+
+
+class ComputationCache:
+    """
+    Cache of computation results, keyed by tuples of parameters
+    (samples, sampling frequency, frequencies, flags...).
+
+    The least recently used results are removed when the arrays of the
+    cache use more than max_bytes. An array shared by several results
+    (the frames of the successive stages of a pipeline share most of
+    their entries) is counted once, as long as one of them is cached.
+    """
+
+    def __init__(self, max_bytes=16 * 2**20, max_items=None):
+        """
+        Parameters
+        ----------
+        max_bytes : integer, optional
+            maximum memory of the cached arrays. The default is 16 MB.
+        max_items : integer, optional
+            maximum number of results. The default is None (no limit).
+
+        """
+        self.max_bytes = max_bytes
+        self.max_items = max_items
+        self.entries = OrderedDict()    # key : (value, id of its arrays)
+        self.arrays = {}                # id : [array, number of results]
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self.arrays.clear()
+            self.nbytes = 0
+
+    def get(self, key, default=None):
+        """
+        Returns the result of a key (default if it is not in the cache)
+        """
+        with self._lock:
+            if key not in self.entries:
+                self.misses += 1
+                return default
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key][0]
+
+    def put(self, key, value):
+        """
+        Adds a result (its arrays become read-only). A result larger than
+        the cache is not kept.
+        """
+        arrays = get_arrays(value)
+        with self._lock:
+            nbytes = sum(array.nbytes for i, array in arrays.items()
+                         if i not in self.arrays)
+            if nbytes > self.max_bytes:
+                return
+            if key in self.entries:
+                self._release(self.entries.pop(key)[1])
+            for i, array in arrays.items():
+                reference = self.arrays.get(i)
+                if reference is None:
+                    # A result of the cache is shared by all the users of its key
+                    array.flags.writeable = False
+                    self.arrays[i] = [array, 1]
+                    self.nbytes += array.nbytes
+                else:
+                    reference[1] += 1
+            self.entries[key] = (value, tuple(arrays))
+            while self.nbytes > self.max_bytes or \
+                    (self.max_items is not None and len(self.entries) > self.max_items):
+                self._release(self.entries.popitem(last=False)[1][1])
+
+    def _release(self, ids):
+        """
+        Removes the arrays of a result that no other result uses
+        """
+        for i in ids:
+            reference = self.arrays[i]
+            reference[1] -= 1
+            if reference[1] == 0:
+                self.nbytes -= reference[0].nbytes
+                del self.arrays[i]
+
+    def get_or_compute(self, key, function, *args, **kargs):
+        """
+        Returns the result of a key, computed by function(*args, **kargs)
+        if it is not in the cache
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = function(*args, **kargs)
+            self.put(key, value)
+        return value
+
+
+_MISSING = object()
+
+
+if __name__ == '__main__':
+    import time
+    from .pipeline import (Pipeline, Stage, OscillatorSource, MixStage,
+                           SpectrumStage, DemodulateStage)
+    from .stft import stft_stream, iterate_blocks
+
+    def spectrogram(frame):
+        blocks = iterate_blocks(frame['signal'], 4096)
+        columns = [col for _, col in stft_stream(blocks, frame['Fe'], 256)]
+        frame['spectrogram'] = np.concatenate(columns, axis=1)
+        return frame
+
+    def build(cache):
+        """ Pipeline of the AM demo (without display) """
+        source = OscillatorSource([20, 200], 10000, 10000)
+        demod = DemodulateStage(200, 10000, decimation=12, cutoff=200, numtaps=201,
+                                phase=-np.pi/2, enabled=False)
+        demod_spectrum = SpectrumStage(-500, 500, key='iq', output='iq_spectrum',
+                                       real=True, enabled=False)
+        stages = [MixStage('product'), SpectrumStage(-2400, 2400),
+                  Stage(spectrogram, cache_key=lambda: 'spectrogram'), demod, demod_spectrum]
+        return Pipeline(source, stages, cache=cache), source, demod, demod_spectrum
+
+    # Events of the interface : demodulation overlay on/off, new values of
+    # the first slider, the second slider moved back and forth
+    def events(source, demod, demod_spectrum):
+        for k in range(100):
+            for enabled in (True, False):
+                demod.configure(enabled=enabled)
+                demod_spectrum.configure(enabled=enabled)
+                yield 'demodBt'
+            source.configure(frequencies=[20 + 0.1 * k, 200])
+            yield 'freq1Slider'
+            source.configure(frequencies=[20 + 0.1 * k, 200 + k % 2])
+            yield 'freq2Slider'
+
+    # Both pipelines are run in turn, on the same events
+    runs = {'Without': build(None), 'With': build(ComputationCache())}
+    latency = {name: {} for name in runs}
+    for pipeline, *stages in runs.values():
+        pipeline.process()
+    for events in zip(*(events(*stages) for pipeline, *stages in runs.values())):
+        for (name, (pipeline, *stages)), event in zip(runs.items(), events):
+            start = time.perf_counter()
+            pipeline.process()
+            latency[name].setdefault(event, []).append(time.perf_counter() - start)
+    for name, times in latency.items():
+        text = ', '.join(f'{e} {np.median(t)*1e3:.2f} ms' for e, t in times.items())
+        print(f'{name} cache (median) : {text}')
+    cache = runs['With'][0].cache
+    print(f'{len(cache)} results, {cache.nbytes / 2**20:.1f} MB, '
+          f'{cache.hits} hits / {cache.misses} misses')
@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+"""
+Signal Processing libraries of functions
+Convolution (direct, FFT or overlap-add), chosen by a calibrated cost model
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import time
+import numpy as np
+
+from ._lazy import lazy_import
+from .spectral import WORKERS
+
+fft = lazy_import('scipy.fft')
+
+
+CONVOLUTION_METHODS = ['direct', 'fft', 'overlap-add']
+
+
+def _transform(x, nfft, workers, axis=-1):
+    """ FFT of real (rfft) or complex (fft) data """
+    if np.iscomplexobj(x):
+        return fft.fft(x, nfft, axis=axis, workers=workers)
+    return fft.rfft(x, nfft, axis=axis, workers=workers)
+
+
+def _inverse(X, nfft, real, workers, axis=-1):
+    """ Inverse of _transform """
+    if real:
+        return fft.irfft(X, nfft, axis=axis, workers=workers)
+    return fft.ifft(X, nfft, axis=axis, workers=workers)
+
+
+def convolve_direct(x, h):
+    """
+    Full convolution of two vectors, by the direct sum (numpy.convolve).
+    Cost in N.M operations.
+    """
+    return np.convolve(x, h)
+
+
+def convolve_fft(x, h, workers=None):
+    """
+    Full convolution of two vectors, by the product of their FFT.
+    Cost in L.log(L) operations, with L = N + M - 1.
+    """
+    if workers is None:
+        workers = WORKERS
+    length = len(x) + len(h) - 1
+    nfft = fft.next_fast_len(length, True)
+    real = not (np.iscomplexobj(x) or np.iscomplexobj(h))
+    X = _transform(x if real else x.astype(complex), nfft, workers)
+    X *= _transform(h if real else h.astype(complex), nfft, workers)
+    return _inverse(X, nfft, real, workers)[:length]
+
+
+def get_overlap_add_size(M):
+    """
+    Returns the FFT size minimizing the cost per output sample
+    of the overlap-add convolution with a kernel of M samples
+
+    Parameters
+    ----------
+    M : integer
+        number of samples of the kernel.
+
+    Returns
+    -------
+    nfft : integer
+        size of the FFT (power of 2). Each block has nfft - M + 1 samples.
+
+    """
+    # From 2M (blocks of at least M samples) : up to 2**20, and at least
+    # 4 sizes for the long kernels
+    first = max(int(np.ceil(np.log2(2*M))), 6)
+    sizes = 2**np.arange(first, max(first + 4, 21))
+    cost = sizes * np.log2(sizes) / (sizes - M + 1)
+    return int(sizes[np.argmin(cost)])
+
+
+def convolve_overlap_add(x, h, nfft=None, workers=None):
+    """
+    Full convolution of a long vector x by a short kernel h, by the
+    overlap-add method. x is cut in blocks transformed together in one
+    2D FFT. Cost in N.log(M) operations.
+
+    Parameters
+    ----------
+    x : 1-dimension vector - double or complex
+        signal vector.
+    h : 1-dimension vector - double or complex
+        kernel.
+    nfft : integer, optional
+        size of the FFT, at least 2.M - 2 (the tail of a block only
+        overlaps the next one). The default is get_overlap_add_size(len(h)).
+    workers : integer, optional
+        number of threads. The default is WORKERS.
+
+    Returns
+    -------
+    y : 1-dimension vector - double or complex
+        full convolution (N + M - 1 samples).
+
+    """
+    if workers is None:
+        workers = WORKERS
+    N = len(x)
+    M = len(h)
+    if nfft is None:
+        nfft = get_overlap_add_size(M)
+    block = nfft - M + 1
+    if block < M - 1:
+        raise ValueError(f'nfft must be at least {2*M - 2} for a kernel of {M} samples')
+    nb_blocks = -(-N // block)
+    real = not (np.iscomplexobj(x) or np.iscomplexobj(h))
+    dtype = float if real else complex
+    blocks = np.zeros((nb_blocks, block), dtype=dtype)
+    blocks.flat[:N] = x
+    Y = _transform(blocks, nfft, workers)
+    Y *= _transform(h.astype(dtype), nfft, workers)
+    y_blocks = _inverse(Y, nfft, real, workers)
+    # Sum of the tails of each block with the beginning of the next one
+    y = np.zeros((nb_blocks + 1) * block + M, dtype=dtype)
+    y[:nb_blocks*block].reshape(nb_blocks, block)[:] = y_blocks[:, :block]
+    tails = y[block:(nb_blocks+1)*block].reshape(nb_blocks, block)
+    tails[:, :M-1] += y_blocks[:, block:]
+    return y[:N + M - 1]
+
+
+class ConvolutionCostModel:
+    """
+    Cost model of the convolution methods, calibrated on the current
+    machine by a micro-benchmark.
+
+    Each method is modelled by t = a + b.w, where w is its number of
+    operations : N.M (direct), L.log2(L) (fft) or
+    blocks.nfft.log2(nfft) (overlap-add).
+    """
+
+    def __init__(self, calibrate=True):
+        """
+        Parameters
+        ----------
+        calibrate : boolean, optional
+            if True, the micro-benchmark is run. The default is True.
+
+        """
+        # Default coefficients (a in s, b in s/operation)
+        self.coefficients = {'direct': (2e-6, 1e-9), 'fft': (2e-5, 5e-9),
+                             'overlap-add': (4e-5, 5e-9)}
+        if calibrate:
+            self.calibrate()
+
+    @staticmethod
+    def get_work(method, N, M):
+        """
+        Returns the number of operations of a method for sizes (N, M)
+        """
+        if method == 'direct':
+            return N * M
+        if method == 'fft':
+            L = fft.next_fast_len(N + M - 1, True)
+            return L * np.log2(L)
+        nfft = get_overlap_add_size(M)
+        return -(-N // (nfft - M + 1)) * nfft * np.log2(nfft)
+
+    def calibrate(self, repeat=5):
+        """
+        Measures the time of each method on a few sizes and fits
+        the coefficients of the model
+
+        Parameters
+        ----------
+        repeat : integer, optional
+            number of runs of each measurement (the best is kept).
+            The default is 5.
+
+        """
+        rng = np.random.default_rng(0)
+        sizes = [(256, 4), (1000, 16), (4000, 64), (16000, 256), (64000, 32)]
+        functions = {'direct': convolve_direct, 'fft': convolve_fft,
+                     'overlap-add': convolve_overlap_add}
+        for method, function in functions.items():
+            work = []
+            times = []
+            for N, M in sizes:
+                x = rng.standard_normal(N)
+                h = rng.standard_normal(M)
+                function(x, h)
+                best = np.inf
+                for k in range(repeat):
+                    start = time.perf_counter()
+                    function(x, h)
+                    best = min(best, time.perf_counter() - start)
+                work.append(self.get_work(method, N, M))
+                times.append(best)
+            # Least squares on the relative error, for small and large sizes
+            times = np.array(times)
+            A = np.stack((np.ones(len(work)), work), axis=1) / times[:, np.newaxis]
+            a, b = np.linalg.lstsq(A, np.ones(len(times)), rcond=None)[0]
+            self.coefficients[method] = (max(a, 0), max(b, 1e-12))
+
+    def get_cost(self, method, N, M):
+        """
+        Returns the predicted time of a method, in seconds
+        """
+        a, b = self.coefficients[method]
+        return a + b * self.get_work(method, N, M)
+
+    def choose_method(self, N, M):
+        """
+        Returns the fastest method for sizes (N, M)
+        """
+        if M > N:
+            N, M = M, N
+        costs = [self.get_cost(method, N, M) for method in CONVOLUTION_METHODS]
+        return CONVOLUTION_METHODS[int(np.argmin(costs))]
+
+
+_cost_model = None
+
+
+def get_cost_model():
+    """
+    Returns the cost model of the current machine
+    (calibrated at the first call)
+    """
+    global _cost_model
+    if _cost_model is None:
+        _cost_model = ConvolutionCostModel()
+    return _cost_model
+
+
+def convolve(x, h, method='auto', workers=None):
+    """
+    Full convolution of two vectors
+
+    Parameters
+    ----------
+    x : 1-dimension vector - double or complex
+        signal vector.
+    h : 1-dimension vector - double or complex
+        kernel.
+    method : string, optional
+        'direct', 'fft', 'overlap-add' or 'auto' : the fastest method
+        predicted by the cost model. The default is 'auto'.
+    workers : integer, optional
+        number of threads. The default is WORKERS.
+
+    Returns
+    -------
+    y : 1-dimension vector - double or complex
+        full convolution (N + M - 1 samples).
+
+    """
+    x = np.asarray(x)
+    h = np.asarray(h)
+    if len(h) > len(x):
+        x, h = h, x
+    if method == 'auto':
+        method = get_cost_model().choose_method(len(x), len(h))
+    if method == 'direct':
+        return convolve_direct(x, h)
+    if method == 'fft':
+        return convolve_fft(x, h, workers)
+    if method == 'overlap-add':
+        return convolve_overlap_add(x, h, workers=workers)
+    raise ValueError(f'Unknown convolution method : {method}')
+
+
+def benchmark_convolution(x, h, repeat=5):
+    """
+    Measures the time of each convolution method
+
+    Parameters
+    ----------
+    x : 1-dimension vector - double or complex
+        signal vector.
+    h : 1-dimension vector - double or complex
+        kernel.
+    repeat : integer, optional
+        number of runs of each method (the best is kept). The default is 5.
+
+    Returns
+    -------
+    times : dictionary
+        measured time (s) of each method.
+
+    """
+    times = {}
+    for method in CONVOLUTION_METHODS:
+        best = np.inf
+        for k in range(repeat):
+            start = time.perf_counter()
+            convolve(x, h, method)
+            best = min(best, time.perf_counter() - start)
+        times[method] = best
+    return times
+
+
+if __name__ == '__main__':
+    rng = np.random.default_rng(1)
+    model = get_cost_model()
+    print(f'{"N":>8} {"M":>6} ' + ' '.join(f'{m:>12}' for m in CONVOLUTION_METHODS)
+          + '   predicted')
+    for N, M in [(1000, 5), (1000, 200), (100000, 31), (100000, 2001),
+                 (100000, 50000)]:
+        x = rng.standard_normal(N)
+        h = rng.standard_normal(M)
+        reference = convolve_direct(x, h)
+        for method in CONVOLUTION_METHODS:
+            assert np.allclose(convolve(x, h, method), reference)
+        times = benchmark_convolution(x, h, 3)
+        print(f'{N:>8} {M:>6} ' + ' '.join(f'{times[m]*1e3:>9.3f} ms'
+                                          for m in CONVOLUTION_METHODS)
+              + f'   {model.choose_method(N, M)}')
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+Signal Processing libraries of functions
+IQ demodulation (complex mixing, FIR low-pass filter and decimation)
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import numpy as np
+
+from ._lazy import lazy_import
+from .spectral import WORKERS
+from .stft import iterate_blocks
+
+fft = lazy_import('scipy.fft')
+scipy_signal = lazy_import('scipy.signal')
+
+
+def design_lowpass(cutoff, Fe, numtaps=101, window='hamming'):
+    """
+    Designs a linear phase low-pass FIR filter (window method)
+
+    Parameters
+    ----------
+    cutoff : double
+        cutoff frequency in Hz.
+    Fe : double
+        sampling frequency.
+    numtaps : integer, optional
+        number of coefficients of the filter. The default is 101.
+    window : string or tuple, optional
+        type of window. The default is 'hamming'.
+
+    Returns
+    -------
+    h : 1-dimension vector - double
+        coefficients of the filter, with a gain of 1 at 0 Hz.
+
+    """
+    return scipy_signal.firwin(numtaps, cutoff, window=window, fs=Fe)
+
+
+class IQDemodulator:
+    """
+    IQ demodulator of a signal given by blocks of any size.
+
+    Each block is mixed with exp(-j.(2.pi.fc.t + phase)), filtered by a
+    low-pass FIR filter and decimated. The filter is split into its
+    polyphase components : only the kept samples are computed, at the
+    decimated rate, by overlap-save FFT convolution. The end of each
+    block and the phase of the local oscillator are kept for the next
+    one, so the output is continuous across blocks.
+    """
+
+    def __init__(self, carrier, Fe, cutoff=None, decimation=1, numtaps=101,
+                 phase=0.0, workers=None):
+        """
+        Parameters
+        ----------
+        carrier : double
+            frequency of the carrier in Hz.
+        Fe : double
+            sampling frequency.
+        cutoff : double, optional
+            cutoff frequency of the low-pass filter.
+            The default is carrier/2.
+        decimation : integer, optional
+            decimation factor of the output. The default is 1.
+        numtaps : integer, optional
+            number of coefficients of the filter. The default is 101.
+        phase : double, optional
+            phase of the carrier (rad) : -pi/2 for a sine carrier.
+            The default is 0.0.
+        workers : integer, optional
+            number of threads. The default is WORKERS.
+
+        """
+        self.carrier = carrier
+        self.Fe = Fe
+        self.cutoff = carrier / 2 if cutoff is None else cutoff
+        self.decimation = decimation
+        self.numtaps = numtaps
+        self.phase = phase
+        self.workers = WORKERS if workers is None else workers
+        # Polyphase components of the filter (decimation, taps per phase)
+        h = design_lowpass(self.cutoff, Fe, numtaps)
+        self.taps = -(-numtaps // decimation)
+        h = np.concatenate((h, np.zeros(self.taps * decimation - numtaps)))
+        self.polyphase = h.reshape(self.taps, decimation).T
+        self.spectra = {}
+        self.reset()
+
+    def reset(self):
+        """
+        Clears the state of the demodulator
+        """
+        self.buffer = np.zeros(self.taps * self.decimation - 1, dtype=complex)
+        self.oscillator_phase = self.phase
+        self.outputs = 0
+
+    def get_delay(self):
+        """
+        Returns the delay of the filter in seconds
+        """
+        return (self.numtaps - 1) / 2 / self.Fe
+
+    def _get_polyphase_spectra(self, nfft):
+        """
+        Returns the FFT of the polyphase components, cached by FFT size
+        """
+        if nfft not in self.spectra:
+            self.spectra[nfft] = fft.fft(self.polyphase, nfft, axis=-1)
+        return self.spectra[nfft]
+
+    def process(self, block):
+        """
+        Demodulates the next block of the signal
+
+        Parameters
+        ----------
+        block : 1-dimension vector - double
+            next samples of the modulated signal.
+
+        Returns
+        -------
+        iq : 1-dimension vector - complex
+            next samples of the complex envelope (I + j.Q), at the
+            sampling frequency Fe/decimation.
+
+        """
+        M = self.decimation
+        omega = 2 * np.pi * self.carrier / self.Fe
+        n = np.arange(len(block))
+        mixed = block * np.exp(-1j * (omega * n + self.oscillator_phase))
+        self.oscillator_phase = np.mod(self.oscillator_phase
+                                       + omega * len(block), 2 * np.pi)
+        buffer = np.concatenate((self.buffer, mixed))
+        Q = self.taps
+        J = (len(buffer) - Q * M) // M + 1
+        if J <= 0:
+            self.buffer = buffer
+            return np.zeros(0, dtype=complex)
+        # Phase p of the input : u[p, i] = buffer[i.M + M-1-p]
+        length = J + Q - 1
+        u = buffer[:length * M].reshape(length, M)[:, ::-1].T
+        nfft = fft.next_fast_len(length)
+        U = fft.fft(u, nfft, axis=-1, workers=self.workers)
+        U *= self._get_polyphase_spectra(nfft)
+        y = fft.ifft(np.sum(U, axis=0), workers=self.workers)
+        self.buffer = buffer[J * M:]
+        self.outputs += J
+        # Mixing gives half of the envelope
+        return 2 * y[Q-1:Q-1+J]
+
+    def get_time(self, nb_outputs):
+        """
+        Returns the time vector of the last nb_outputs samples,
+        corrected from the delay of the filter
+        """
+        m = np.arange(self.outputs - nb_outputs, self.outputs)
+        return m * self.decimation / self.Fe - self.get_delay()
+
+
+def demodulate_iq(signal, carrier, Fe, cutoff=None, decimation=1,
+                  numtaps=101, phase=0.0, block_size=2**16):
+    """
+    IQ demodulation of a signal from
+    {signal vector or iterable of blocks, carrier, sampling frequency}
+
+    Parameters
+    ----------
+    signal : 1-dimension vector or iterable of vectors - double
+        signal vector (can be a numpy.memmap) or blocks of the signal.
+    carrier : double
+        frequency of the carrier in Hz.
+    Fe : double
+        sampling frequency.
+    cutoff, decimation, numtaps, phase : see IQDemodulator.
+    block_size : integer, optional
+        number of samples processed at once, for signal vectors.
+        The default is 2**16.
+
+    Returns
+    -------
+    time : 1-dimension vector - double
+        time vector, corrected from the delay of the filter.
+    iq : 1-dimension vector - complex
+        complex envelope (I + j.Q), at the sampling frequency Fe/decimation.
+
+    """
+    demodulator = IQDemodulator(carrier, Fe, cutoff, decimation, numtaps, phase)
+    if isinstance(signal, np.ndarray):
+        signal = iterate_blocks(signal, block_size)
+    iq = np.concatenate([demodulator.process(block) for block in signal])
+    return demodulator.get_time(len(iq)), iq
+
+
+if __name__ == '__main__':
+    Fe = 10000
+    t = np.arange(5*Fe) / Fe
+    message = 1 + 0.5*np.sin(2*np.pi*5*t)
+    signal = message * np.cos(2*np.pi*1000*t + 0.3)
+    time, iq = demodulate_iq(signal, 1000, Fe, 100, 10, block_size=3001)
+    reference = 1 + 0.5*np.sin(2*np.pi*5*time)
+    steady = time > 0.1
+    print(f'Envelope error : {np.max(np.abs(np.abs(iq) - reference)[steady]):.2e}')
+    print(f'Phase : {np.mean(np.angle(iq[steady])):.3f} rad (expected 0.3)')
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+Signal Processing libraries of functions
+Min/max envelope decimation of long signals, for display
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import numpy as np
+
+
+def _reduce(mins, maxs, factor):
+    """
+    Min and max of groups of {factor} values (the last group is padded
+    with its last value)
+    """
+    pad = -len(mins) % factor
+    if pad:
+        mins = np.concatenate((mins, np.full(pad, mins[-1])))
+        maxs = np.concatenate((maxs, np.full(pad, maxs[-1])))
+    mins = mins.reshape(-1, factor)
+    maxs = maxs.reshape(-1, factor)
+    if factor > 16:
+        return mins.min(axis=1), maxs.max(axis=1)
+    # Column by column : faster than min(axis=1) on short rows
+    low = mins[:, 0].copy()
+    high = maxs[:, 0].copy()
+    for k in range(1, factor):
+        np.minimum(low, mins[:, k], out=low)
+        np.maximum(high, maxs[:, k], out=high)
+    return low, high
+
+
+class EnvelopePyramid:
+    """
+    Multi-resolution min/max envelope of a signal, for display.
+
+    Level k gives the min and the max of the signal over bins of
+    factor^k samples. The levels are computed once. For a view range
+    and a number of pixels, the coarsest level with at least one bin per
+    pixel is used : zooming and panning only touch O(pixels) values.
+    """
+
+    def __init__(self, x, y, factor=4, min_size=1024):
+        """
+        Parameters
+        ----------
+        x : 1-dimension vector - double
+            abscissa of the samples (increasing).
+        y : 1-dimension vector - double
+            values of the samples.
+        factor : integer, optional
+            size ratio between two levels. The default is 4.
+        min_size : integer, optional
+            number of bins of the coarsest level. The default is 1024.
+
+        """
+        self.x = np.asarray(x)
+        self.y = np.asarray(y)
+        self.factor = factor
+        # (bin size, mins, maxs) of each level, from the finest
+        self.levels = [(1, self.y, self.y)]
+        mins = maxs = self.y
+        size = 1
+        while len(mins) >= factor * min_size:
+            mins, maxs = _reduce(mins, maxs, factor)
+            size *= factor
+            self.levels.append((size, mins, maxs))
+
+    def get_envelope(self, x_min, x_max, pixels):
+        """
+        Returns the envelope of the signal on a view range
+
+        Parameters
+        ----------
+        x_min : double
+            first abscissa of the view.
+        x_max : double
+            last abscissa of the view.
+        pixels : integer
+            width of the view in pixels.
+
+        Returns
+        -------
+        x : 1-dimension vector - double
+            abscissa of the points to draw.
+        y : 1-dimension vector - double
+            points to draw : min and max of each pixel, interleaved, or
+            the samples themselves when there are less than 2 per pixel.
+
+        """
+        N = len(self.x)
+        start = max(np.searchsorted(self.x, x_min) - 1, 0)
+        stop = min(np.searchsorted(self.x, x_max, 'right') + 1, N)
+        samples = stop - start
+        if samples <= 2 * pixels:
+            return self.x[start:stop], self.y[start:stop]
+        # Coarsest level with at least one bin per pixel
+        for size, mins, maxs in reversed(self.levels):
+            if size * pixels <= samples:
+                break
+        first = start // size
+        last = -(-stop // size)
+        group = max((last - first) // pixels, 1)
+        mins, maxs = _reduce(mins[first:last], maxs[first:last], group)
+        index = np.minimum((first + group * np.arange(len(mins))) * size, N - 1)
+        x = np.repeat(self.x[index], 2)
+        y = np.empty(2 * len(mins), dtype=self.y.dtype)
+        y[0::2] = mins
+        y[1::2] = maxs
+        # Keep the last sample, so the curve ends at the end of the signal
+        return np.append(x, self.x[stop-1]), np.append(y, self.y[stop-1])
+
+
+def decimate_minmax(x, y, pixels, x_min=None, x_max=None):
+    """
+    Reduces a signal to its min/max envelope, with one min and one max
+    per pixel (single view, without pyramid)
+
+    Parameters
+    ----------
+    x : 1-dimension vector - double
+        abscissa of the samples (increasing).
+    y : 1-dimension vector - double
+        values of the samples.
+    pixels : integer
+        width of the view in pixels.
+    x_min, x_max : double, optional
+        view range. The default is the whole signal.
+
+    Returns
+    -------
+    x, y : 1-dimension vector - double
+        points to draw (see EnvelopePyramid.get_envelope).
+
+    """
+    x_min = x[0] if x_min is None else x_min
+    x_max = x[-1] if x_max is None else x_max
+    return EnvelopePyramid(x, y, min_size=len(x)).get_envelope(x_min, x_max, pixels)
+
+
+if __name__ == '__main__':
+    import time
+    N = 10**7
+    x = np.arange(N) / 1e4
+    y = np.sin(2*np.pi*x) + np.random.normal(0, 0.1, N)
+    start = time.perf_counter()
+    pyramid = EnvelopePyramid(x, y)
+    print(f'Pyramid : {(time.perf_counter()-start)*1e3:.1f} ms, '
+          f'{len(pyramid.levels)} levels')
+    for x_min, x_max in [(0, 1000), (100, 200), (150, 150.1)]:
+        start = time.perf_counter()
+        xe, ye = pyramid.get_envelope(x_min, x_max, 1000)
+        duration = time.perf_counter() - start
+        view = (x >= x_min) & (x <= x_max)
+        print(f'View [{x_min}, {x_max}] : {len(xe)} points in {duration*1e3:.2f} ms, '
+              f'max {ye.max():.3f} (data {y[view].max():.3f})')
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+Signal Processing libraries of functions
+Noise generation by blocks (white, pink, brown or user-defined PSD)
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+from ._lazy import lazy_import
+
+fft = lazy_import('scipy.fft')
+
+
+# Shape of the PSD of each color of noise
+NOISE_COLORS = {
+    'pink': lambda f: 1 / f,
+    'brown': lambda f: 1 / f**2,
+}
+
+
+def get_noise_filter(psd, Fe, length):
+    """
+    Designs a FIR filter whose power response follows a PSD shape.
+    White noise filtered by it has the required PSD.
+
+    Parameters
+    ----------
+    psd : function
+        shape of the PSD, function of the frequency in Hz.
+    Fe : double
+        sampling frequency.
+    length : integer
+        number of coefficients of the filter (even).
+
+    Returns
+    -------
+    h : 1-dimension vector - double
+        coefficients of the filter, normalized to a power gain of 1.
+
+    """
+    freq = fft.rfftfreq(length, 1/Fe)
+    shape = np.zeros(len(freq))
+    # The PSD is kept constant below the first frequency bin
+    shape[1:] = psd(freq[1:])
+    shape[0] = shape[1]
+    h = fft.irfft(np.sqrt(shape), length)
+    h = np.roll(h, length // 2) * np.hanning(length)
+    return h / np.sqrt(np.sum(h**2))
+
+
+class NoiseGenerator:
+    """
+    Generator of noise by blocks of fixed size.
+
+    The noise is based on numpy.random.Generator and is reproducible from
+    its seed. Colored noise is obtained by filtering a white gaussian noise
+    with the overlap-save method : the last samples of a block are kept
+    for the next one, so the noise is continuous across blocks.
+    """
+
+    def __init__(self, color='gaussian', std=1.0, Fe=1.0, block_size=2**16,
+                 seed=None, filter_size=4096):
+        """
+        Parameters
+        ----------
+        color : string or function, optional
+            'gaussian' (white), 'uniform' (white), 'pink' (1/f),
+            'brown' (1/f^2) or a function giving the shape of the PSD
+            from the frequency in Hz. The default is 'gaussian'.
+        std : double, optional
+            standard deviation of the noise. The default is 1.0.
+        Fe : double, optional
+            sampling frequency. The default is 1.0.
+        block_size : integer, optional
+            number of samples of each block. The default is 2**16.
+        seed : integer or numpy.random.SeedSequence, optional
+            seed of the generator. The default is None (random seed).
+        filter_size : integer, optional
+            number of coefficients of the shaping filter. The PSD follows
+            the required shape down to Fe/filter_size. The default is 4096.
+
+        """
+        self.rng = np.random.default_rng(seed)
+        self.color = color
+        self.std = std
+        self.block_size = block_size
+        self.H = None
+        if callable(color) or color in NOISE_COLORS:
+            psd = color if callable(color) else NOISE_COLORS[color]
+            h = get_noise_filter(psd, Fe, filter_size)
+            self.nfft = fft.next_fast_len(block_size + filter_size - 1, True)
+            self.H = fft.rfft(h, self.nfft) * std
+            # Filter memory, filled with noise to start in steady state
+            self.history = self.rng.standard_normal(filter_size - 1)
+        elif color not in ('gaussian', 'uniform'):
+            raise ValueError(f'Unknown noise color : {color}')
+
+    def next_block(self, out=None):
+        """
+        Generates the next block of noise
+
+        Parameters
+        ----------
+        out : 1-dimension vector - double, optional
+            preallocated output array of block_size samples.
+
+        Returns
+        -------
+        block : 1-dimension vector - double
+            next block_size samples of the noise.
+
+        """
+        if out is None:
+            out = np.empty(self.block_size)
+        if self.color == 'gaussian':
+            self.rng.standard_normal(out=out)
+            out *= self.std
+        elif self.color == 'uniform':
+            self.rng.random(out=out)
+            # Uniform noise between -a/2 and a/2 has a std of a/sqrt(12)
+            out -= 0.5
+            out *= self.std * np.sqrt(12)
+        else:
+            white = np.concatenate((self.history,
+                                    self.rng.standard_normal(self.block_size)))
+            filtered = fft.irfft(fft.rfft(white, self.nfft) * self.H, self.nfft)
+            memory = len(self.history)
+            out[:] = filtered[memory:memory+self.block_size]
+            self.history = white[-memory:]
+        return out
+
+    def blocks(self, nb_samples=None):
+        """
+        Generates blocks of noise
+
+        Parameters
+        ----------
+        nb_samples : integer, optional
+            total number of samples. The default is None (endless).
+
+        Yields
+        ------
+        block : 1-dimension vector - double
+            next block of the noise (the last one can be shorter).
+
+        """
+        generated = 0
+        while nb_samples is None or generated < nb_samples:
+            block = self.next_block()
+            if nb_samples is not None and generated + len(block) > nb_samples:
+                block = block[:nb_samples - generated]
+            generated += len(block)
+            yield block
+
+
+def generate_noise_streams(nb_streams, nb_samples=None, color='gaussian',
+                           std=1.0, Fe=1.0, block_size=2**16, seed=None,
+                           max_workers=None):
+    """
+    Generates several independent streams of noise, by blocks.
+    The blocks of each stream are generated in parallel threads.
+
+    Parameters
+    ----------
+    nb_streams : integer
+        number of independent streams.
+    nb_samples : integer, optional
+        number of samples of each stream. The default is None (endless).
+    color : string or function, optional
+        color of the noise (see NoiseGenerator). The default is 'gaussian'.
+    std : double, optional
+        standard deviation of the noise. The default is 1.0.
+    Fe : double, optional
+        sampling frequency. The default is 1.0.
+    block_size : integer, optional
+        number of samples of each block. The default is 2**16.
+    seed : integer, optional
+        seed of the streams. Each stream gets its own seed, spawned from
+        this one, so the streams are reproducible. The default is None.
+    max_workers : integer, optional
+        number of threads. The default is None (one per CPU core).
+
+    Yields
+    ------
+    blocks : 2-dimension array - double
+        next block of each stream (nb_streams, block_size).
+        The array is overwritten by the next block.
+
+    """
+    seeds = np.random.SeedSequence(seed).spawn(nb_streams)
+    generators = [NoiseGenerator(color, std, Fe, block_size, s) for s in seeds]
+    blocks = np.empty((nb_streams, block_size))
+    generated = 0
+    with ThreadPoolExecutor(max_workers) as executor:
+        while nb_samples is None or generated < nb_samples:
+            list(executor.map(lambda k: generators[k].next_block(blocks[k]),
+                              range(nb_streams)))
+            size = block_size
+            if nb_samples is not None:
+                size = min(block_size, nb_samples - generated)
+            generated += size
+            yield blocks[:, :size]
+
+
+if __name__ == '__main__':
+    from scipy.signal import welch
+    for color in ['gaussian', 'uniform', 'pink', 'brown']:
+        generator = NoiseGenerator(color, Fe=1e4, seed=0)
+        noise = np.concatenate(list(generator.blocks(2**20)))
+        f, psd = welch(noise, 1e4, nperseg=4096)
+        slope = np.polyfit(np.log10(f[10:1000]), np.log10(psd[10:1000]), 1)[0]
+        print(f'{color} : std = {np.std(noise):.3f}, PSD slope = {slope:.2f}')
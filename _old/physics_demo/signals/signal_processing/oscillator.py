@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+Signal Processing libraries of functions
+Bank of phase-continuous oscillators, generated by blocks
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import numpy as np
+
+
+class OscillatorBank:
+    """
+    Bank of sine oscillators generated by blocks of samples.
+
+    All the tones of a block are computed at once as a 2D array
+    (tones, samples). The phase of each oscillator is kept between blocks,
+    so the signals are continuous, even when the frequencies change.
+    Amplitude and frequency modulations can be applied to each block.
+    """
+
+    def __init__(self, frequencies, Fe, amplitudes=1.0, phases=0.0,
+                 block_size=1024):
+        """
+        Parameters
+        ----------
+        frequencies : 1-dimension vector - double
+            frequency of each oscillator.
+        Fe : double
+            sampling frequency.
+        amplitudes : double or 1-dimension vector - double, optional
+            amplitude of each oscillator. The default is 1.0.
+        phases : double or 1-dimension vector - double, optional
+            initial phase of each oscillator (rad). The default is 0.0.
+        block_size : integer, optional
+            number of samples of each block. The default is 1024.
+
+        """
+        self.Fe = Fe
+        self.block_size = block_size
+        self.frequencies = np.atleast_1d(np.asarray(frequencies, dtype=float))
+        self.nb_tones = len(self.frequencies)
+        self.amplitudes = np.broadcast_to(np.asarray(amplitudes, dtype=float),
+                                          (self.nb_tones,)).copy()
+        self.initial_phases = np.broadcast_to(np.asarray(phases, dtype=float),
+                                              (self.nb_tones,)).copy()
+        self.phases = self.initial_phases.copy()
+        self.samples = 0
+        self._allocate()
+
+    def _allocate(self):
+        """
+        Allocates the work arrays for one block
+        """
+        self.index = np.arange(self.block_size, dtype=float)
+        self.phase_block = np.empty((self.nb_tones, self.block_size))
+
+    def reset(self):
+        """
+        Restarts the oscillators from their initial phases
+        """
+        self.phases[:] = self.initial_phases
+        self.samples = 0
+
+    def set_frequencies(self, frequencies):
+        """
+        Changes the frequencies, keeping the phases continuous.
+        The number of oscillators must not change.
+        """
+        self.frequencies[:] = frequencies
+
+    def set_amplitudes(self, amplitudes):
+        """
+        Changes the amplitudes of the oscillators.
+        """
+        self.amplitudes[:] = amplitudes
+
+    def set_sampling_freq(self, Fe):
+        """
+        Changes the sampling frequency.
+        """
+        self.Fe = Fe
+
+    def set_block_size(self, block_size):
+        """
+        Changes the number of samples of each block.
+        """
+        if block_size != self.block_size:
+            self.block_size = block_size
+            self._allocate()
+
+    def get_time(self, out=None):
+        """
+        Returns the time vector of the last generated block
+        """
+        if out is None:
+            out = np.empty(self.block_size)
+        np.add(self.index, self.samples - self.block_size, out=out)
+        out /= self.Fe
+        return out
+
+    def next_block(self, out=None, am=None, fm=None):
+        """
+        Generates the next block of each oscillator
+
+        Parameters
+        ----------
+        out : 2-dimension array - double, optional
+            preallocated output array (tones, block_size).
+        am : 1 or 2-dimension array - double, optional
+            amplitude modulation : each sample is multiplied by am.
+            Shape (block_size) or (tones, block_size).
+        fm : 1 or 2-dimension array - double, optional
+            frequency modulation : deviation of the instantaneous
+            frequency, in Hz. Shape (block_size) or (tones, block_size).
+
+        Returns
+        -------
+        block : 2-dimension array - double
+            next samples of each oscillator (tones, block_size).
+
+        """
+        if out is None:
+            out = np.empty((self.nb_tones, self.block_size))
+        phase = self.phase_block
+        omega = 2 * np.pi * self.frequencies / self.Fe
+        if fm is None:
+            np.multiply.outer(omega, self.index, out=phase)
+            phase += self.phases[:, np.newaxis]
+            self.phases += omega * self.block_size
+        else:
+            # Phase increment of each sample, accumulated over the block
+            np.add(self.frequencies[:, np.newaxis], fm, out=phase)
+            phase *= 2 * np.pi / self.Fe
+            total = np.sum(phase, axis=1)
+            phase[:, 1:] = np.cumsum(phase[:, :-1], axis=1)
+            phase[:, 0] = 0
+            phase += self.phases[:, np.newaxis]
+            self.phases += total
+        np.mod(self.phases, 2 * np.pi, out=self.phases)
+        np.sin(phase, out=out)
+        out *= self.amplitudes[:, np.newaxis]
+        if am is not None:
+            out *= am
+        self.samples += self.block_size
+        return out
+
+    def skip_block(self):
+        """
+        Advances the oscillators by one block, without generating it
+        """
+        self.phases += 2 * np.pi * self.frequencies / self.Fe * self.block_size
+        np.mod(self.phases, 2 * np.pi, out=self.phases)
+        self.samples += self.block_size
+
+    def next_sum(self, out=None, am=None, fm=None):
+        """
+        Generates the next block of the sum of the oscillators
+
+        Parameters
+        ----------
+        out : 1-dimension vector - double, optional
+            preallocated output array (block_size).
+        am, fm : see next_block.
+
+        Returns
+        -------
+        signal : 1-dimension vector - double
+            next samples of the sum of the oscillators.
+
+        """
+        block = self.next_block(self.phase_block, am, fm)
+        return np.sum(block, axis=0, out=out)
+
+
+def generate_sinus_block(frequencies, Fe, nb_samples, amplitudes=1.0, out=None):
+    """
+    Generates a sum of Sine Waveforms from
+    {frequencies, sampling frequency, number of samples}
+    without any time vector (see OscillatorBank).
+
+    Parameters
+    ----------
+    frequencies : 1-dimension vector - double
+        frequency of each sine.
+    Fe : double
+        sampling frequency.
+    nb_samples : integer
+        number of samples.
+    amplitudes : double or 1-dimension vector - double, optional
+        amplitude of each sine. The default is 1.0.
+    out : 1-dimension vector - double, optional
+        preallocated output array (nb_samples).
+
+    Returns
+    -------
+    signal : 1-dimension vector - double
+        signal vector.
+
+    """
+    bank = OscillatorBank(frequencies, Fe, amplitudes, block_size=nb_samples)
+    return bank.next_sum(out)
+
+
+if __name__ == '__main__':
+    Fe = 10000
+    bank = OscillatorBank([100, 250, 1000], Fe, block_size=1000)
+    blocks = [bank.next_block().copy() for k in range(10)]
+    t = np.arange(10000) / Fe
+    reference = np.sin(2 * np.pi * np.outer([100, 250, 1000], t))
+    print(np.max(np.abs(np.concatenate(blocks, axis=1) - reference)))
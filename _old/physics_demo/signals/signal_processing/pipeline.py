@@ -0,0 +1,914 @@
+# -*- coding: utf-8 -*-
+"""
+Signal Processing libraries of functions
+Streaming pipeline : sources, processing stages and sinks joined by
+bounded queues (asyncio), NumPy stages run in a thread pool
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+from ._lazy import lazy_import
+from .oscillator import OscillatorBank
+from .noise import NoiseGenerator
+from .spectral import calculate_spectrum
+from .zoom import band_spectrum
+from .demodulation import IQDemodulator
+from .tracking import GoertzelBank
+from .windows import WINDOW_TYPES, calculate_windowed_spectra
+
+scipy_signal = lazy_import('scipy.signal')
+
+
+_END = object()     # end of the stream, sent through the queues
+
+
+def _hashable(value):
+    """ Parameter of a stage as a key of the cache """
+    if isinstance(value, np.ndarray):
+        return tuple(value.tolist())
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _hashable(v)) for k, v in value.items()))
+    return value
+
+
+class Stage:
+    """
+    Processing stage of a pipeline : function applied to each frame.
+
+    A frame is a dictionary ('time', 'signal', 'Fe'...) going from the
+    source to the sinks : each stage adds or replaces some entries and
+    returns it (None drops the frame). Stages keep their state from one
+    frame to the next (filters, demodulators...).
+
+    The parameters can be changed from another thread by configure : they
+    are applied before the next frame, never during a frame.
+
+    The result of a stage can be cached (see Pipeline.process) when it only
+    depends on its input and on its parameters, listed in cache_params
+    or given by the function cache_key.
+    """
+
+    # Run in the thread pool (NumPy processing), or in the event loop
+    threaded = True
+    # Attributes of the stage its result depends on (key of the cache)
+    cache_params = None
+
+    def __init__(self, function=None, enabled=True, cache_key=None):
+        """
+        Parameters
+        ----------
+        function : function, optional
+            processing of a frame, frame = function(frame).
+            The default is None : process must be redefined.
+        enabled : boolean, optional
+            if False, the frames go through the stage unchanged.
+            The default is True.
+        cache_key : function, optional
+            returns the parameters the result of function depends on.
+            The default is None (result not cached).
+
+        """
+        self.function = function
+        self.enabled = enabled
+        self.cache_key = cache_key
+        self.cache = None
+        self.configured = False     # parameters changed once by configure
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def configure(self, **params):
+        """
+        Changes parameters of the stage (thread-safe),
+        applied before the next frame
+        """
+        with self._lock:
+            self._pending.update(params)
+
+    def update(self):
+        """
+        Applies the parameters given by configure since the last frame
+        """
+        with self._lock:
+            params, self._pending = self._pending, {}
+        if params:
+            self.configured = True
+            self.apply(params)
+
+    def apply(self, params):
+        """
+        Applies new parameters (attributes of the same name),
+        then resets the stage
+        """
+        for name, value in params.items():
+            setattr(self, name, value)
+        self.reset()
+
+    def reset(self):
+        """
+        Clears the state of the stage
+        """
+        pass
+
+    def get_key(self):
+        """
+        Returns the key of the result for the cache
+        (None if the result cannot be cached)
+        """
+        if self.cache_key is not None:
+            return (getattr(self.function, '__name__', None), _hashable(self.cache_key()))
+        if self.cache_params is None:
+            return None
+        return (type(self).__name__,) + tuple(_hashable(getattr(self, name))
+                                              for name in self.cache_params)
+
+    def process(self, frame):
+        return self.function(frame)
+
+    def __call__(self, frame):
+        self.update()
+        if not self.enabled:
+            return frame
+        return self.process(frame)
+
+
+class Source(Stage):
+    """
+    Source of a pipeline : creates the frames (call without frame).
+    Returns None at the end of the stream.
+    """
+
+    def __init__(self, period=None):
+        """
+        Parameters
+        ----------
+        period : double, optional
+            minimal time between two frames in a running pipeline, in
+            seconds. The default is None (as fast as the stages allow).
+
+        """
+        super().__init__()
+        self.period = period
+
+    def __call__(self, frame=None):
+        return super().__call__(frame)
+
+
+class OscillatorSource(Source):
+    """
+    Blocks of sine oscillators, continuous from one frame to the next.
+    Frame : 'time', 'tones' (tones, block_size), 'Fe'.
+    """
+
+    def __init__(self, frequencies, Fe, block_size=1024, amplitudes=1.0, period=None):
+        """
+        Parameters
+        ----------
+        frequencies : 1-dimension vector - double
+            frequency of each oscillator.
+        Fe : double
+            sampling frequency.
+        block_size : integer, optional
+            number of samples of each frame. The default is 1024.
+        amplitudes : double or 1-dimension vector - double, optional
+            amplitude of each oscillator. The default is 1.0.
+        period : double, optional
+            minimal time between two frames (s). The default is None.
+
+        """
+        super().__init__(period)
+        self.oscillators = OscillatorBank(frequencies, Fe, amplitudes,
+                                          block_size=block_size)
+
+    def get_key(self):
+        bank = self.oscillators
+        return ('OscillatorSource', _hashable(bank.frequencies), _hashable(bank.amplitudes),
+                bank.Fe, bank.block_size)
+
+    def apply(self, params):
+        # Frequencies and amplitudes change with continuous phases
+        if 'frequencies' in params:
+            self.oscillators.set_frequencies(params['frequencies'])
+        if 'amplitudes' in params:
+            self.oscillators.set_amplitudes(params['amplitudes'])
+        Fe = params.get('Fe', self.oscillators.Fe)
+        block_size = params.get('block_size', self.oscillators.block_size)
+        if Fe != self.oscillators.Fe or block_size != self.oscillators.block_size:
+            self.oscillators.set_sampling_freq(Fe)
+            self.oscillators.set_block_size(block_size)
+            self.reset()
+
+    def reset(self):
+        self.oscillators.reset()
+
+    def process(self, frame):
+        bank = self.oscillators
+        if self.cache is None or bank.samples != 0:
+            tones = bank.next_block()
+            t = bank.get_time()
+        else:
+            # First block : each tone and the time vector are cached,
+            # a change of one frequency only computes one tone
+            tones = np.empty((bank.nb_tones, bank.block_size))
+            for k, (f, a) in enumerate(zip(bank.frequencies, bank.amplitudes)):
+                tones[k] = self.cache.get_or_compute(('tone', f, a, bank.Fe, bank.block_size),
+                                                     self._first_tone, f, a)
+            bank.skip_block()
+            t = self.cache.get_or_compute(('time', bank.Fe, bank.block_size),
+                                          bank.get_time)
+        return {'time': t, 'tones': tones, 'signal': tones[0], 'Fe': bank.Fe}
+
+    def _first_tone(self, frequency, amplitude):
+        """ First block of one oscillator, from a zero phase """
+        bank = self.oscillators
+        tone = np.multiply(bank.index, 2 * np.pi * frequency / bank.Fe)
+        np.sin(tone, out=tone)
+        tone *= amplitude
+        return tone
+
+
+class NoiseSource(Source):
+    """
+    Blocks of noise (see NoiseGenerator).
+    Frame : 'time', 'signal', 'Fe'.
+    """
+
+    def __init__(self, Fe, block_size=1024, color='gaussian', std=1.0,
+                 seed=None, period=None):
+        """
+        Parameters
+        ----------
+        Fe : double
+            sampling frequency.
+        block_size : integer, optional
+            number of samples of each frame. The default is 1024.
+        color, std, seed : see NoiseGenerator.
+        period : double, optional
+            minimal time between two frames (s). The default is None.
+
+        """
+        super().__init__(period)
+        self.Fe = Fe
+        self.block_size = block_size
+        self.color = color
+        self.std = std
+        self.seed = seed
+        self.reset()
+
+    def reset(self):
+        self.generator = NoiseGenerator(self.color, self.std, self.Fe,
+                                        self.block_size, self.seed)
+        self.samples = 0
+
+    def process(self, frame):
+        signal = self.generator.next_block()
+        t = (self.samples + np.arange(self.block_size)) / self.Fe
+        self.samples += self.block_size
+        return {'time': t, 'signal': signal, 'Fe': self.Fe}
+
+
+class FileSource(Source):
+    """
+    Blocks of a signal read from a file : binary NumPy file (.npy,
+    memory mapped) or text file (one sample per line).
+    Frame : 'time', 'signal', 'Fe'.
+    """
+
+    def __init__(self, filename, Fe, block_size=1024, loop=False, period=None):
+        """
+        Parameters
+        ----------
+        filename : string
+            name of the file.
+        Fe : double
+            sampling frequency.
+        block_size : integer, optional
+            number of samples of each frame. The default is 1024.
+        loop : boolean, optional
+            restart at the beginning of the file at the end.
+            The default is False.
+        period : double, optional
+            minimal time between two frames (s). The default is None.
+
+        """
+        super().__init__(period)
+        if filename.endswith('.npy'):
+            self.data = np.load(filename, mmap_mode='r')
+        else:
+            self.data = np.loadtxt(filename)
+        self.Fe = Fe
+        self.block_size = block_size
+        self.loop = loop
+        self.reset()
+
+    def reset(self):
+        self.position = 0
+        self.samples = 0
+
+    def process(self, frame):
+        if self.position >= len(self.data):
+            if not self.loop or len(self.data) == 0:
+                return None
+            self.position = 0
+        signal = np.array(self.data[self.position:self.position+self.block_size],
+                          dtype=float)
+        t = (self.samples + np.arange(len(signal))) / self.Fe
+        self.position += len(signal)
+        self.samples += len(signal)
+        return {'time': t, 'signal': signal, 'Fe': self.Fe}
+
+
+class MixStage(Stage):
+    """
+    Mixes the tones of a frame into its signal : product (amplitude
+    modulation) or sum of the selected tones.
+    """
+
+    cache_params = ('mode', 'channels')
+
+    def __init__(self, mode='product', channels=None, enabled=True):
+        """
+        Parameters
+        ----------
+        mode : string, optional
+            'product' or 'sum'. The default is 'product'.
+        channels : list of integer, optional
+            index of the tones to mix. The default is None (all).
+        enabled : boolean, optional
+            see Stage. The default is True.
+
+        """
+        super().__init__(enabled=enabled)
+        self.mode = mode
+        self.channels = channels
+
+    def process(self, frame):
+        tones = frame['tones']
+        if self.channels is not None:
+            tones = tones[list(self.channels)]
+        if self.mode == 'product':
+            frame['signal'] = np.prod(tones, axis=0)
+        else:
+            frame['signal'] = np.sum(tones, axis=0)
+        return frame
+
+
+class FilterStage(Stage):
+    """
+    Linear filter (b, a) of the signal, continuous from one frame to the
+    next (scipy.signal.lfilter with its state).
+    """
+
+    cache_params = ('b', 'a')
+
+    def __init__(self, b, a=1.0, enabled=True):
+        """
+        Parameters
+        ----------
+        b, a : 1-dimension vector - double
+            coefficients of the filter (see scipy.signal.lfilter).
+        enabled : boolean, optional
+            see Stage. The default is True.
+
+        """
+        super().__init__(enabled=enabled)
+        self.b = np.atleast_1d(b)
+        self.a = np.atleast_1d(a)
+        self.reset()
+
+    def reset(self):
+        self.zi = np.zeros(max(len(self.a), len(self.b)) - 1)
+
+    def process(self, frame):
+        frame['signal'], self.zi = scipy_signal.lfilter(self.b, self.a, frame['signal'],
+                                                        zi=self.zi)
+        return frame
+
+
+class SpectrumStage(Stage):
+    """
+    Spectrum of a signal of the frame : full FFT (calculate_spectrum) or
+    zoom on a band (band_spectrum), at the resolution of the FFT or finer.
+    Adds frame[output] = (freq, spectrum).
+    """
+
+    cache_params = ('f_min', 'f_max', 'points', 'key', 'output', 'real')
+
+    def __init__(self, f_min=None, f_max=None, points=1000, key='signal',
+                 output='spectrum', real=False, enabled=True):
+        """
+        Parameters
+        ----------
+        f_min, f_max : double, optional
+            band of the zoom. The default is None : full spectrum.
+        points : integer, optional
+            minimum number of frequencies of the zoom (more if the
+            resolution of the FFT requires it). The default is 1000.
+        key : string, optional
+            entry of the frame to transform. The default is 'signal'.
+        output : string, optional
+            entry of the result. The default is 'spectrum'.
+        real : boolean, optional
+            transform the real part of the entry. The default is False.
+        enabled : boolean, optional
+            see Stage. The default is True.
+
+        """
+        super().__init__(enabled=enabled)
+        self.f_min = f_min
+        self.f_max = f_max
+        self.points = points
+        self.key = key
+        self.output = output
+        self.real = real
+
+    def process(self, frame):
+        # Sampling frequency of the entry : frame[key + '_Fe'] or frame['Fe']
+        Fe = frame.get(self.key + '_Fe', frame['Fe'])
+        signal = frame[self.key].real if self.real else frame[self.key]
+        if self.f_min is None:
+            frame[self.output] = calculate_spectrum(signal, Fe, two_sided=True)
+        else:
+            frame[self.output] = band_spectrum(signal, Fe, self.f_min, self.f_max,
+                                               self.points)
+        return frame
+
+
+class DemodulateStage(Stage):
+    """
+    IQ demodulation of the signal (see IQDemodulator), continuous from
+    one frame to the next. Adds 'iq', 'iq_time' and 'iq_Fe'.
+    """
+
+    cache_params = ('carrier', 'Fe', 'kargs')
+
+    def __init__(self, carrier, Fe, enabled=True, **kargs):
+        """
+        Parameters
+        ----------
+        carrier : double
+            frequency of the carrier.
+        Fe : double
+            sampling frequency of the signal.
+        enabled : boolean, optional
+            see Stage. The default is True.
+        **kargs : parameters of IQDemodulator (cutoff, decimation...).
+
+        """
+        super().__init__(enabled=enabled)
+        self.carrier = carrier
+        self.Fe = Fe
+        self.kargs = kargs
+        self.demodulator = IQDemodulator(self.carrier, self.Fe, **self.kargs)
+
+    def apply(self, params):
+        for name in ('carrier', 'Fe', 'enabled'):
+            if name in params:
+                setattr(self, name, params.pop(name))
+        self.kargs.update(params)
+        # New filter only when the demodulation changes
+        if (self.carrier, self.Fe) != (self.demodulator.carrier, self.demodulator.Fe) or params:
+            self.demodulator = IQDemodulator(self.carrier, self.Fe, **self.kargs)
+        else:
+            self.reset()
+
+    def reset(self):
+        self.demodulator.reset()
+
+    def process(self, frame):
+        iq = self.demodulator.process(frame['signal'])
+        frame['iq'] = iq
+        frame['iq_time'] = self.demodulator.get_time(len(iq))
+        frame['iq_Fe'] = self.Fe / self.demodulator.decimation
+        return frame
+
+
+class ToneTrackingStage(Stage):
+    """
+    Amplitude of a few tones of a signal, without any FFT (see
+    GoertzelBank). Adds frame[output] = [(frequency, amplitude)...].
+
+    The bank of filters is kept from one frame to the next : the
+    amplitudes are computed over all the samples since the last reset.
+    It is built again only when the tones or the sampling frequency change.
+    """
+
+    cache_params = ('frequencies', 'key', 'output')
+
+    def __init__(self, frequencies, key='signal', output='tones_amplitudes',
+                 enabled=True):
+        """
+        Parameters
+        ----------
+        frequencies : list of double
+            frequency of each tone.
+        key : string, optional
+            entry of the frame to analyse. The default is 'signal'.
+        output : string, optional
+            entry of the result. The default is 'tones_amplitudes'.
+        enabled : boolean, optional
+            see Stage. The default is True.
+
+        """
+        super().__init__(enabled=enabled)
+        self.frequencies = frequencies
+        self.key = key
+        self.output = output
+        self.tracker = None
+
+    def apply(self, params):
+        if 'frequencies' in params:
+            # New tones : bank built again on the next frame
+            self.tracker = None
+        super().apply(params)
+
+    def reset(self):
+        if self.tracker is not None:
+            self.tracker.reset()
+
+    def process(self, frame):
+        if self.tracker is None or self.tracker.Fe != frame['Fe']:
+            self.tracker = GoertzelBank(self.frequencies, frame['Fe'])
+        self.tracker.update(frame[self.key])
+        frame[self.output] = list(zip(self.frequencies, self.tracker.get_amplitudes()))
+        return frame
+
+
+class WindowedSpectraStage(Stage):
+    """
+    Spectra of a signal of the frame with several windows, in one 2D FFT
+    (see calculate_windowed_spectra), from 0 to f_max.
+    Adds frame[output] = (freq, spectra).
+    """
+
+    cache_params = ('windows', 'f_max', 'key', 'output')
+
+    def __init__(self, windows=tuple(WINDOW_TYPES), f_max=None, key='signal',
+                 output='windows', enabled=True):
+        """
+        Parameters
+        ----------
+        windows : tuple of string, optional
+            types of window. The default is all the WINDOW_TYPES.
+        f_max : double, optional
+            last frequency of the spectra. The default is None (Fe/2).
+        key : string, optional
+            entry of the frame to transform. The default is 'signal'.
+        output : string, optional
+            entry of the result. The default is 'windows'.
+        enabled : boolean, optional
+            see Stage. The default is True.
+
+        """
+        super().__init__(enabled=enabled)
+        self.windows = windows
+        self.f_max = f_max
+        self.key = key
+        self.output = output
+
+    def process(self, frame):
+        freq, spectra = calculate_windowed_spectra(frame[self.key], frame['Fe'],
+                                                   self.windows)
+        if self.f_max is not None:
+            zoom = freq <= self.f_max
+            freq, spectra = freq[zoom], spectra[:, zoom]
+        frame[self.output] = (freq, spectra)
+        return frame
+
+
+class DisplaySink(Stage):
+    """
+    End of a pipeline for a display : keeps the last frame, and calls
+    notify when a new frame is waiting (at most once until it is taken by
+    get). A slow display skips frames instead of slowing the pipeline.
+
+    notify is called from the thread of the pipeline : with Qt, give the
+    emit method of a signal, the connected slot is then called in the
+    thread of the interface (queued connection) and calls get.
+    """
+
+    threaded = False
+
+    def __init__(self, notify=None):
+        """
+        Parameters
+        ----------
+        notify : function, optional
+            function called without argument when a frame is waiting.
+            The default is None.
+
+        """
+        super().__init__()
+        self.notify = notify
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.frame = None
+            self.waiting = False
+
+    def process(self, frame):
+        with self._lock:
+            self.frame = frame
+            notify = not self.waiting
+            self.waiting = True
+        if notify and self.notify is not None:
+            self.notify()
+        return frame
+
+    def get(self):
+        """
+        Returns the last frame (None if no new frame since the last call)
+        """
+        with self._lock:
+            frame = self.frame if self.waiting else None
+            self.waiting = False
+        return frame
+
+
+class FileSink(Stage):
+    """
+    End of a pipeline writing an entry of each frame at the end of a
+    binary file (raw float64 samples, read by numpy.fromfile).
+    """
+
+    def __init__(self, filename, key='signal'):
+        """
+        Parameters
+        ----------
+        filename : string
+            name of the file (overwritten).
+        key : string, optional
+            entry of the frame to write. The default is 'signal'.
+
+        """
+        super().__init__()
+        self.filename = filename
+        self.key = key
+        self.reset()
+
+    def reset(self):
+        with open(self.filename, 'wb'):
+            pass
+
+    def process(self, frame):
+        with open(self.filename, 'ab') as file:
+            np.asarray(frame[self.key], dtype=float).tofile(file)
+        return frame
+
+
+class Pipeline:
+    """
+    Streaming pipeline : source -> stages -> sinks.
+
+    Each element runs in its own asyncio task, joined to the next one by
+    a bounded queue : when a stage is slower, the queue is full and the
+    previous stages wait (backpressure), the memory stays bounded. The
+    NumPy stages run in a thread pool, so consecutive stages work on
+    consecutive frames at the same time.
+
+    The event loop runs in its own thread (start / stop), next to the Qt
+    event loop : the frames come back to the interface through a
+    DisplaySink. The same pipeline can also process a single frame
+    synchronously (process), with a cache of the results of each stage.
+    """
+
+    def __init__(self, source, stages=(), sinks=(), maxsize=2, workers=None,
+                 cache=None):
+        """
+        Parameters
+        ----------
+        source : Source
+            source of the frames.
+        stages : list of Stage, optional
+            processing stages, in order. The default is ().
+        sinks : list of Stage, optional
+            ends of the pipeline, each frame is given to all the sinks.
+            The default is ().
+        maxsize : integer, optional
+            size of the queues between the stages. The default is 2.
+        workers : integer, optional
+            number of threads of the pool. The default is None
+            (one per stage).
+        cache : ComputationCache, optional
+            cache of the frames processed by process. The default is None.
+
+        """
+        self.source = source
+        self.stages = list(stages)
+        self.sinks = list(sinks)
+        self.cache = cache
+        for stage in [self.source] + self.stages + self.sinks:
+            stage.cache = cache
+        self.maxsize = maxsize
+        self.workers = workers
+        self.running = False
+        self.thread = None
+        self.error = None
+        self.from_cache = False     # last frame of process read from the cache
+
+    def reset(self):
+        """
+        Clears the state of all the elements
+        """
+        for stage in [self.source] + self.stages + self.sinks:
+            stage.reset()
+
+    def process(self, reset=True):
+        """
+        Creates and processes one frame, synchronously
+
+        With a cache and a reset, the frame only depends on the parameters
+        of the elements : frames are cached with the chain of the keys of
+        the previous stages, and the processing starts from the last stage
+        found in the cache. Only the frames a change of a control starts
+        from are kept : the output of the stages, and the input of each
+        stage already configured. When a control changes, only the stages
+        after it are computed.
+
+        Parameters
+        ----------
+        reset : boolean, optional
+            clear the state of the elements before. The default is True.
+
+        Returns
+        -------
+        frame : dictionary
+            frame at the end of the stages (None at the end of the source).
+
+        """
+        if reset or self.from_cache:
+            # New parameters first, then the reset
+            for stage in [self.source] + self.stages + self.sinks:
+                stage.update()
+                stage.reset()
+            if not reset:
+                # The elements skipped by the cache did not run :
+                # the last frame is processed again to restore their state
+                self._process_frame(use_cache=False)
+        frame = self._process_frame(use_cache=reset and self.cache is not None)
+        if frame is not None:
+            for sink in self.sinks:
+                sink(frame)
+        return frame
+
+    def _process_frame(self, use_cache):
+        """
+        Runs the source and the stages on one frame
+        """
+        elements = [self.source] + self.stages
+        keys = self._get_keys(elements) if use_cache else [None] * len(elements)
+        self.from_cache = False
+        frame, start = None, 0
+        for k in range(len(elements) - 1, -1, -1):
+            cached = None if keys[k] is None else self.cache.get(keys[k])
+            if cached is not None:
+                frame, start = dict(cached), k + 1
+                self.from_cache = True
+                break
+        for k in range(start, len(elements)):
+            if k > 0 and frame is None:
+                return None
+            frame = elements[k](frame)
+            if keys[k] is not None and frame is not None:
+                self.cache.put(keys[k], dict(frame))
+        return frame
+
+    def _get_keys(self, elements):
+        """
+        Returns the key of the frame kept at the output of each element
+        (None : not kept, see process)
+        """
+        keys = []
+        key = ()
+        for stage in elements:
+            stage.update()
+            if key is not None and stage.enabled:
+                stage_key = stage.get_key()
+                key = None if stage_key is None else (key, stage_key)
+            keys.append(key if stage.enabled else None)
+        last = max((k for k, key in enumerate(keys) if key is not None), default=None)
+        return [key if k == last or (k + 1 < len(elements) and elements[k + 1].configured)
+                else None for k, key in enumerate(keys)]
+
+    async def _run_source(self, executor, output):
+        loop = asyncio.get_running_loop()
+        next_time = time.perf_counter()
+        try:
+            while self.running:
+                frame = await loop.run_in_executor(executor, self.source)
+                if frame is None:
+                    break
+                await output.put(frame)
+                if self.source.period is not None:
+                    next_time += self.source.period
+                    await asyncio.sleep(max(0, next_time - time.perf_counter()))
+        finally:
+            await output.put(_END)
+
+    async def _run_stage(self, executor, stage, inbox, output):
+        loop = asyncio.get_running_loop()
+        while True:
+            frame = await inbox.get()
+            if frame is not _END:
+                if stage.threaded:
+                    frame = await loop.run_in_executor(executor, stage, frame)
+                else:
+                    frame = stage(frame)
+                if frame is None:
+                    continue
+            if output is not None:
+                await output.put(frame)
+            if frame is _END:
+                return
+
+    async def _run_sinks(self, executor, inbox):
+        loop = asyncio.get_running_loop()
+        while True:
+            frame = await inbox.get()
+            if frame is _END:
+                return
+            for sink in self.sinks:
+                if sink.threaded:
+                    await loop.run_in_executor(executor, sink, frame)
+                else:
+                    sink(frame)
+
+    async def run(self):
+        """
+        Runs the pipeline in the current event loop, until the end of the
+        source or a call to stop
+        """
+        self.running = True
+        self.error = None
+        workers = self.workers or len(self.stages) + 2
+        queues = [asyncio.Queue(self.maxsize) for _ in range(len(self.stages) + 1)]
+        with ThreadPoolExecutor(workers) as executor:
+            tasks = [asyncio.create_task(self._run_source(executor, queues[0]))]
+            for k, stage in enumerate(self.stages):
+                tasks.append(asyncio.create_task(
+                    self._run_stage(executor, stage, queues[k], queues[k+1])))
+            tasks.append(asyncio.create_task(self._run_sinks(executor, queues[-1])))
+            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in pending:
+                task.cancel()
+            for task in done:
+                if not task.cancelled() and task.exception() is not None:
+                    self.error = task.exception()
+                    print("Exception - pipeline: " + str(self.error) + "")
+        self.running = False
+
+    def start(self):
+        """
+        Runs the pipeline in a new thread, with its own event loop
+        """
+        if self.thread is not None and self.thread.is_alive():
+            return
+        if self.from_cache:
+            self.reset()
+            self.from_cache = False
+        self.running = True
+        self.thread = threading.Thread(target=asyncio.run, args=(self.run(),),
+                                       daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout=None):
+        """
+        Stops the source : the frames in the queues are processed,
+        then the thread ends
+        """
+        self.running = False
+        if self.thread is not None:
+            self.thread.join(timeout)
+            self.thread = None
+
+
+if __name__ == '__main__':
+    Fe = 10000
+    source = OscillatorSource([50, 1000], Fe, block_size=2**14)
+    display = DisplaySink()
+    pipeline = Pipeline(source, [MixStage('product'),
+                                 FilterStage(np.ones(8) / 8),
+                                 SpectrumStage(-2000, 2000, 4001)],
+                        [display])
+    frames = []
+    original = display.process
+    display.process = lambda frame: frames.append(frame['time'][0]) or original(frame)
+    pipeline.start()
+    time.sleep(1)
+    pipeline.stop()
+    duration = frames[-1] + 2**14 / Fe
+    print(f'{len(frames)} frames in 1 s : {duration * Fe / 1e6:.2f} MS/s, '
+          f'continuous {np.allclose(np.diff(frames), 2**14 / Fe)}')
+    freq, spectrum = display.get()['spectrum']
+    for f in (950, 1050):
+        print(f'{f} Hz : {spectrum[np.argmin(np.abs(freq - f))]:.3f}')
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Signal Processing libraries of functions
+Display of long signals in pyqtgraph, by min/max envelope
+
+This module needs pyqtgraph : it is not imported by the package.
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+from .envelope import EnvelopePyramid
+
+
+class EnvelopeCurve:
+    """
+    Curve of a pyqtgraph PlotWidget drawn from the min/max envelope of
+    its data. The envelope is computed again from the pyramid when the
+    X range of the view changes (zoom, pan).
+
+    The curve is kept by its item (item.envelope) : Qt only keeps a weak
+    reference to the update method connected to the view box.
+    """
+
+    def __init__(self, plot_widget, x, y, **kargs):
+        """
+        Parameters
+        ----------
+        plot_widget : pyqtgraph.PlotWidget
+            widget where the curve is displayed.
+        x : 1-dimension vector - double
+            abscissa of the samples (increasing).
+        y : 1-dimension vector - double
+            values of the samples.
+        **kargs : options of the curve (pen, name...), as PlotWidget.plot.
+
+        """
+        self.view_box = plot_widget.getPlotItem().getViewBox()
+        self.item = plot_widget.plot(**kargs)
+        self.item.envelope = self
+        self.set_data(x, y)
+        self.view_box.sigXRangeChanged.connect(self.update)
+        self.connected = True
+
+    def set_data(self, x, y):
+        """
+        Changes the data of the curve
+        """
+        self.pyramid = EnvelopePyramid(x, y)
+        self.update()
+
+    def disconnect(self):
+        """
+        Stops the update of the curve with the view range
+        """
+        if self.connected:
+            self.view_box.sigXRangeChanged.disconnect(self.update)
+            self.connected = False
+
+    def update(self, *args):
+        """
+        Draws the envelope of the data on the current view range
+        """
+        if self.item.scene() is None:
+            # The curve was removed from the plot by another way (clear)
+            self.disconnect()
+            return
+        x = self.pyramid.x
+        if self.view_box.state['autoRange'][0] or len(x) == 0:
+            x_min, x_max = (x[0], x[-1]) if len(x) else (0, 0)
+        else:
+            x_min, x_max = self.view_box.viewRange()[0]
+        pixels = max(int(self.view_box.width()), 500)
+        self.item.setData(*self.pyramid.get_envelope(x_min, x_max, pixels))
+
+
+def plot_envelope(plot_widget, x, y, **kargs):
+    """
+    Plots a signal of any length in a pyqtgraph PlotWidget, by its
+    min/max envelope (at most 2 points per pixel)
+
+    Parameters
+    ----------
+    plot_widget : pyqtgraph.PlotWidget
+        widget where the curve is displayed.
+    x : 1-dimension vector - double
+        abscissa of the samples (increasing).
+    y : 1-dimension vector - double
+        values of the samples.
+    **kargs : options of the curve (pen, name...), as PlotWidget.plot.
+
+    Returns
+    -------
+    item : pyqtgraph.PlotDataItem
+        curve added to the widget (can be removed by remove_envelope).
+
+    """
+    return EnvelopeCurve(plot_widget, x, y, **kargs).item
+
+
+def remove_envelope(plot_widget, item):
+    """
+    Removes a curve of plot_envelope from its widget
+
+    Parameters
+    ----------
+    plot_widget : pyqtgraph.PlotWidget
+        widget where the curve is displayed.
+    item : pyqtgraph.PlotDataItem
+        curve returned by plot_envelope.
+
+    """
+    item.envelope.disconnect()
+    plot_widget.removeItem(item)
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Signal Processing libraries of functions
+Power Spectral Density estimation (Welch method)
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ._lazy import lazy_import
+from .spectral import WORKERS, get_frequencies
+from .stft import get_cached_window, iterate_blocks
+
+fft = lazy_import('scipy.fft')
+
+
+class WelchPSD:
+    """
+    Welch / averaged periodogram estimator of the Power Spectral Density.
+
+    The signal is given chunk by chunk (update method). The segments of
+    each chunk are transformed with one 2D real FFT and their periodograms
+    are accumulated, so the memory does not depend on the signal length.
+    """
+
+    def __init__(self, Fe, nperseg=1024, overlap=None, window='hann',
+                 detrend=True, workers=None):
+        """
+        Parameters
+        ----------
+        Fe : double
+            sampling frequency.
+        nperseg : integer, optional
+            number of samples of each segment. The default is 1024.
+        overlap : integer, optional
+            number of samples shared by two segments.
+            The default is nperseg//2.
+        window : string or tuple, optional
+            type of window. The default is 'hann'.
+        detrend : boolean, optional
+            if True, the mean of each segment is removed. The default is True.
+        workers : integer, optional
+            number of threads. The default is WORKERS.
+
+        """
+        self.Fe = Fe
+        self.nperseg = nperseg
+        self.hop = nperseg - (overlap if overlap is not None else nperseg // 2)
+        self.window = get_cached_window(window, nperseg)
+        self.detrend = detrend
+        self.workers = WORKERS if workers is None else workers
+        # Scaling to V^2/Hz of a one-sided spectrum
+        self.scale = np.full(nperseg // 2 + 1, 2 / (Fe * np.sum(self.window**2)))
+        self.scale[0] /= 2
+        if nperseg % 2 == 0:
+            self.scale[-1] /= 2
+        self.reset()
+
+    def reset(self):
+        """
+        Clears the accumulated periodograms
+        """
+        self.buffer = np.zeros(0)
+        self.sum = np.zeros(self.nperseg // 2 + 1)
+        self.segments = 0
+
+    def update(self, chunk):
+        """
+        Adds a chunk of the signal to the estimation
+
+        Parameters
+        ----------
+        chunk : 1-dimension vector - double
+            next samples of the signal.
+
+        """
+        self.buffer = np.concatenate((self.buffer, chunk))
+        if len(self.buffer) < self.nperseg:
+            return
+        segments = sliding_window_view(self.buffer, self.nperseg)[::self.hop]
+        if self.detrend:
+            segments = segments - np.mean(segments, axis=1, keepdims=True)
+        TF = fft.rfft(segments * self.window, axis=-1, workers=self.workers)
+        self.sum += np.sum(TF.real**2 + TF.imag**2, axis=0)
+        self.segments += len(segments)
+        self.buffer = self.buffer[len(segments) * self.hop:]
+
+    def get_psd(self):
+        """
+        Returns the estimated Power Spectral Density
+
+        Returns
+        -------
+        freq : 1-dimension vector - double
+            frequency vector, from 0 to Fe/2.
+        psd : 1-dimension vector - double
+            one-sided power spectral density in V^2/Hz.
+
+        """
+        freq = get_frequencies(self.nperseg, self.Fe)
+        if self.segments == 0:
+            return freq, np.zeros(len(freq))
+        return freq, self.sum * self.scale / self.segments
+
+    def get_rms(self):
+        """
+        Returns the RMS value of the signal (Vrms), from the PSD
+
+        Returns
+        -------
+        rms : double
+            square root of the integral of the PSD.
+
+        """
+        _, psd = self.get_psd()
+        return np.sqrt(np.sum(psd) * self.Fe / self.nperseg)
+
+
+def welch_psd(signal, Fe, nperseg=1024, overlap=None, window='hann',
+              chunk_size=2**20):
+    """
+    Calculates the Power Spectral Density of a signal (Welch method) from
+    {signal vector or iterable of chunks, sampling frequency}
+
+    Parameters
+    ----------
+    signal : 1-dimension vector or iterable of vectors - double
+        signal vector (can be a numpy.memmap) or chunks of the signal.
+    Fe : double
+        sampling frequency.
+    nperseg : integer, optional
+        number of samples of each segment. The default is 1024.
+    overlap : integer, optional
+        number of samples shared by two segments.
+        The default is nperseg//2.
+    window : string or tuple, optional
+        type of window. The default is 'hann'.
+    chunk_size : integer, optional
+        number of samples processed at once, for signal vectors.
+        The default is 2**20.
+
+    Returns
+    -------
+    freq : 1-dimension vector - double
+        frequency vector, from 0 to Fe/2.
+    psd : 1-dimension vector - double
+        one-sided power spectral density in V^2/Hz.
+    rms : double
+        RMS value of the signal in V (without its mean value).
+
+    """
+    estimator = WelchPSD(Fe, nperseg, overlap, window)
+    if isinstance(signal, np.ndarray):
+        signal = iterate_blocks(signal, chunk_size)
+    for chunk in signal:
+        estimator.update(chunk)
+    freq, psd = estimator.get_psd()
+    return freq, psd, estimator.get_rms()
+
+
+if __name__ == '__main__':
+    Fe = 10000
+    noise = np.random.normal(0, 0.1, 10*Fe)
+    freq, psd, rms = welch_psd(noise, Fe, chunk_size=3000)
+    print(f'Mean PSD = {np.mean(psd[1:-1]):.3e} V2/Hz (expected {0.01*2/Fe:.3e})')
+    print(f'Vrms = {rms:.4f} V (expected 0.1)')
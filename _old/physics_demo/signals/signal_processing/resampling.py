@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+Signal Processing libraries of functions
+Reconstruction (Whittaker-Shannon) and rational resampling of signals
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+from functools import lru_cache
+from math import gcd
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ._lazy import lazy_import
+
+sparse = lazy_import('scipy.sparse')
+scipy_signal = lazy_import('scipy.signal')
+
+
+def _kaiser(d, half_width, beta):
+    """ Kaiser window at distances d from its center (0 outside) """
+    r = np.clip(1 - (d / half_width)**2, 0, None)
+    return np.i0(beta * np.sqrt(r)) / np.i0(beta) * (np.abs(d) < half_width)
+
+
+@lru_cache(maxsize=16)
+def get_sinc_matrix(nb_samples, t0, Ts, t_start, t_step, points,
+                    half_width=16, beta=8.0):
+    """
+    Returns the Whittaker-Shannon interpolation matrix, cached by grids
+
+    The sinc kernel is truncated to +/- half_width samples and windowed
+    by a Kaiser window : each output depends on 2.half_width samples
+    only, and the matrix is a sparse banded matrix.
+
+    Parameters
+    ----------
+    nb_samples : integer
+        number of samples of the signal.
+    t0 : double
+        time of the first sample.
+    Ts : double
+        sampling period.
+    t_start : double
+        time of the first output point.
+    t_step : double
+        time between two output points.
+    points : integer
+        number of output points.
+    half_width : integer, optional
+        half width of the kernel, in samples. The default is 16.
+    beta : double, optional
+        parameter of the Kaiser window. The default is 8.0.
+
+    Returns
+    -------
+    matrix : scipy.sparse.csr_matrix
+        interpolation matrix (points, nb_samples).
+
+    """
+    u = (t_start + t_step * np.arange(points) - t0) / Ts
+    offsets = np.arange(-half_width + 1, half_width + 1)
+    columns = np.floor(u)[:, np.newaxis].astype(int) + offsets
+    d = u[:, np.newaxis] - columns
+    weights = np.sinc(d) * _kaiser(d, half_width, beta)
+    valid = (columns >= 0) & (columns < nb_samples)
+    rows = np.broadcast_to(np.arange(points)[:, np.newaxis], columns.shape)
+    return sparse.csr_matrix((weights[valid], (rows[valid], columns[valid])),
+                             shape=(points, nb_samples))
+
+
+def sinc_reconstruct(samples, t0, Ts, t_start, t_step, points,
+                     half_width=16, beta=8.0):
+    """
+    Reconstructs a signal from its samples (Whittaker-Shannon formula)
+    y(t) = sum_n x[n].sinc((t - t0 - n.Ts) / Ts)
+
+    Parameters
+    ----------
+    samples : 1-dimension vector - double
+        samples of the signal.
+    t0 : double
+        time of the first sample.
+    Ts : double
+        sampling period.
+    t_start : double
+        time of the first output point.
+    t_step : double
+        time between two output points.
+    points : integer
+        number of output points.
+    half_width, beta : see get_sinc_matrix.
+
+    Returns
+    -------
+    time : 1-dimension vector - double
+        time vector of the reconstructed signal.
+    signal : 1-dimension vector - double
+        reconstructed signal.
+
+    """
+    matrix = get_sinc_matrix(len(samples), t0, Ts, t_start, t_step, points,
+                             half_width, beta)
+    return t_start + t_step * np.arange(points), matrix @ samples
+
+
+@lru_cache(maxsize=16)
+def get_polyphase_filter(up, down, half_width=16, beta=8.0):
+    """
+    Returns the polyphase components of the anti-aliasing filter
+    of a resampling by up/down, cached by (up, down)
+
+    Parameters
+    ----------
+    up : integer
+        upsampling factor.
+    down : integer
+        downsampling factor.
+    half_width, beta : see get_sinc_matrix.
+
+    Returns
+    -------
+    polyphase : 2-dimension array - double
+        component p of the filter h[p + q.up], reversed (up, taps).
+    center : integer
+        index of the center of the filter.
+
+    """
+    factor = max(up, down)
+    center = half_width * factor
+    h = scipy_signal.firwin(2 * center + 1, 1 / factor, window=('kaiser', beta)) * up
+    taps = -(-len(h) // up)
+    h = np.concatenate((h, np.zeros(taps * up - len(h))))
+    polyphase = h.reshape(taps, up).T[:, ::-1].copy()
+    polyphase.flags.writeable = False
+    return polyphase, center
+
+
+def resample_rational(signal, up, down, half_width=16, beta=8.0,
+                      chunk_size=2**16):
+    """
+    Resamples a signal by a rational factor up/down (polyphase method)
+
+    The signal is not upsampled with zeros : each output sample only
+    uses the polyphase component of the filter matching its position
+    between the input samples.
+
+    Parameters
+    ----------
+    signal : 1-dimension vector - double
+        signal vector.
+    up : integer
+        upsampling factor.
+    down : integer
+        downsampling factor.
+    half_width, beta : see get_sinc_matrix.
+    chunk_size : integer, optional
+        number of output samples computed at once. The default is 2**16.
+
+    Returns
+    -------
+    resampled : 1-dimension vector - double
+        signal at the sampling frequency Fe.up/down
+        (output m is at the time m.down/up of the input samples).
+
+    """
+    g = gcd(up, down)
+    up, down = up // g, down // g
+    if up == down:
+        return np.array(signal, dtype=float)
+    polyphase, center = get_polyphase_filter(up, down, half_width, beta)
+    taps = polyphase.shape[1]
+    nb_outputs = -(-len(signal) * up // down)
+    # Zeros before and after the signal, for the first and last outputs
+    padded = np.concatenate((np.zeros(taps - 1), signal, np.zeros(taps)))
+    windows = sliding_window_view(padded, taps)
+    resampled = np.empty(nb_outputs)
+    for start in range(0, nb_outputs, chunk_size):
+        m = np.arange(start, min(start + chunk_size, nb_outputs))
+        position = m * down + center
+        n = np.minimum(position // up, len(windows) - 1)
+        p = position % up
+        resampled[m] = np.einsum('ij,ij->i', windows[n], polyphase[p])
+    return resampled
+
+
+if __name__ == '__main__':
+    import time
+    Ts = 0.5
+    t = np.arange(-20, 20, Ts)
+    samples = np.sinc(0.8 * t)
+    start = time.perf_counter()
+    t_out, signal = sinc_reconstruct(samples, t[0], Ts, -10, 0.01, 2001)
+    print(f'Reconstruction : {(time.perf_counter()-start)*1e3:.2f} ms, '
+          f'error {np.max(np.abs(signal - np.sinc(0.8*t_out))):.2e}')
+    start = time.perf_counter()
+    t_out, signal = sinc_reconstruct(samples, t[0], Ts, -10, 0.01, 2001)
+    print(f'Reconstruction (cached) : {(time.perf_counter()-start)*1e3:.2f} ms')
+    Fe = 1000
+    x = np.sin(2*np.pi*50*np.arange(10000)/Fe)
+    y = resample_rational(x, 3, 2)
+    reference = np.sin(2*np.pi*50*np.arange(len(y))*2/3/Fe)
+    print(f'Resampling 3/2 : error {np.max(np.abs(y - reference)[100:-100]):.2e}')
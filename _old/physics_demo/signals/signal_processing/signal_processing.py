@@ -7,9 +7,12 @@ Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
 Version : 1.0 - 2022-12-01
 """
 
-from scipy import fftpack
 import numpy as np
-from numpy import random as rd
+
+from ._lazy import lazy_import
+from .spectral import WORKERS
+
+fft = lazy_import('scipy.fft')
 
 
 def test_signal():
@@ -57,7 +60,7 @@ def generate_sinus_freq(f, Fe, nb_per):
     return t, signal
 
 
-def generate_sinus_time(f, time):
+def generate_sinus_time(f, time, out=None):
     """
     Generates Sine Waveform from 
     {frequency, time vector}
@@ -68,6 +71,9 @@ def generate_sinus_time(f, time):
         frequency of the signal.
     time : 1-dimension vector - double
         time vector.
+    out : 1-dimension vector - double, optional
+        buffer of the signal, reused from one call to the next.
+        The default is None (new vector).
 
     Returns
     -------
@@ -75,17 +81,22 @@ def generate_sinus_time(f, time):
         signal vector.
 
     """
+    if out is None:
+        out = np.empty(len(time))
     if(f != 0):
-        signal = np.sin(f * 2 * np.pi * time)
+        np.multiply(time, f * 2 * np.pi, out=out)
+        np.sin(out, out=out)
     else:
-        signal = np.zeros(len(time))
-    return signal
+        out.fill(0)
+    return out
 
 
-def calculate_FFT_1D(signal, Fe):
+def calculate_FFT_1D(signal, Fe, workers=None):
     """
     Calculates FFT from 
     {signal vector, sampling frequency}
+    Positive and negative frequencies, in the FFT order. For a real signal,
+    spectral.calculate_rFFT_1D only computes the positive frequencies.
 
     Parameters
     ----------
@@ -93,6 +104,8 @@ def calculate_FFT_1D(signal, Fe):
         signal vector to calculate the FFT.
     Fe : double
         sampling frequency.
+    workers : integer, optional
+        number of threads. The default is spectral.WORKERS.
 
     Returns
     -------
@@ -102,18 +115,27 @@ def calculate_FFT_1D(signal, Fe):
         complex Fourier Transform vector.
 
     """
-    TF = fftpack.fft(signal)/len(signal)
-    freq = fftpack.fftfreq(len(signal)) * Fe
+    if workers is None:
+        workers = WORKERS
+    TF = fft.fft(signal, norm='forward', workers=workers)
+    freq = fft.fftfreq(len(signal), 1/Fe)
     return freq, TF
 
-def generate_noise(nb_samples):
+def generate_noise(nb_samples, seed=None, out=None):
     """
     Generates a random vector of {nb_samples} samples
+    Uniform noise between -0.5 and 0.5. For long or colored noise,
+    see noise.NoiseGenerator.
 
     Parameters
     ----------
     nb_samples : int
         Size of the vector.
+    seed : int, optional
+        Seed of the random generator. The default is None (random seed).
+    out : 1-dimension vector - double, optional
+        buffer of the noise, reused from one call to the next.
+        The default is None (new vector).
 
     Returns
     -------
@@ -121,5 +143,7 @@ def generate_noise(nb_samples):
         Array of random floats of shape nb_samples.
 
     """
-    v_noise = rd.random(nb_samples) - 0.5
-    return v_noise
\ No newline at end of file
+    rng = np.random.default_rng(seed)
+    v_noise = rng.random(nb_samples, out=out)
+    v_noise -= 0.5
+    return v_noise
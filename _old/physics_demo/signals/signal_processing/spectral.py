@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+Signal Processing libraries of functions
+Spectral analysis of real signals
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+from functools import lru_cache
+import numpy as np
+
+from ._lazy import lazy_import
+
+fft = lazy_import('scipy.fft')
+
+
+# Number of threads used by scipy.fft for multidimensional / batched
+# transforms (-1 : all the CPU cores)
+WORKERS = -1
+
+
+@lru_cache(maxsize=32)
+def get_frequencies(N, Fe, two_sided=False):
+    """
+    Returns the frequency axis of a spectrum, cached by (N, Fe)
+
+    Parameters
+    ----------
+    N : integer
+        number of samples of the signal.
+    Fe : double
+        sampling frequency.
+    two_sided : boolean, optional
+        if True, frequencies from -Fe/2 to Fe/2 (fftshift order),
+        else, frequencies from 0 to Fe/2 (rfft order).
+        The default is False.
+
+    Returns
+    -------
+    freq : 1-dimension vector - double
+        frequency vector (read-only).
+
+    """
+    if two_sided:
+        freq = fft.fftshift(fft.fftfreq(N, 1/Fe))
+    else:
+        freq = fft.rfftfreq(N, 1/Fe)
+    freq.flags.writeable = False
+    return freq
+
+
+def calculate_rFFT_1D(signal, Fe, workers=None):
+    """
+    Calculates the FFT of a real signal from
+    {signal vector, sampling frequency}
+    Only positive frequencies are computed (real input transform).
+
+    Parameters
+    ----------
+    signal : 1-dimension vector - double
+        signal vector to calculate the FFT.
+    Fe : double
+        sampling frequency.
+    workers : integer, optional
+        number of threads. The default is WORKERS.
+
+    Returns
+    -------
+    freq : 1-dimension vector - double
+        frequency vector, from 0 to Fe/2.
+    TF : 1-dimension vector - complex
+        complex Fourier Transform vector, normalized by the
+        number of samples.
+
+    """
+    if workers is None:
+        workers = WORKERS
+    N = len(signal)
+    TF = fft.rfft(signal, norm='forward', workers=workers)
+    return get_frequencies(N, Fe), TF
+
+
+def calculate_spectrum(signal, Fe, two_sided=False, out=None, workers=None):
+    """
+    Calculates the magnitude of the FFT of a real signal from
+    {signal vector, sampling frequency}
+
+    The two-sided spectrum (from -Fe/2 to Fe/2) is obtained from the
+    real input transform by symmetry, without any complex FFT.
+
+    Parameters
+    ----------
+    signal : 1-dimension vector - double
+        signal vector to calculate the FFT.
+    Fe : double
+        sampling frequency.
+    two_sided : boolean, optional
+        if True, the spectrum is computed from -Fe/2 to Fe/2 (as with
+        fftshift), else from 0 to Fe/2. The default is False.
+    out : 1-dimension vector - double, optional
+        preallocated output array, of size N (two-sided) or N//2+1.
+        The default is None (a new array is allocated).
+    workers : integer, optional
+        number of threads. The default is WORKERS.
+
+    Returns
+    -------
+    freq : 1-dimension vector - double
+        frequency vector.
+    spectrum : 1-dimension vector - double
+        magnitude of the Fourier Transform, normalized by the
+        number of samples.
+
+    """
+    N = len(signal)
+    freq, TF = calculate_rFFT_1D(signal, Fe, workers)
+    if two_sided:
+        if out is None:
+            out = np.empty(N)
+        center = N // 2
+        np.abs(TF[:N-center], out=out[center:])
+        np.abs(TF[center:0:-1], out=out[:center])
+        return get_frequencies(N, Fe, True), out
+    if out is None:
+        out = np.empty(len(TF))
+    np.abs(TF, out=out)
+    return freq, out
+
+
+if __name__ == '__main__':
+    Fe = 1000
+    t = np.arange(1000) / Fe
+    f, s = calculate_spectrum(np.sin(2*np.pi*50*t), Fe, two_sided=True)
+    print(f[np.argmax(s)], np.max(s))
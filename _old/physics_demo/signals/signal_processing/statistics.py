@@ -0,0 +1,380 @@
+# -*- coding: utf-8 -*-
+"""
+Signal Processing libraries of functions
+Statistics of long signals : streaming histograms and moments, mergeable
+between chunks and between worker processes
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+import numpy as np
+
+from ._lazy import lazy_import
+from .noise import NoiseGenerator
+
+optimize = lazy_import('scipy.optimize')
+
+
+# Number of samples processed at once : bounds the temporary arrays
+CHUNK_SIZE = 2**20
+
+
+class StreamingHistogram:
+    """
+    Histogram with fixed bins, computed chunk by chunk.
+
+    The samples are quantized to the index of their bin, then counted
+    with numpy.bincount. The bins are [x_min + k.w, x_min + (k+1).w),
+    the samples out of [x_min, x_max) are counted in underflow and
+    overflow. Two histograms with the same bins can be merged.
+    """
+
+    def __init__(self, x_min, x_max, bins=256):
+        """
+        Parameters
+        ----------
+        x_min : double
+            lower edge of the first bin.
+        x_max : double
+            upper edge of the last bin.
+        bins : integer, optional
+            number of bins. The default is 256.
+
+        """
+        self.x_min = x_min
+        self.x_max = x_max
+        self.bins = bins
+        self.scale = bins / (x_max - x_min)
+        self.edges = np.linspace(x_min, x_max, bins + 1)
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+
+    def update(self, chunk):
+        """
+        Adds samples to the histogram
+
+        Parameters
+        ----------
+        chunk : 1-dimension vector - double
+            next samples of the signal (any length, can be a numpy.memmap).
+
+        """
+        for start in range(0, len(chunk), CHUNK_SIZE):
+            # Index of the bin + 1 : 0 is the underflow, bins+1 the overflow
+            index = np.subtract(chunk[start:start+CHUNK_SIZE], self.x_min)
+            index *= self.scale
+            index += 1
+            np.clip(index, 0, self.bins + 1, out=index)
+            counts = np.bincount(index.astype(np.intp), minlength=self.bins + 2)
+            self.counts += counts[1:-1]
+            self.underflow += int(counts[0])
+            self.overflow += int(counts[-1])
+
+    def merge(self, other):
+        """
+        Adds the counts of another histogram with the same bins
+        """
+        if (other.x_min, other.x_max, other.bins) != (self.x_min, self.x_max, self.bins):
+            raise ValueError('Histograms with different bins cannot be merged')
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        return self
+
+    def get_count(self):
+        """
+        Returns the total number of samples (in and out of the bins)
+        """
+        return int(np.sum(self.counts)) + self.underflow + self.overflow
+
+    def get_centers(self):
+        """
+        Returns the center of each bin
+        """
+        return (self.edges[:-1] + self.edges[1:]) / 2
+
+    def get_density(self):
+        """
+        Returns the probability density of each bin
+
+        Returns
+        -------
+        centers : 1-dimension vector - double
+            center of each bin.
+        density : 1-dimension vector - double
+            counts / (total number of samples x bin width).
+
+        """
+        total = max(self.get_count(), 1)
+        return self.get_centers(), self.counts * (self.scale / total)
+
+
+class RunningMoments:
+    """
+    Count, mean, variance, skewness and kurtosis of a signal, computed
+    chunk by chunk.
+
+    The central moments of each chunk are computed at once (Welford
+    algorithm by blocks), then merged with the accumulated ones by the
+    formulas of Chan and Pebay : two partial results, from two parts of
+    the signal, are merged without any loss of precision.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0       # sums of the powers of the deviation from the mean
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, chunk):
+        """
+        Adds samples to the moments
+
+        Parameters
+        ----------
+        chunk : 1-dimension vector - double
+            next samples of the signal (any length, can be a numpy.memmap).
+
+        """
+        for start in range(0, len(chunk), CHUNK_SIZE):
+            block = np.asarray(chunk[start:start+CHUNK_SIZE], dtype=float)
+            if len(block) == 0:
+                continue
+            other = RunningMoments()
+            other.count = len(block)
+            other.mean = np.mean(block)
+            deviation = block - other.mean
+            square = deviation * deviation
+            other.m2 = np.sum(square)
+            other.m3 = square @ deviation
+            other.m4 = square @ square
+            other.min = np.min(block)
+            other.max = np.max(block)
+            self.merge(other)
+
+    def merge(self, other):
+        """
+        Adds the moments of another part of the signal
+        """
+        na, nb = self.count, other.count
+        if nb == 0:
+            return self
+        if na == 0:
+            self.__dict__.update(other.__dict__)
+            return self
+        n = na + nb
+        delta = other.mean - self.mean
+        m2a, m3a = self.m2, self.m3
+        self.mean += delta * nb / n
+        self.m4 += other.m4 + delta**4 * na * nb * (na*na - na*nb + nb*nb) / n**3 \
+            + 6 * delta**2 * (na*na * other.m2 + nb*nb * m2a) / n**2 \
+            + 4 * delta * (na * other.m3 - nb * m3a) / n
+        self.m3 += other.m3 + delta**3 * na * nb * (na - nb) / n**2 \
+            + 3 * delta * (na * other.m2 - nb * m2a) / n
+        self.m2 += other.m2 + delta**2 * na * nb / n
+        self.count = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def get_variance(self, ddof=0):
+        """
+        Returns the variance (ddof=1 : unbiased estimator)
+        """
+        return self.m2 / (self.count - ddof) if self.count > ddof else np.nan
+
+    def get_std(self, ddof=0):
+        """
+        Returns the standard deviation
+        """
+        return np.sqrt(self.get_variance(ddof))
+
+    def get_skewness(self):
+        """
+        Returns the skewness (0 for a symmetric distribution)
+        """
+        return np.sqrt(self.count) * self.m3 / self.m2**1.5 if self.m2 > 0 else np.nan
+
+    def get_kurtosis(self):
+        """
+        Returns the excess kurtosis (0 for a gaussian distribution)
+        """
+        return self.count * self.m4 / self.m2**2 - 3 if self.m2 > 0 else np.nan
+
+
+class NoiseStatistics:
+    """
+    Histogram and moments of a signal, computed chunk by chunk.
+    """
+
+    def __init__(self, x_min, x_max, bins=256):
+        """
+        Parameters
+        ----------
+        x_min, x_max, bins : see StreamingHistogram.
+
+        """
+        self.histogram = StreamingHistogram(x_min, x_max, bins)
+        self.moments = RunningMoments()
+
+    def update(self, chunk):
+        """
+        Adds samples to the statistics
+        """
+        self.histogram.update(chunk)
+        self.moments.update(chunk)
+
+    def merge(self, other):
+        """
+        Adds the statistics of another part of the signal
+        """
+        self.histogram.merge(other.histogram)
+        self.moments.merge(other.moments)
+        return self
+
+    def get_summary(self):
+        """
+        Returns the moments as a dictionary
+        """
+        m = self.moments
+        return {'count': m.count, 'mean': m.mean, 'std': m.get_std(),
+                'skewness': m.get_skewness(), 'kurtosis': m.get_kurtosis(),
+                'min': m.min, 'max': m.max}
+
+
+def gaussian_pdf(x, mean, std):
+    """
+    Probability density of a gaussian distribution
+    """
+    return np.exp(-0.5 * ((x - mean) / std)**2) / (std * np.sqrt(2 * np.pi))
+
+
+def fit_gaussian(histogram):
+    """
+    Fits a gaussian distribution on a histogram (least squares on the
+    density), starting from the moments of the histogram
+
+    Parameters
+    ----------
+    histogram : StreamingHistogram
+        histogram of the signal.
+
+    Returns
+    -------
+    mean : double
+        mean of the fitted distribution.
+    std : double
+        standard deviation of the fitted distribution.
+
+    """
+    centers, density = histogram.get_density()
+    weights = histogram.counts / max(np.sum(histogram.counts), 1)
+    mean = np.sum(weights * centers)
+    std = np.sqrt(np.sum(weights * (centers - mean)**2))
+    std = std if std > 0 else 1 / histogram.scale
+    (mean, std), _ = optimize.curve_fit(gaussian_pdf, centers, density, p0=(mean, std))
+    return mean, abs(std)
+
+
+def calculate_statistics(blocks, x_min, x_max, bins=256):
+    """
+    Calculates the statistics of a signal given by blocks (bounded memory)
+
+    Parameters
+    ----------
+    blocks : iterable of 1-dimension vector - double
+        blocks of the signal (see iterate_blocks or NoiseGenerator.blocks).
+    x_min, x_max, bins : see StreamingHistogram.
+
+    Returns
+    -------
+    statistics : NoiseStatistics
+        histogram and moments of the signal.
+
+    """
+    statistics = NoiseStatistics(x_min, x_max, bins)
+    for block in blocks:
+        statistics.update(block)
+    return statistics
+
+
+def _noise_statistics_worker(nb_samples, x_min, x_max, bins, color, std, seed,
+                             block_size):
+    """ Statistics of one stream of noise (in a worker process) """
+    generator = NoiseGenerator(color, std, block_size=block_size, seed=seed)
+    return calculate_statistics(generator.blocks(nb_samples), x_min, x_max, bins)
+
+
+def calculate_noise_statistics(nb_samples, x_min, x_max, bins=256, color='gaussian',
+                               std=1.0, seed=None, block_size=2**20, max_workers=None):
+    """
+    Calculates the statistics of a long noise (10^9 samples and more) :
+    the noise is divided in independent streams, one per task, processed
+    in parallel worker processes. The partial results are merged.
+
+    Parameters
+    ----------
+    nb_samples : integer
+        total number of samples.
+    x_min, x_max, bins : see StreamingHistogram.
+    color : string, optional
+        color of the noise (see NoiseGenerator). The default is 'gaussian'.
+    std : double, optional
+        standard deviation of the noise. The default is 1.0.
+    seed : integer, optional
+        seed of the streams (reproducible results). The default is None.
+    block_size : integer, optional
+        number of samples of each block. The default is 2**20.
+    max_workers : integer, optional
+        number of processes. The default is None (one per CPU core).
+
+    Returns
+    -------
+    statistics : NoiseStatistics
+        histogram and moments of the noise.
+
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers) as executor:
+        # Several tasks per process : balances the load between the processes
+        nb_tasks = 4 * max_workers
+        sizes = np.full(nb_tasks, nb_samples // nb_tasks)
+        sizes[:nb_samples % nb_tasks] += 1
+        seeds = np.random.SeedSequence(seed).spawn(nb_tasks)
+        futures = [executor.submit(_noise_statistics_worker, int(size), x_min, x_max,
+                                   bins, color, std, s, block_size)
+                   for size, s in zip(sizes, seeds) if size > 0]
+        statistics = NoiseStatistics(x_min, x_max, bins)
+        for future in futures:
+            statistics.merge(future.result())
+    return statistics
+
+
+if __name__ == '__main__':
+    import time
+    from scipy import stats
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal(10**6) * 2 + 1
+    statistics = NoiseStatistics(-10, 10, 200)
+    for chunk in np.array_split(x, 7):
+        statistics.update(chunk)
+    counts, _ = np.histogram(x, statistics.histogram.edges)
+    print(f'Histogram : {np.array_equal(counts, statistics.histogram.counts)}, '
+          f'moments error {abs(statistics.moments.get_std() - np.std(x)):.1e} / '
+          f'{abs(statistics.moments.get_skewness() - stats.skew(x)):.1e} / '
+          f'{abs(statistics.moments.get_kurtosis() - stats.kurtosis(x)):.1e}')
+    print(f'Gaussian fit (mean, std) : {fit_gaussian(statistics.histogram)}')
+    nb_samples = 10**8
+    start = time.perf_counter()
+    statistics = calculate_noise_statistics(nb_samples, -6, 6, 256, seed=0)
+    duration = time.perf_counter() - start
+    print(f'{nb_samples:.0e} samples in {duration:.1f} s '
+          f'({nb_samples / duration / 1e6:.0f} MS/s) : {statistics.get_summary()}')
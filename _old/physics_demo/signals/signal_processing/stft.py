@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+Signal Processing libraries of functions
+Streaming Short-Time Fourier Transform (spectrogram)
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+from functools import lru_cache
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ._lazy import lazy_import
+from .spectral import WORKERS, get_frequencies
+
+fft = lazy_import('scipy.fft')
+scipy_signal = lazy_import('scipy.signal')
+
+
+@lru_cache(maxsize=16)
+def get_cached_window(window, N):
+    """
+    Returns a window of N samples, cached by (window, N)
+
+    Parameters
+    ----------
+    window : string or tuple
+        type of the window, as in scipy.signal.get_window
+        (for example 'hann', 'blackmanharris' or ('kaiser', 8.0)).
+    N : integer
+        number of samples.
+
+    Returns
+    -------
+    win : 1-dimension vector - double
+        window (read-only).
+
+    """
+    win = scipy_signal.get_window(window, N)
+    win.flags.writeable = False
+    return win
+
+
+def iterate_blocks(signal, block_size):
+    """
+    Generates blocks of {block_size} samples from a signal vector.
+    The signal can be a numpy.memmap, for signals stored in files.
+
+    Parameters
+    ----------
+    signal : 1-dimension vector - double
+        signal vector.
+    block_size : integer
+        number of samples of each block.
+
+    Yields
+    ------
+    block : 1-dimension vector - double
+        view on the next block of the signal.
+
+    """
+    for k in range(0, len(signal), block_size):
+        yield signal[k:k+block_size]
+
+
+def stft_stream(blocks, Fe, nperseg=256, hop=None, overlap=None,
+                window='hann', batch=64, workers=None):
+    """
+    Calculates the Short-Time Fourier Transform of a signal given by
+    blocks of any size.
+
+    Frames are extracted from an internal buffer that never exceeds
+    one block plus one frame, and are transformed in batches of
+    {batch} frames with one 2D real FFT.
+
+    Parameters
+    ----------
+    blocks : iterable of 1-dimension vector - double
+        blocks of the signal (see iterate_blocks).
+    Fe : double
+        sampling frequency.
+    nperseg : integer, optional
+        number of samples of each frame. The default is 256.
+    hop : integer, optional
+        number of samples between two frames. The default is nperseg//2.
+    overlap : integer, optional
+        number of samples shared by two frames (nperseg - hop).
+        Used only if hop is not given.
+    window : string or tuple, optional
+        type of window. The default is 'hann'.
+    batch : integer, optional
+        maximum number of frames per FFT. The default is 64.
+    workers : integer, optional
+        number of threads. The default is WORKERS.
+
+    Yields
+    ------
+    time : 1-dimension vector - double
+        time of the center of each frame.
+    columns : 2-dimension array - double
+        magnitude of the spectrum of each frame (nperseg//2+1, frames),
+        normalized by the sum of the window.
+
+    """
+    if hop is None:
+        hop = nperseg - overlap if overlap is not None else nperseg // 2
+    if hop <= 0 or hop > nperseg:
+        raise ValueError('hop must be between 1 and nperseg')
+    if workers is None:
+        workers = WORKERS
+    win = get_cached_window(window, nperseg)
+    win = win / np.sum(win)
+    buffer = np.zeros(0)
+    start = 0           # index of the first sample of the buffer
+    for block in blocks:
+        buffer = np.concatenate((buffer, block))
+        if len(buffer) < nperseg:
+            continue
+        frames = sliding_window_view(buffer, nperseg)[::hop]
+        for k in range(0, len(frames), batch):
+            stack = frames[k:k+batch] * win
+            columns = np.abs(fft.rfft(stack, axis=-1, workers=workers))
+            time = (start + (np.arange(k, k+len(stack))*hop + nperseg/2)) / Fe
+            yield time, columns.T
+        # Keep only the samples needed by the next frames
+        consumed = len(frames) * hop
+        buffer = buffer[consumed:]
+        start += consumed
+
+
+def stft_frequencies(nperseg, Fe):
+    """
+    Returns the frequency axis of the columns given by stft_stream
+
+    Parameters
+    ----------
+    nperseg : integer
+        number of samples of each frame.
+    Fe : double
+        sampling frequency.
+
+    Returns
+    -------
+    freq : 1-dimension vector - double
+        frequency vector, from 0 to Fe/2.
+
+    """
+    return get_frequencies(nperseg, Fe)
+
+
+if __name__ == '__main__':
+    Fe = 10000
+    t = np.arange(10*Fe) / Fe
+    chirp = np.sin(2*np.pi*(100 + 200*t)*t)
+    freq = stft_frequencies(512, Fe)
+    for time, columns in stft_stream(iterate_blocks(chirp, 3000), Fe, 512):
+        print(time[0], freq[np.argmax(columns[:, 0])])
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+Signal Processing libraries of functions
+Multi-tone synthesis by inverse real FFT
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import numpy as np
+
+from ._lazy import lazy_import
+from .spectral import WORKERS
+
+fft = lazy_import('scipy.fft')
+
+
+def synthesize_tones(frequencies, Fe, N, amplitudes=1.0, phases=0.0,
+                     out=None, tolerance=1e-10, workers=None):
+    """
+    Generates a sum of Sine Waveforms A.sin(2.pi.f.t + phi) from
+    {frequencies, sampling frequency, number of samples}
+    by filling spectra and computing inverse real FFT, in O(N.log(N))
+    for any number of tones.
+
+    A tone at f = (k + e).Fe/N, with |e| <= 1/2, is written in the bin k.
+    The offset e is corrected with the Taylor series of
+    exp(j.2.pi.e.(n/N - 1/2)) : one spectrum per term, up to the order
+    giving the required tolerance (|2.pi.e.(n/N - 1/2)| <= pi/2).
+    The terms are real signals, computed by inverse real FFT. Tones on
+    the FFT bins need only one term. A few tones are summed directly.
+
+    Parameters
+    ----------
+    frequencies : 1-dimension vector - double
+        frequency of each tone.
+    Fe : double
+        sampling frequency.
+    N : integer
+        number of samples.
+    amplitudes : double or 1-dimension vector - double, optional
+        amplitude of each tone. The default is 1.0.
+    phases : double or 1-dimension vector - double, optional
+        phase of each tone (rad). The default is 0.0.
+    out : 1-dimension vector - double, optional
+        preallocated output array (N).
+    tolerance : double, optional
+        maximum error for a tone of amplitude 1. The default is 1e-10.
+    workers : integer, optional
+        number of threads. The default is WORKERS.
+
+    Returns
+    -------
+    signal : 1-dimension vector - double
+        signal vector.
+
+    """
+    if workers is None:
+        workers = WORKERS
+    frequencies = np.atleast_1d(np.asarray(frequencies, dtype=float))
+    amplitudes = np.broadcast_to(np.asarray(amplitudes, dtype=float), frequencies.shape)
+    phases = np.broadcast_to(np.asarray(phases, dtype=float), frequencies.shape)
+    if out is None:
+        out = np.zeros(N)
+    else:
+        out[:] = 0
+    if len(frequencies) == 0:
+        return out
+    bins = frequencies * N / Fe
+    # Nearest bin and offset of each tone
+    nearest = np.round(bins)
+    residual = bins - nearest
+    integer = nearest.astype(int) % N
+    # Order of the Taylor series : x^(p+1)/(p+1)! < tolerance, x = pi.max|e|
+    x = np.pi * np.max(np.abs(residual))
+    order = 0
+    bound = x
+    while bound > tolerance:
+        order += 1
+        bound *= x / (order + 1)
+    terms = order + 1
+    # Under this number of tones, a direct sum is faster than the IFFT
+    if len(frequencies) < terms * np.log2(N) / 2:
+        n = np.arange(N)
+        # Direct sum, by slices of tones to limit the memory
+        step = max(1, 2**20 // N)
+        for k in range(0, len(frequencies), step):
+            phase = np.multiply.outer(2 * np.pi * bins[k:k+step] / N, n)
+            phase += phases[k:k+step, np.newaxis]
+            out += amplitudes[k:k+step] @ np.sin(phase)
+        return out
+    # sin(theta) = Re(-j.exp(j.theta)) ; the half spectrum of a real
+    # signal holds the bins k and N-k (conjugated), halved except 0 and N/2
+    coefficient = -1j * amplitudes * np.exp(1j * (phases + np.pi * residual))
+    upper = integer > N // 2
+    folded = np.where(upper, N - integer, integer)
+    weight = np.where((folded == 0) | (2 * folded == N), 1.0, 0.5)
+    spectra = np.zeros((terms, N // 2 + 1), dtype=complex)
+    for p in range(terms):
+        np.add.at(spectra[p], folded, weight * np.where(upper, np.conj(coefficient), coefficient))
+        coefficient = coefficient * 2j * np.pi * residual / (p + 1)
+    signals = fft.irfft(spectra, n=N, axis=-1, norm='forward', workers=workers)
+    # Horner scheme of the Taylor series in n/N - 1/2
+    ramp = np.arange(N) / N - 0.5
+    out += signals[terms-1]
+    for p in range(terms-2, -1, -1):
+        out *= ramp
+        out += signals[p]
+    return out
+
+
+if __name__ == '__main__':
+    import time
+    Fe = 1e5
+    N = 2**16
+    # Comb of 5000 lines, not on the FFT bins
+    comb = 1000.3 + 7.7 * np.arange(5000)
+    synthesize_tones(comb, Fe, 1024)     # loads scipy.fft
+    start = time.perf_counter()
+    signal = synthesize_tones(comb, Fe, N, 1e-3)
+    print(f'IFFT synthesis : {(time.perf_counter()-start)*1e3:.1f} ms')
+    start = time.perf_counter()
+    reference = 1e-3 * np.sum(np.sin(2*np.pi*np.outer(comb[:500], np.arange(N)/Fe)), axis=0)
+    print(f'Direct sum (500 lines only) : {(time.perf_counter()-start)*1e3:.1f} ms')
+    check = synthesize_tones(comb[:500], Fe, N, 1e-3)
+    print(f'Error : {np.max(np.abs(check - reference)):.2e}')
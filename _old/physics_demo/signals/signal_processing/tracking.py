@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+Signal Processing libraries of functions
+Tracking of a few tones (Goertzel algorithm and sliding DFT)
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import numpy as np
+
+from ._lazy import lazy_import
+
+scipy_signal = lazy_import('scipy.signal')
+
+
+class GoertzelBank:
+    """
+    Bank of Goertzel filters : Fourier Transform of a signal at a few
+    frequencies, from the first sample given.
+
+    Each tone is a second order IIR filter (O(1) per sample), run by
+    scipy.signal.lfilter on each block. The state of the filters is kept
+    between blocks. The frequencies do not need to be on the FFT bins.
+    """
+
+    def __init__(self, frequencies, Fe):
+        """
+        Parameters
+        ----------
+        frequencies : 1-dimension vector - double
+            frequency of each tone.
+        Fe : double
+            sampling frequency.
+
+        """
+        self.frequencies = np.atleast_1d(np.asarray(frequencies, dtype=float))
+        self.Fe = Fe
+        self.omega = 2 * np.pi * self.frequencies / Fe
+        self.coefficients = [np.array([1, -2*np.cos(w), 1]) for w in self.omega]
+        self.reset()
+
+    def reset(self):
+        """
+        Clears the state of the filters
+        """
+        self.states = np.zeros((len(self.omega), 2))
+        self.last = np.zeros((len(self.omega), 2))     # s[n-1], s[n-2]
+        self.samples = 0
+
+    def update(self, block):
+        """
+        Adds a block of samples (O(K) per sample for K tones)
+
+        Parameters
+        ----------
+        block : 1-dimension vector - double
+            next samples of the signal.
+
+        """
+        if len(block) == 0:
+            return
+        for k, a in enumerate(self.coefficients):
+            s, self.states[k] = scipy_signal.lfilter([1.0], a, block, zi=self.states[k])
+            if len(s) > 1:
+                self.last[k] = s[-1], s[-2]
+            else:
+                self.last[k] = s[-1], self.last[k, 0]
+        self.samples += len(block)
+
+    def get_spectrum(self):
+        """
+        Returns the Fourier Transform sum_n x[n].exp(-j.w.n) at each
+        frequency, over all the samples given
+        """
+        y = self.last[:, 0] - np.exp(-1j * self.omega) * self.last[:, 1]
+        return y * np.exp(-1j * self.omega * (self.samples - 1))
+
+    def get_amplitudes(self):
+        """
+        Returns the amplitude of each tone
+        """
+        if self.samples == 0:
+            return np.zeros(len(self.omega))
+        amplitudes = 2 * np.abs(self.get_spectrum()) / self.samples
+        amplitudes[np.isclose(np.mod(self.omega, 2 * np.pi), 0)] /= 2
+        return amplitudes
+
+
+class SlidingDFT:
+    """
+    Sliding DFT : Fourier Transform of the last N samples of a signal
+    at a few bins k (frequencies k.Fe/N).
+
+    The transform of each bin is updated from the samples entering and
+    leaving the window, X = exp(j.2.pi.k/N).(X + x[n] - x[n-N]),
+    O(K) per sample. A block of L samples is applied at once with the
+    closed form of L steps of this recurrence.
+    """
+
+    def __init__(self, frequencies, Fe, N):
+        """
+        Parameters
+        ----------
+        frequencies : 1-dimension vector - double
+            frequency of each tone, rounded to the nearest bin k.Fe/N.
+        Fe : double
+            sampling frequency.
+        N : integer
+            number of samples of the window.
+
+        """
+        frequencies = np.atleast_1d(np.asarray(frequencies, dtype=float))
+        self.Fe = Fe
+        self.N = N
+        self.bins = np.round(frequencies * N / Fe).astype(int)
+        self.frequencies = self.bins * Fe / N
+        self.theta = 2 * np.pi * self.bins / N
+        self.twiddles = {}
+        self.reset()
+
+    def reset(self):
+        """
+        Clears the window (all samples at zero)
+        """
+        self.buffer = np.zeros(self.N)
+        self.position = 0
+        self.X = np.zeros(len(self.bins), dtype=complex)
+        self.samples = 0
+
+    def _get_twiddles(self, L):
+        """
+        Returns exp(j.theta.(L-i)), i = 0..L-1, cached by block size
+        """
+        if L not in self.twiddles:
+            self.twiddles[L] = np.exp(1j * np.outer(self.theta, np.arange(L, 0, -1)))
+        return self.twiddles[L]
+
+    def update(self, block):
+        """
+        Adds a block of samples (O(K) per sample for K tones)
+
+        Parameters
+        ----------
+        block : 1-dimension vector - double
+            next samples of the signal.
+
+        """
+        for start in range(0, len(block), self.N):
+            chunk = block[start:start+self.N]
+            L = len(chunk)
+            index = (self.position + np.arange(L)) % self.N
+            difference = chunk - self.buffer[index]
+            self.buffer[index] = chunk
+            self.position = (self.position + L) % self.N
+            self.X = np.exp(1j * self.theta * L) * self.X
+            self.X += self._get_twiddles(L) @ difference
+            self.samples += L
+
+    def get_spectrum(self):
+        """
+        Returns the DFT of the last N samples at each bin
+        (phase referenced to the first sample of the window)
+        """
+        return self.X
+
+    def get_amplitudes(self):
+        """
+        Returns the amplitude of each tone over the last N samples
+        """
+        amplitudes = 2 * np.abs(self.X) / self.N
+        amplitudes[self.bins % self.N == 0] /= 2
+        return amplitudes
+
+
+def track_tones(blocks, frequencies, Fe, N=None):
+    """
+    Tracks the amplitude of a few tones in a signal given by blocks,
+    without any FFT.
+
+    Parameters
+    ----------
+    blocks : iterable of 1-dimension vector - double
+        blocks of the signal (see iterate_blocks).
+    frequencies : 1-dimension vector - double
+        frequency of each tone.
+    Fe : double
+        sampling frequency.
+    N : integer, optional
+        number of samples of the sliding window (SlidingDFT).
+        The default is None : all the samples from the beginning
+        (GoertzelBank).
+
+    Yields
+    ------
+    samples : integer
+        number of samples processed.
+    amplitudes : 1-dimension vector - double
+        amplitude of each tone after the block.
+
+    """
+    if N is None:
+        tracker = GoertzelBank(frequencies, Fe)
+    else:
+        tracker = SlidingDFT(frequencies, Fe, N)
+    for block in blocks:
+        tracker.update(block)
+        yield tracker.samples, tracker.get_amplitudes()
+
+
+if __name__ == '__main__':
+    Fe = 10000
+    t = np.arange(100000) / Fe
+    signal = np.sin(2*np.pi*1000*t) + 0.5*np.sin(2*np.pi*1234.5*t)
+    signal[50000:] += 0.2*np.sin(2*np.pi*300*t[50000:])
+    goertzel = GoertzelBank([1000, 1234.5], Fe)
+    sliding = SlidingDFT([300, 1000], Fe, 5000)
+    for k in range(0, len(signal), 3333):
+        goertzel.update(signal[k:k+3333])
+        sliding.update(signal[k:k+3333])
+    print(f'Goertzel : {goertzel.get_amplitudes()}')
+    X = np.fft.fft(signal[-5000:])[sliding.bins]
+    print(f'Sliding DFT : {sliding.get_amplitudes()}, '
+          f'error {np.max(np.abs(sliding.get_spectrum() - X)):.2e}')
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+Signal Processing libraries of functions
+Window functions : batched windowed spectra, scalloping loss and ENBW
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+from functools import lru_cache
+import numpy as np
+
+from ._lazy import lazy_import
+from .spectral import WORKERS, get_frequencies
+from .stft import get_cached_window
+
+fft = lazy_import('scipy.fft')
+
+
+# Name of each window type in scipy.signal.get_window
+WINDOW_TYPES = {
+    'rectangular': 'boxcar',
+    'hann': 'hann',
+    'blackman-harris': 'blackmanharris',
+    'flat-top': 'flattop',
+    'kaiser': 'kaiser',
+}
+
+
+def _get_window_name(window, beta):
+    """ scipy.signal.get_window argument of a window type """
+    name = WINDOW_TYPES[window]
+    return ('kaiser', beta) if name == 'kaiser' else name
+
+
+@lru_cache(maxsize=16)
+def get_window_stack(windows, N, beta=8.6):
+    """
+    Returns several windows of N samples as a 2D array,
+    cached by (types, N)
+
+    Parameters
+    ----------
+    windows : tuple of string
+        types of window (keys of WINDOW_TYPES).
+    N : integer
+        number of samples.
+    beta : double, optional
+        parameter of the Kaiser window. The default is 8.6.
+
+    Returns
+    -------
+    stack : 2-dimension array - double
+        windows (types, N) (read-only).
+
+    """
+    stack = np.stack([get_cached_window(_get_window_name(w, beta), N)
+                      for w in windows])
+    stack.flags.writeable = False
+    return stack
+
+
+def window_metrics(window, N, beta=8.6):
+    """
+    Calculates the figures of merit of a window
+
+    Parameters
+    ----------
+    window : string
+        type of window (key of WINDOW_TYPES).
+    N : integer
+        number of samples.
+    beta : double, optional
+        parameter of the Kaiser window. The default is 8.6.
+
+    Returns
+    -------
+    metrics : dictionary
+        'coherent_gain' : mean of the window,
+        'enbw' : equivalent noise bandwidth in bins,
+        'scalloping_loss' : loss in dB of a tone halfway between two bins.
+
+    """
+    w = get_cached_window(_get_window_name(window, beta), N)
+    total = np.sum(w)
+    half_bin = np.abs(np.sum(w * np.exp(-1j * np.pi * np.arange(N) / N)))
+    return {'coherent_gain': total / N,
+            'enbw': N * np.sum(w**2) / total**2,
+            'scalloping_loss': -20 * np.log10(half_bin / total)}
+
+
+def calculate_windowed_spectra(signal, Fe, windows=tuple(WINDOW_TYPES),
+                               beta=8.6, workers=None):
+    """
+    Calculates the magnitude of the FFT of a real signal with several
+    windows at once, from {signal vector, sampling frequency}
+
+    The windowed signals are stacked and transformed in one 2D real FFT.
+    Each spectrum is normalized by the sum of its window : a sine of
+    amplitude A on a FFT bin gives a peak of A/2, as calculate_spectrum.
+
+    Parameters
+    ----------
+    signal : 1-dimension vector - double
+        signal vector.
+    Fe : double
+        sampling frequency.
+    windows : tuple of string, optional
+        types of window. The default is all the WINDOW_TYPES.
+    beta : double, optional
+        parameter of the Kaiser window. The default is 8.6.
+    workers : integer, optional
+        number of threads. The default is WORKERS.
+
+    Returns
+    -------
+    freq : 1-dimension vector - double
+        frequency vector, from 0 to Fe/2.
+    spectra : 2-dimension array - double
+        magnitude of the spectrum with each window (types, N//2+1).
+
+    """
+    if workers is None:
+        workers = WORKERS
+    N = len(signal)
+    stack = get_window_stack(tuple(windows), N, beta)
+    TF = fft.rfft(stack * signal, axis=-1, workers=workers)
+    spectra = np.abs(TF)
+    spectra /= np.sum(stack, axis=1, keepdims=True)
+    return get_frequencies(N, Fe), spectra
+
+
+if __name__ == '__main__':
+    Fe = 1000
+    N = 1000
+    t = np.arange(N) / Fe
+    # Tone halfway between two bins
+    freq, spectra = calculate_windowed_spectra(np.sin(2*np.pi*100.5*t), Fe)
+    for window, spectrum in zip(WINDOW_TYPES, spectra):
+        metrics = window_metrics(window, N)
+        print(f'{window:>16} : peak {np.max(spectrum):.3f}, '
+              f'ENBW {metrics["enbw"]:.2f} bins, '
+              f'scalloping loss {metrics["scalloping_loss"]:.2f} dB')
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+Signal Processing libraries of functions
+Zoom on a frequency band of a spectrum (Chirp-Z transform)
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+from functools import lru_cache
+import numpy as np
+
+from ._lazy import lazy_import
+from .spectral import WORKERS
+
+fft = lazy_import('scipy.fft')
+
+
+@lru_cache(maxsize=16)
+def get_czt_kernels(N, f_start, f_step, points):
+    """
+    Returns the chirps of the Chirp-Z transform (Bluestein algorithm),
+    cached by (N, band, points)
+
+    The spectrum X(f_start + k.f_step), k = 0..points-1, of a signal of
+    N samples is the convolution of the signal multiplied by a chirp
+    with a second chirp, computed by FFT.
+
+    Parameters
+    ----------
+    N : integer
+        number of samples of the signal.
+    f_start : double
+        first frequency, normalized by the sampling frequency.
+    f_step : double
+        frequency step, normalized by the sampling frequency.
+    points : integer
+        number of frequencies.
+
+    Returns
+    -------
+    pre : 1-dimension vector - complex
+        chirp applied to the signal (N).
+    kernel : 1-dimension vector - complex
+        FFT of the convolution chirp (nfft).
+    post : 1-dimension vector - complex
+        chirp applied to the result of the convolution (points).
+
+    """
+    nfft = fft.next_fast_len(N + points - 1)
+    n = np.arange(max(N, points), dtype=float)
+    chirp = np.exp(-1j * np.pi * f_step * n**2)
+    pre = chirp[:N] * np.exp(-2j * np.pi * f_start * n[:N])
+    post = chirp[:points].copy()
+    v = np.zeros(nfft, dtype=complex)
+    v[:points] = np.conj(chirp[:points])
+    v[nfft-N+1:] = np.conj(chirp[N-1:0:-1])
+    kernel = fft.fft(v)
+    for array in (pre, kernel, post):
+        array.flags.writeable = False
+    return pre, kernel, post
+
+
+def czt_band(signal, f_start, f_step, points, workers=None):
+    """
+    Calculates the Fourier Transform of a signal on a frequency band
+    with the Chirp-Z transform.
+
+    Parameters
+    ----------
+    signal : 1-dimension vector - double or complex
+        signal vector.
+    f_start : double
+        first frequency, normalized by the sampling frequency.
+    f_step : double
+        frequency step, normalized by the sampling frequency.
+    points : integer
+        number of frequencies.
+    workers : integer, optional
+        number of threads. The default is WORKERS.
+
+    Returns
+    -------
+    TF : 1-dimension vector - complex
+        Fourier Transform at frequencies f_start + k.f_step (not normalized).
+
+    """
+    if workers is None:
+        workers = WORKERS
+    N = len(signal)
+    pre, kernel, post = get_czt_kernels(N, f_start, f_step, points)
+    nfft = len(kernel)
+    y = fft.fft(signal * pre, nfft, workers=workers)
+    y *= kernel
+    y = fft.ifft(y, workers=workers, overwrite_x=True)
+    return y[:points] * post
+
+
+def zoom_spectrum(signal, Fe, f_min, f_max, points=1000, out=None, workers=None):
+    """
+    Calculates the magnitude of the Fourier Transform of a signal on the
+    band [f_min, f_max] from {signal vector, sampling frequency}
+
+    Only the required band is evaluated, with any number of points :
+    the resolution is not limited to Fe/N.
+
+    Parameters
+    ----------
+    signal : 1-dimension vector - double
+        signal vector.
+    Fe : double
+        sampling frequency.
+    f_min : double
+        first frequency of the band, between -Fe/2 and Fe/2.
+    f_max : double
+        last frequency of the band, between -Fe/2 and Fe/2.
+    points : integer, optional
+        number of frequencies. The default is 1000.
+    out : 1-dimension vector - double, optional
+        preallocated output array (points).
+    workers : integer, optional
+        number of threads. The default is WORKERS.
+
+    Returns
+    -------
+    freq : 1-dimension vector - double
+        frequency vector, from f_min to f_max.
+    spectrum : 1-dimension vector - double
+        magnitude of the Fourier Transform, normalized by the
+        number of samples.
+
+    """
+    N = len(signal)
+    f_step = (f_max - f_min) / (points - 1)
+    TF = czt_band(signal, f_min / Fe, f_step / Fe, points, workers)
+    if out is None:
+        out = np.empty(points)
+    np.abs(TF, out=out)
+    out /= N
+    freq = f_min + f_step * np.arange(points)
+    return freq, out
+
+
+def band_spectrum(signal, Fe, f_min, f_max, points=1000, workers=None):
+    """
+    Calculates the magnitude of the Fourier Transform of a signal on the
+    band [f_min, f_max], with a step at the resolution of the FFT (Fe/N)
+    or finer
+
+    A coarser grid than Fe/N misses the spectral lines, which fall between
+    two frequencies. The step is Fe/N divided by an integer, for at least
+    'points' frequencies, and the band is extended to multiples of this
+    step : the frequencies Fe.k/N of the FFT are in the grid. When the
+    step is Fe/N, the FFT of the signal is sliced (no Chirp-Z transform).
+
+    Parameters
+    ----------
+    signal : 1-dimension vector - double or complex
+        signal vector.
+    Fe : double
+        sampling frequency.
+    f_min : double
+        first frequency of the band, between -Fe/2 and Fe/2.
+    f_max : double
+        last frequency of the band, between -Fe/2 and Fe/2.
+    points : integer, optional
+        minimum number of frequencies. The default is 1000.
+    workers : integer, optional
+        number of threads. The default is WORKERS.
+
+    Returns
+    -------
+    freq : 1-dimension vector - double
+        frequency vector, from f_min to f_max (or slightly wider).
+    spectrum : 1-dimension vector - double
+        magnitude of the Fourier Transform, normalized by the
+        number of samples.
+
+    """
+    if workers is None:
+        workers = WORKERS
+    N = len(signal)
+    f_bin = Fe / N
+    # Frequencies per bin of the FFT : at least 1
+    oversampling = max(1, int(np.ceil((points - 1) * f_bin / (f_max - f_min) - 1e-9)))
+    f_step = f_bin / oversampling
+    first = int(np.floor(f_min / f_step + 1e-9))
+    last = int(np.ceil(f_max / f_step - 1e-9))
+    if oversampling > 1:
+        return zoom_spectrum(signal, Fe, first * f_step, last * f_step,
+                             last - first + 1, workers=workers)
+    first, last = max(first, -(N // 2)), min(last, N // 2)
+    bins = np.arange(first, last + 1)
+    if np.iscomplexobj(signal):
+        TF = fft.fft(signal, workers=workers)[bins % N]
+    else:
+        # Negative frequencies of a real signal : conjugate of the positive ones
+        TF = fft.rfft(signal, workers=workers)[np.abs(bins)]
+    spectrum = np.abs(TF)
+    spectrum /= N
+    return bins * f_bin, spectrum
+
+
+if __name__ == '__main__':
+    import time
+    Fe = 10000
+    t = np.arange(10000) / Fe
+    signal = np.sin(2*np.pi*1000.25*t) + 0.5*np.sin(2*np.pi*1001.5*t)
+    freq, spectrum = zoom_spectrum(signal, Fe, 995, 1005, 2001)
+    direct = np.abs(np.exp(-2j*np.pi*np.outer(freq/Fe, np.arange(len(signal)))) @ signal)
+    print(f'Error : {np.max(np.abs(spectrum - direct/len(signal))):.2e}')
+    print(f'Peak : {freq[np.argmax(spectrum)]} Hz')
+    start = time.perf_counter()
+    for k in range(100):
+        zoom_spectrum(signal, Fe, 995, 1005, 2001)
+    print(f'Zoom spectrum : {(time.perf_counter()-start)*10:.2f} ms')
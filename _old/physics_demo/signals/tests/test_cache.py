@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the computation cache (cache) and of the cached pipeline
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import numpy as np
+import pytest
+
+from signal_processing import (ComputationCache, get_nbytes, Pipeline, Stage,
+                               OscillatorSource, MixStage, SpectrumStage,
+                               DemodulateStage)
+
+
+def test_cache_lru():
+    cache = ComputationCache(max_bytes=3 * 8000)
+    for k in range(3):
+        cache.put(k, np.zeros(1000))
+    assert cache.get(0) is not None     # 0 becomes the most recent
+    cache.put(3, np.zeros(1000))
+    assert 1 not in cache and all(k in cache for k in (0, 2, 3))
+    assert cache.nbytes == 3 * 8000
+    # Too large : not kept
+    cache.put(4, np.zeros(4000))
+    assert 4 not in cache and len(cache) == 3
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_cache_shared_arrays():
+    # An array shared by several results is counted once
+    cache = ComputationCache(max_bytes=10**6, max_items=2)
+    signal = np.zeros(1000)
+    first = {'signal': signal}
+    cache.put('a', first)
+    cache.put('b', dict(first, spectrum=np.zeros(500)))
+    assert get_nbytes([signal, signal]) == 8000
+    assert cache.nbytes == 12000
+    with pytest.raises(ValueError):
+        signal[0] = 1
+    cache.put('c', np.zeros(10))
+    assert 'a' not in cache and cache.nbytes == 12080
+    cache.put('d', np.zeros(10))
+    assert cache.nbytes == 160
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0
+
+
+def test_cache_get_or_compute():
+    cache = ComputationCache()
+    calls = []
+    function = lambda x: calls.append(x) or np.full(3, x)
+    assert np.array_equal(cache.get_or_compute(('f', 2), function, 2), [2, 2, 2])
+    assert np.array_equal(cache.get_or_compute(('f', 2), function, 2), [2, 2, 2])
+    assert calls == [2]
+
+
+def build(cache, calls):
+    """ Pipeline of the AM demo, counting the calls of its last stage """
+    def count(frame):
+        calls.append(frame['spectrum'][1].max())
+        return frame
+    source = OscillatorSource([20, 200], 10000, 10000)
+    demod = DemodulateStage(200, 10000, decimation=12, cutoff=200, numtaps=201,
+                            phase=-np.pi/2, enabled=False)
+    stages = [MixStage('product'), SpectrumStage(-2400, 2400), demod,
+              SpectrumStage(-500, 500, key='iq', output='iq_spectrum', real=True,
+                            enabled=False),
+              Stage(count, cache_key=lambda: 'count')]
+    return Pipeline(source, stages, cache=cache), source, stages
+
+
+def events(source, stages):
+    for k in range(6):
+        for enabled in (True, False):
+            stages[2].configure(enabled=enabled)
+            stages[3].configure(enabled=enabled)
+            yield
+        source.configure(frequencies=[20 + k, 200])
+        yield
+        source.configure(frequencies=[20 + k, 200 + k % 2])
+        yield
+
+
+def test_pipeline_cache():
+    # Same frames with and without the cache, the stages after the last
+    # cached frame only are computed
+    calls, cached_calls = [], []
+    pipeline, *elements = build(None, calls)
+    cached, *cached_elements = build(ComputationCache(), cached_calls)
+    for _ in zip(events(*elements), events(*cached_elements)):
+        frame = pipeline.process()
+        cached_frame = cached.process()
+        assert frame.keys() == cached_frame.keys()
+        for key, value in frame.items():
+            if isinstance(value, np.ndarray):
+                assert np.array_equal(value, cached_frame[key])
+    assert len(cached_calls) < len(calls)
+    # Back to a previous state : the whole frame from the cache
+    cached_elements[0].configure(frequencies=[20, 200])
+    cached.process()
+    assert cached.from_cache and len(cached.cache) > 0
+
+
+def test_pipeline_cache_tones():
+    # A change of one frequency computes only one tone
+    pipeline, source, stages = build(ComputationCache(), [])
+    computed = []
+    first_tone = source._first_tone
+    source._first_tone = lambda f, a: computed.append(f) or first_tone(f, a)
+    pipeline.process()
+    source.configure(frequencies=[21, 200])
+    pipeline.process()
+    assert computed == [20, 200, 21]
+    assert source.configured and not stages[0].configured
+
+
+def test_pipeline_cache_continue():
+    # Frames after a cached frame : the skipped stages are run again
+    pipeline, *elements = build(ComputationCache(), [])
+    reference, *_ = build(None, [])
+    for p in (pipeline, reference):
+        p.process()
+    pipeline.process()
+    reference.process()
+    assert pipeline.from_cache
+    assert np.array_equal(pipeline.process(reset=False)['signal'],
+                          reference.process(reset=False)['signal'])
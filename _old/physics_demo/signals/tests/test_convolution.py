@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the convolution methods (convolution)
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import numpy as np
+import pytest
+
+from signal_processing import (CONVOLUTION_METHODS, convolve, convolve_direct,
+                               convolve_overlap_add, get_cost_model)
+
+
+@pytest.mark.parametrize('N, M', [(1000, 5), (1000, 200), (100000, 31),
+                                  (100000, 2001), (3, 1000)])
+@pytest.mark.parametrize('method', CONVOLUTION_METHODS + ['auto'])
+def test_convolve(N, M, method):
+    rng = np.random.default_rng(N + M)
+    x = rng.standard_normal(N)
+    h = rng.standard_normal(M)
+    assert np.allclose(convolve(x, h, method), np.convolve(x, h))
+
+
+def test_convolve_overlap_add_complex():
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal(10000) + 1j * rng.standard_normal(10000)
+    h = rng.standard_normal(100) + 1j * rng.standard_normal(100)
+    for nfft in (None, 198, 1000):
+        assert np.allclose(convolve_overlap_add(x, h, nfft), convolve_direct(x, h))
+    with pytest.raises(ValueError):
+        convolve_overlap_add(x, h, 128)
+
+
+def test_convolve_method_unknown():
+    with pytest.raises(ValueError):
+        convolve(np.ones(10), np.ones(3), 'winograd')
+
+
+def test_cost_model():
+    model = get_cost_model()
+    assert model.choose_method(1000, 3) == 'direct'
+    assert model.choose_method(10**6, 10**5) in ('fft', 'overlap-add')
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the IQ demodulator (demodulation)
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import numpy as np
+import scipy.signal
+
+from signal_processing import IQDemodulator, demodulate_iq, design_lowpass
+
+
+def test_demodulate_iq_envelope():
+    Fe = 10000
+    t = np.arange(5*Fe) / Fe
+    message = 1 + 0.5*np.sin(2*np.pi*5*t)
+    signal = message * np.cos(2*np.pi*1000*t + 0.3)
+    time, iq = demodulate_iq(signal, 1000, Fe, 100, 10, block_size=3001)
+    reference = 1 + 0.5*np.sin(2*np.pi*5*time)
+    steady = time > 0.1
+    assert np.max(np.abs(np.abs(iq) - reference)[steady]) < 1e-3
+    assert np.allclose(np.angle(iq[steady]), 0.3, atol=1e-3)
+
+
+def test_demodulator_polyphase():
+    # Same output as filtering at the full rate and keeping 1 sample of M
+    Fe = 8000
+    signal = np.random.default_rng(0).standard_normal(5000)
+    demodulator = IQDemodulator(1000, Fe, 300, decimation=4, numtaps=63)
+    iq = np.concatenate([demodulator.process(signal[k:k+777])
+                         for k in range(0, len(signal), 777)])
+    mixed = signal * np.exp(-2j*np.pi*1000*np.arange(len(signal))/Fe)
+    reference = 2 * scipy.signal.lfilter(design_lowpass(300, Fe, 63), 1, mixed)[::4]
+    assert np.allclose(iq, reference)
+    assert np.allclose(demodulator.get_time(len(iq)), np.arange(len(iq)) * 4 / Fe - 31 / Fe)
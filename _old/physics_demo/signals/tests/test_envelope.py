@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the min/max envelope pyramid (envelope)
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import numpy as np
+
+from signal_processing import EnvelopePyramid, decimate_minmax
+
+
+def get_signal():
+    x = np.arange(10**6) / 1e4
+    y = np.sin(2*np.pi*x) + np.random.default_rng(0).normal(0, 0.1, len(x))
+    return x, y
+
+
+def test_envelope_pyramid():
+    x, y = get_signal()
+    pyramid = EnvelopePyramid(x, y)
+    assert len(pyramid.levels) > 1
+    for x_min, x_max in [(0, 100), (10, 20), (15, 15.5), (99, 200)]:
+        xe, ye = pyramid.get_envelope(x_min, x_max, 1000)
+        assert len(xe) == len(ye) <= 4 * 1000 + 1
+        # The envelope keeps the extrema of the view (and of at most one
+        # bin around it)
+        view = (x >= x_min) & (x <= x_max)
+        assert ye.max() >= y[view].max() and ye.min() <= y[view].min()
+        assert set(ye) <= set(y)
+
+
+def test_envelope_pyramid_samples():
+    # Less than 2 samples per pixel : the samples themselves
+    x, y = get_signal()
+    xe, ye = EnvelopePyramid(x, y).get_envelope(1, 1.1, 1000)
+    view = slice(np.searchsorted(x, 1) - 1, np.searchsorted(x, 1.1, 'right') + 1)
+    assert np.array_equal(xe, x[view]) and np.array_equal(ye, y[view])
+
+
+def test_decimate_minmax():
+    x, y = get_signal()
+    xe, ye = decimate_minmax(x, y, 500)
+    assert len(ye) <= 4 * 500 + 1
+    assert ye.max() == y.max() and ye.min() == y.min()
+    assert xe[-1] == x[-1]
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the noise generator (noise)
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import numpy as np
+import pytest
+import scipy.signal
+
+from signal_processing import NoiseGenerator
+
+
+@pytest.mark.parametrize('color, slope', [('gaussian', 0), ('uniform', 0),
+                                          ('pink', -1), ('brown', -2)])
+def test_noise_colors(color, slope):
+    generator = NoiseGenerator(color, std=0.5, Fe=1e4, seed=0)
+    noise = np.concatenate(list(generator.blocks(2**20)))
+    assert len(noise) == 2**20
+    assert np.isclose(np.std(noise), 0.5, rtol=0.1)
+    f, psd = scipy.signal.welch(noise, 1e4, nperseg=4096)
+    fit = np.polyfit(np.log10(f[10:1000]), np.log10(psd[10:1000]), 1)[0]
+    assert abs(fit - slope) < 0.1
+
+
+def test_noise_seed():
+    first = np.concatenate(list(NoiseGenerator('pink', seed=3).blocks(10**5)))
+    second = np.concatenate(list(NoiseGenerator('pink', seed=3).blocks(10**5)))
+    assert np.array_equal(first, second)
+
+
+def test_noise_color_unknown():
+    with pytest.raises(ValueError):
+        NoiseGenerator('blue')
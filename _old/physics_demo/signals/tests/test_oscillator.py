@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the oscillator bank (oscillator)
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import numpy as np
+
+from signal_processing import OscillatorBank, generate_sinus_block
+
+
+def test_oscillator_blocks():
+    Fe = 10000
+    bank = OscillatorBank([100, 250, 1000], Fe, [1, 2, 0.5], [0, 1, 2], block_size=1000)
+    blocks = [bank.next_block().copy() for k in range(10)]
+    t = np.arange(10000) / Fe
+    reference = np.array([1, 2, 0.5])[:, np.newaxis] * \
+        np.sin(2*np.pi*np.outer([100, 250, 1000], t) + np.array([[0], [1], [2]]))
+    assert np.allclose(np.concatenate(blocks, axis=1), reference)
+    assert np.allclose(bank.get_time(), t[-1000:])
+
+
+def test_oscillator_frequency_change():
+    # The phase is continuous when the frequency changes
+    Fe = 1000
+    bank = OscillatorBank([10], Fe, block_size=100)
+    first = bank.next_block()[0].copy()
+    bank.set_frequencies([20])
+    second = bank.next_block()[0].copy()
+    n = np.arange(100)
+    assert np.allclose(first, np.sin(2*np.pi*10*n/Fe))
+    assert np.allclose(second, np.sin(2*np.pi*10*100/Fe + 2*np.pi*20*n/Fe))
+
+
+def test_oscillator_skip_and_reset():
+    bank = OscillatorBank([50, 70], 1000, block_size=64)
+    reference = OscillatorBank([50, 70], 1000, block_size=64)
+    reference.next_block()
+    bank.skip_block()
+    assert np.allclose(bank.next_block(), reference.next_block())
+    bank.reset()
+    first = OscillatorBank([50, 70], 1000, block_size=64).next_block()
+    assert np.allclose(bank.next_sum(), np.sum(first, axis=0))
+
+
+def test_oscillator_fm():
+    Fe = 1000
+    bank = OscillatorBank([100], Fe, block_size=500)
+    deviation = np.full(500, 20.0)
+    block = bank.next_block(fm=deviation)
+    assert np.allclose(block[0], np.sin(2*np.pi*120*np.arange(500)/Fe))
+
+
+def test_generate_sinus_block():
+    n = np.arange(300)
+    signal = generate_sinus_block([10, 40], 1000, 300, [1, 0.5])
+    assert np.allclose(signal, np.sin(2*np.pi*10*n/1000) + 0.5*np.sin(2*np.pi*40*n/1000))
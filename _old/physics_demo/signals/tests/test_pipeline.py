@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the streaming pipeline (pipeline)
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import numpy as np
+import scipy.signal
+
+from signal_processing import (Pipeline, Stage, OscillatorSource, FileSource,
+                               MixStage, FilterStage, SpectrumStage,
+                               DisplaySink, FileSink)
+
+
+def test_pipeline_run(tmp_path):
+    # Frames processed in order, filter continuous across the frames
+    data = np.random.default_rng(0).standard_normal(10000)
+    np.save(tmp_path / 'input.npy', data)
+    output = str(tmp_path / 'output.bin')
+    b = np.ones(8) / 8
+    pipeline = Pipeline(FileSource(str(tmp_path / 'input.npy'), 1000, 999),
+                        [FilterStage(b)], [FileSink(output)])
+    pipeline.start()
+    pipeline.thread.join(10)
+    assert not pipeline.running and pipeline.error is None
+    assert np.allclose(np.fromfile(output), scipy.signal.lfilter(b, 1, data))
+
+
+def test_pipeline_process():
+    Fe = 10000
+    source = OscillatorSource([50, 1000], Fe, block_size=1000)
+    display = DisplaySink()
+    pipeline = Pipeline(source, [MixStage('product'), SpectrumStage(-2000, 2000, 4001)],
+                        [display])
+    first = pipeline.process()
+    second = pipeline.process(reset=False)
+    t = np.arange(2000) / Fe
+    signal = np.sin(2*np.pi*50*t) * np.sin(2*np.pi*1000*t)
+    assert np.allclose(np.concatenate((first['signal'], second['signal'])), signal)
+    assert np.allclose(second['time'], t[1000:])
+    freq, spectrum = display.get()['spectrum']
+    assert np.allclose(spectrum[np.isin(freq, [950, 1050])], 0.25)
+    assert display.get() is None
+
+
+def test_stage_configure():
+    # Parameters applied before the next frame, then the stage is reset
+    calls = []
+
+    class Gain(Stage):
+        def __init__(self):
+            super().__init__()
+            self.gain = 1
+
+        def reset(self):
+            calls.append('reset')
+
+        def process(self, frame):
+            frame['signal'] = frame['signal'] * self.gain
+            return frame
+
+    stage = Gain()
+    stage.configure(gain=3)
+    assert stage.gain == 1
+    frame = stage({'signal': np.ones(4)})
+    assert np.array_equal(frame['signal'], 3 * np.ones(4))
+    assert calls == ['reset']
+    stage.configure(enabled=False)
+    assert np.array_equal(stage({'signal': np.ones(4)})['signal'], np.ones(4))
+
+
+def test_display_sink_notify():
+    notified = []
+    display = DisplaySink(lambda: notified.append(True))
+    display({'signal': 1})
+    display({'signal': 2})
+    assert len(notified) == 1
+    assert display.get()['signal'] == 2
+    display({'signal': 3})
+    assert len(notified) == 2
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the Welch PSD estimator (psd)
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import numpy as np
+import scipy.signal
+
+from signal_processing import WelchPSD, welch_psd
+
+
+def test_welch_psd_scipy():
+    Fe = 10000
+    noise = np.random.default_rng(0).normal(0, 0.1, 10*Fe)
+    freq, psd, rms = welch_psd(noise, Fe, chunk_size=3000)
+    f_ref, psd_ref = scipy.signal.welch(noise, Fe, nperseg=1024)
+    assert np.allclose(freq, f_ref)
+    assert np.allclose(psd, psd_ref, rtol=1e-10, atol=0)
+    assert np.isclose(rms, 0.1, rtol=0.02)
+
+
+def test_welch_psd_chunks():
+    Fe = 1000
+    t = np.arange(20000) / Fe
+    signal = np.sin(2*np.pi*100*t) + np.random.default_rng(1).normal(0, 0.01, len(t))
+    estimator = WelchPSD(Fe, 256, overlap=64)
+    for k in range(0, len(signal), 777):
+        estimator.update(signal[k:k+777])
+    freq, psd = estimator.get_psd()
+    f_ref, psd_ref = scipy.signal.welch(signal, Fe, nperseg=256, noverlap=64)
+    assert np.allclose(psd, psd_ref, rtol=1e-10, atol=0)
+    assert abs(freq[np.argmax(psd)] - 100) < Fe / 256
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the sinc reconstruction and the rational resampler (resampling)
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import numpy as np
+import pytest
+
+from signal_processing import sinc_reconstruct, resample_rational
+
+
+def test_sinc_reconstruct():
+    Ts = 0.5
+    t = np.arange(-20, 20, Ts)
+    samples = np.sinc(0.8 * t)
+    t_out, signal = sinc_reconstruct(samples, t[0], Ts, -10, 0.01, 2001)
+    assert np.allclose(t_out, -10 + 0.01 * np.arange(2001))
+    assert np.max(np.abs(signal - np.sinc(0.8*t_out))) < 1e-4
+    # On the samples, the reconstruction gives the samples
+    t_out, signal = sinc_reconstruct(samples, t[0], Ts, -10, Ts, 41)
+    assert np.allclose(signal, np.sinc(0.8 * t_out))
+
+
+@pytest.mark.parametrize('up, down', [(3, 2), (2, 3), (160, 147), (4, 2)])
+def test_resample_rational(up, down):
+    Fe = 1000
+    x = np.sin(2*np.pi*50*np.arange(10000)/Fe)
+    y = resample_rational(x, up, down, chunk_size=1000)
+    assert len(y) == -(-len(x) * up // down)
+    reference = np.sin(2*np.pi*50*np.arange(len(y))*down/up/Fe)
+    assert np.max(np.abs(y - reference)[100:-100]) < 1e-4
+
+
+def test_resample_rational_identity():
+    x = np.random.default_rng(0).standard_normal(100)
+    y = resample_rational(x, 5, 5)
+    assert np.array_equal(x, y) and y is not x
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the FFT functions (signal_processing, spectral)
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import numpy as np
+
+from signal_processing import calculate_FFT_1D, calculate_rFFT_1D, calculate_spectrum
+
+
+def test_calculate_FFT_1D_two_sided():
+    rng = np.random.default_rng(0)
+    signal = rng.standard_normal(1001) + 1j * rng.standard_normal(1001)
+    freq, TF = calculate_FFT_1D(signal, 500)
+    assert np.allclose(TF, np.fft.fft(signal) / len(signal))
+    assert np.allclose(freq, np.fft.fftfreq(len(signal), 1/500))
+
+
+def test_calculate_rFFT_1D():
+    signal = np.random.default_rng(1).standard_normal(1000)
+    freq, TF = calculate_rFFT_1D(signal, 1000)
+    assert np.allclose(TF, np.fft.rfft(signal) / len(signal))
+    assert np.allclose(freq, np.fft.rfftfreq(len(signal), 1/1000))
+
+
+def test_calculate_spectrum_two_sided():
+    for N in (1000, 1001):
+        signal = np.random.default_rng(N).standard_normal(N)
+        freq, spectrum = calculate_spectrum(signal, 1000, two_sided=True)
+        reference = np.fft.fftshift(np.abs(np.fft.fft(signal))) / N
+        assert np.allclose(spectrum, reference)
+        assert np.allclose(freq, np.fft.fftshift(np.fft.fftfreq(N, 1/1000)))
+
+
+def test_calculate_spectrum_peak():
+    Fe = 1000
+    t = np.arange(1000) / Fe
+    freq, spectrum = calculate_spectrum(np.sin(2*np.pi*50*t), Fe)
+    assert freq[np.argmax(spectrum)] == 50
+    assert np.isclose(np.max(spectrum), 0.5)
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the streaming histogram and moments (statistics)
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import numpy as np
+import scipy.stats
+
+from signal_processing import (NoiseStatistics, StreamingHistogram, fit_gaussian,
+                               calculate_noise_statistics)
+
+
+def test_noise_statistics():
+    x = np.random.default_rng(0).standard_normal(10**6) * 2 + 1
+    statistics = NoiseStatistics(-10, 10, 200)
+    for chunk in np.array_split(x, 7):
+        statistics.update(chunk)
+    counts, _ = np.histogram(x, statistics.histogram.edges)
+    assert np.array_equal(counts, statistics.histogram.counts)
+    moments = statistics.moments
+    assert np.isclose(moments.mean, np.mean(x))
+    assert np.isclose(moments.get_std(), np.std(x))
+    assert np.isclose(moments.get_skewness(), scipy.stats.skew(x))
+    assert np.isclose(moments.get_kurtosis(), scipy.stats.kurtosis(x))
+    assert np.allclose(fit_gaussian(statistics.histogram), (1, 2), rtol=0.01, atol=0.01)
+
+
+def test_statistics_merge():
+    x = np.random.default_rng(1).uniform(-1, 3, 10**5)
+    first, second = NoiseStatistics(0, 2, 50), NoiseStatistics(0, 2, 50)
+    first.update(x[:30000])
+    second.update(x[30000:])
+    merged = first.merge(second).get_summary()
+    assert merged['count'] == len(x)
+    assert np.isclose(merged['std'], np.std(x))
+    assert (merged['min'], merged['max']) == (x.min(), x.max())
+    histogram = first.histogram
+    assert histogram.underflow == np.sum(x < 0) and histogram.overflow == np.sum(x >= 2)
+
+
+def test_streaming_histogram_density():
+    histogram = StreamingHistogram(0, 1, 10)
+    histogram.update(np.linspace(0, 0.999, 1000))
+    centers, density = histogram.get_density()
+    assert np.allclose(centers, np.arange(10) / 10 + 0.05)
+    assert np.allclose(density, 1)
+
+
+def test_calculate_noise_statistics():
+    statistics = calculate_noise_statistics(10**6, -6, 6, 128, std=2.0, seed=0,
+                                            block_size=2**16, max_workers=1)
+    summary = statistics.get_summary()
+    assert summary['count'] == 10**6
+    assert np.isclose(summary['std'], 2, rtol=0.01)
+    again = calculate_noise_statistics(10**6, -6, 6, 128, std=2.0, seed=0,
+                                       block_size=2**16, max_workers=1)
+    assert np.array_equal(statistics.histogram.counts, again.histogram.counts)
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the streaming STFT (stft)
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import numpy as np
+import pytest
+import scipy.signal
+
+from signal_processing import iterate_blocks, stft_stream, stft_frequencies
+
+
+def get_stft(blocks, Fe, nperseg, **kargs):
+    results = list(stft_stream(blocks, Fe, nperseg, **kargs))
+    return (np.concatenate([time for time, _ in results]),
+            np.concatenate([columns for _, columns in results], axis=1))
+
+
+def test_stft_stream_frames():
+    Fe = 1000
+    signal = np.random.default_rng(0).standard_normal(5000)
+    time, columns = get_stft(iterate_blocks(signal, 777), Fe, 256)
+    window = scipy.signal.get_window('hann', 256)
+    frames = np.lib.stride_tricks.sliding_window_view(signal, 256)[::128]
+    reference = np.abs(np.fft.rfft(frames * window, axis=-1)).T / np.sum(window)
+    assert np.allclose(columns, reference)
+    assert np.allclose(time, (np.arange(len(frames)) * 128 + 128) / Fe)
+
+
+def test_stft_stream_chirp():
+    Fe = 10000
+    t = np.arange(10*Fe) / Fe
+    chirp = np.sin(2*np.pi*(100 + 200*t)*t)
+    freq = stft_frequencies(512, Fe)
+    time, columns = get_stft(iterate_blocks(chirp, 3000), Fe, 512, batch=16)
+    # Instantaneous frequency 100 + 400.t
+    assert np.all(np.abs(freq[np.argmax(columns, axis=0)] - (100 + 400*time)) < 2*Fe/512)
+
+
+def test_stft_stream_hop():
+    with pytest.raises(ValueError):
+        list(stft_stream([np.zeros(1000)], 1000, 256, hop=300))
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the multi-tone synthesis (synthesis)
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import numpy as np
+import pytest
+
+from signal_processing import synthesize_tones
+
+
+def direct_sum(frequencies, Fe, N, amplitudes, phases):
+    n = np.arange(N)
+    return amplitudes @ np.sin(2*np.pi*np.outer(frequencies, n)/Fe + phases[:, np.newaxis])
+
+
+@pytest.mark.parametrize('N', [4096, 4097])
+@pytest.mark.parametrize('on_bins', [True, False])
+def test_synthesize_tones(N, on_bins):
+    rng = np.random.default_rng(N)
+    Fe = 1e4
+    if on_bins:
+        frequencies = rng.integers(0, N, 400) * Fe / N
+    else:
+        frequencies = rng.uniform(-Fe, 2*Fe, 400)
+    amplitudes = rng.uniform(0, 1, 400)
+    phases = rng.uniform(0, 2*np.pi, 400)
+    signal = synthesize_tones(frequencies, Fe, N, amplitudes, phases)
+    reference = direct_sum(frequencies, Fe, N, amplitudes, phases)
+    assert np.max(np.abs(signal - reference)) < 400 * 1e-10
+
+
+def test_synthesize_tones_few():
+    # A few tones are summed directly
+    out = np.ones(1000)
+    signal = synthesize_tones([10.3, 123.4], 1000, 1000, [1, 0.5], out=out)
+    assert signal is out
+    reference = direct_sum(np.array([10.3, 123.4]), 1000, 1000, np.array([1, 0.5]), np.zeros(2))
+    assert np.allclose(signal, reference)
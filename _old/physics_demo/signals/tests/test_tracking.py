@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the tone trackers (tracking) and of ToneTrackingStage
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import numpy as np
+
+from signal_processing import (GoertzelBank, SlidingDFT, track_tones,
+                               ToneTrackingStage, iterate_blocks)
+
+Fe = 10000
+
+
+def get_signal():
+    t = np.arange(100000) / Fe
+    signal = np.sin(2*np.pi*1000*t) + 0.5*np.sin(2*np.pi*1234.5*t)
+    signal[50000:] += 0.2*np.sin(2*np.pi*300*t[50000:])
+    return signal
+
+
+def test_goertzel_amplitudes():
+    signal = get_signal()
+    goertzel = GoertzelBank([1000, 1234.5, 0], Fe)
+    for k in range(0, len(signal), 3333):
+        goertzel.update(signal[k:k+3333])
+    assert goertzel.samples == len(signal)
+    assert np.allclose(goertzel.get_amplitudes()[:2], [1, 0.5], atol=1e-3)
+    # Same Fourier Transform as a direct sum, off the FFT bins
+    n = np.arange(len(signal))
+    direct = np.exp(-2j*np.pi*np.outer(goertzel.frequencies / Fe, n)) @ signal
+    assert np.allclose(goertzel.get_spectrum(), direct)
+
+
+def test_sliding_dft():
+    signal = get_signal()
+    sliding = SlidingDFT([300, 1000], Fe, 5000)
+    for k in range(0, len(signal), 3333):
+        sliding.update(signal[k:k+3333])
+    X = np.fft.fft(signal[-5000:])[sliding.bins]
+    assert np.allclose(sliding.get_spectrum(), X)
+    assert np.allclose(sliding.get_amplitudes(), [0.2, 1], atol=1e-3)
+
+
+def test_track_tones():
+    signal = get_signal()
+    results = list(track_tones(iterate_blocks(signal, 10000), [300], Fe, 5000))
+    samples = [s for s, _ in results]
+    amplitudes = np.array([a[0] for _, a in results])
+    assert samples == list(range(10000, 100001, 10000))
+    assert np.all(amplitudes[:5] < 1e-3) and np.allclose(amplitudes[5:], 0.2, atol=1e-3)
+
+
+def test_tone_tracking_stage():
+    signal = get_signal()
+    stage = ToneTrackingStage([1000, 1234.5])
+    tracker = None
+    for block in iterate_blocks(signal, 5000):
+        frame = stage({'signal': block, 'Fe': Fe})
+        # The bank of filters is kept between frames
+        assert tracker is None or stage.tracker is tracker
+        tracker = stage.tracker
+    assert tracker.samples == len(signal)
+    assert np.allclose([a for _, a in frame['tones_amplitudes']], [1, 0.5], atol=1e-3)
+    stage.reset()
+    assert stage.tracker is tracker and tracker.samples == 0
+    stage.configure(frequencies=[300])
+    stage.update()
+    frame = stage({'signal': signal[50000:], 'Fe': Fe})
+    assert frame['tones_amplitudes'][0][0] == 300
+    assert np.isclose(frame['tones_amplitudes'][0][1], 0.2, atol=1e-3)
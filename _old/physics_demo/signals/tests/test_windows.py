@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the windowed spectra and window figures of merit (windows)
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import numpy as np
+import scipy.signal
+
+from signal_processing import WINDOW_TYPES, window_metrics, calculate_windowed_spectra
+
+
+def test_windowed_spectra():
+    Fe = 1000
+    signal = np.random.default_rng(0).standard_normal(1000)
+    freq, spectra = calculate_windowed_spectra(signal, Fe)
+    assert spectra.shape == (len(WINDOW_TYPES), 501)
+    for window, spectrum in zip(WINDOW_TYPES, spectra):
+        name = WINDOW_TYPES[window]
+        w = scipy.signal.get_window(('kaiser', 8.6) if name == 'kaiser' else name, 1000)
+        assert np.allclose(spectrum, np.abs(np.fft.rfft(w * signal)) / np.sum(w))
+
+
+def test_window_metrics():
+    # Tone halfway between two bins : peak of 1/2 reduced by the scalloping loss
+    Fe = 1000
+    t = np.arange(1000) / Fe
+    freq, spectra = calculate_windowed_spectra(np.sin(2*np.pi*100.5*t), Fe)
+    for window, spectrum in zip(WINDOW_TYPES, spectra):
+        metrics = window_metrics(window, 1000)
+        loss = -20 * np.log10(2 * np.max(spectrum))
+        assert abs(loss - metrics['scalloping_loss']) < 0.05
+    assert np.isclose(window_metrics('rectangular', 1000)['enbw'], 1)
+    assert np.isclose(window_metrics('hann', 1000)['enbw'], 1.5)
+    assert np.isclose(window_metrics('hann', 1000)['coherent_gain'], 0.5)
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the zoom on a band with the chirp-Z transform (zoom)
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+
+import numpy as np
+
+from signal_processing import zoom_spectrum, band_spectrum
+
+
+def dft(signal, freq, Fe):
+    n = np.arange(len(signal))
+    return np.exp(-2j*np.pi*np.outer(freq/Fe, n)) @ signal / len(signal)
+
+
+def test_zoom_spectrum():
+    Fe = 10000
+    t = np.arange(10000) / Fe
+    signal = np.sin(2*np.pi*1000.25*t) + 0.5*np.sin(2*np.pi*1001.5*t)
+    freq, spectrum = zoom_spectrum(signal, Fe, 995, 1005, 2001)
+    assert np.allclose(freq, np.linspace(995, 1005, 2001))
+    assert np.allclose(spectrum, np.abs(dft(signal, freq, Fe)), atol=1e-10)
+    assert abs(freq[np.argmax(spectrum)] - 1000.25) < 0.1
+
+
+def test_band_spectrum():
+    Fe = 1000
+    signal = np.random.default_rng(0).standard_normal(500)
+    for f_min, f_max, points in [(-200, 300, 100), (-200, 300, 501), (100, 110, 200), (100, 110, 21)]:
+        freq, spectrum = band_spectrum(signal, Fe, f_min, f_max, points)
+        assert len(freq) >= points
+        assert freq[0] <= f_min and freq[-1] >= f_max
+        # The frequencies of the FFT are in the grid
+        step = Fe / len(signal)
+        assert np.isclose((step / (freq[1] - freq[0])) % 1, 0)
+        assert np.allclose(spectrum, np.abs(dft(signal, freq, Fe)), atol=1e-10)
@@ -15,6 +15,7 @@ from PyQt5.QtWidgets import (QMainWindow, QApplication, QWidget,
 
 import graphicalLEnsE as gL
 import systemSimu as sS
+import fast_response as fr
 import control as ct
 
 
@@ -124,7 +125,7 @@ class MainWindow(QMainWindow):
         self.cphdBack.asignal.connect(self.updateFC)
         
         ''' model for simulation '''
-        self.simu = sS.systemSimulation()
+        self.simu = fr.fastSimulation(sS.systemSimulation())
         self.phDsys = sS.photodetection()
         
     def updateFC(self, sig):
@@ -145,29 +146,33 @@ class MainWindow(QMainWindow):
         
         nbSignal = 6
         
-        timeData = np.zeros((samplesT, nbSignal))
-        timeSignal = np.ones((samplesT, nbSignal))
         timeDataZ = np.zeros((samplesT, nbSignal))
         timeSignalZ = np.ones((samplesT, nbSignal))
-        freqData = np.zeros((samplesT, nbSignal))
-        freqSignalM = np.ones((samplesT, nbSignal))
+        
+        # Values of the controls : keys of the models in the cache
+        aliInit = (self.gainALI.getUserValue(), self.gbwALI.getUserValue())
+        ali = (self.gainALI.getRealValue(), self.gbwALI.getRealValue())
+        backInit = (self.cCBack.getUserValue(), self.cphdBack.getUserValue(),
+                    self.reBack.getUserValue(), self.rtBack.getUserValue())
+        back = (self.cCBack.getRealValue(), self.cphdBack.getRealValue(),
+                self.reBack.getRealValue(), self.rtBack.getRealValue())
+        keys = [('AOP',) + aliInit, ('AOP',) + ali,
+                ('simple',) + ali + backInit, ('simple',) + ali + back,
+                ('complete',) + aliInit + backInit, ('complete',) + ali + back]
+        models = []
         
         ''' Open Loop ALI '''
         # Initial model - text 
         self.phDsys.AOP.setGain(self.gainALI.getUserValue())
         self.phDsys.AOP.setGBW(self.gbwALI.getUserValue())
-        self.aliInitTF = self.phDsys.AOP.transferFunction()
-        self.simu.setModel(self.aliInitTF)
-        timeData[:,0], timeSignal[:,0] = self.simu.timeResponse()
-        freqData[:,0], freqSignalM[:,0], freqSignalInitP = self.simu.freqResponse()
+        self.aliInitTF = self.simu.cachedModel(keys[0], self.phDsys.AOP.transferFunction)
+        models.append(self.aliInitTF)
         
         # Slider model
         self.phDsys.AOP.setGain(self.gainALI.getRealValue())
         self.phDsys.AOP.setGBW(self.gbwALI.getRealValue())
-        self.aliTF = self.phDsys.AOP.transferFunction()
-        self.simu.setModel(self.aliTF)
-        timeData[:,1], timeSignal[:,1] = self.simu.timeResponse()
-        freqData[:,1], freqSignalM[:,1], freqSigP = self.simu.freqResponse()
+        self.aliTF = self.simu.cachedModel(keys[1], self.phDsys.AOP.transferFunction)
+        models.append(self.aliTF)
 
         ''' FeedBack '''
         # Init
@@ -175,22 +180,15 @@ class MainWindow(QMainWindow):
         self.phDsys.setCphd(self.cphdBack.getUserValue()*1e-12)
         self.phDsys.setRe(self.reBack.getUserValue())
         self.phDsys.setRt(self.rtBack.getUserValue())
-        sysTF = self.phDsys.transferFunctionSimple()
-        self.simu.setModel(sysTF)
-        timeData[:,2], timeSignal[:,2] = self.simu.timeResponse()
-        freqData[:,2], freqSignalM[:,2], freqSigP = self.simu.freqResponse()
+        sysTF = self.simu.cachedModel(keys[2], self.phDsys.transferFunctionSimple)
+        models.append(sysTF)
         # Slider
         self.phDsys.setCe(self.cCBack.getRealValue()*1e-12)
         self.phDsys.setCphd(self.cphdBack.getRealValue()*1e-12)
         self.phDsys.setRe(self.reBack.getRealValue())
         self.phDsys.setRt(self.rtBack.getRealValue())
-        sysTF = self.phDsys.transferFunctionSimple()
-        self.simu.setModel(sysTF)
-        timeData[:,3], timeSignal[:,3] = self.simu.timeResponse()
-        freqData[:,3], freqSignalM[:,3], freqSigP = self.simu.freqResponse()
-        
-        freqSignalM[:,2] = freqSignalM[:,2] / 100
-        freqSignalM[:,3] = freqSignalM[:,3] / 100
+        sysTF = self.simu.cachedModel(keys[3], self.phDsys.transferFunctionSimple)
+        models.append(sysTF)
         
         ''' Complete System '''
         self.phDsys.AOP.setGain(self.gainALI.getUserValue())
@@ -199,10 +197,8 @@ class MainWindow(QMainWindow):
         self.phDsys.setCphd(self.cphdBack.getUserValue()*1e-12)
         self.phDsys.setRe(self.reBack.getUserValue())
         self.phDsys.setRt(self.rtBack.getUserValue())
-        sysCompletTF = self.phDsys.transferFunction()
-        self.simu.setModel(sysCompletTF)
-        timeData[:,4], timeSignal[:,4] = self.simu.timeResponse()
-        freqData[:,4], freqSignalM[:,4], freqSigP = self.simu.freqResponse()
+        sysCompletTF = self.simu.cachedModel(keys[4], self.phDsys.transferFunction)
+        models.append(sysCompletTF)
         
         self.phDsys.AOP.setGain(self.gainALI.getRealValue())
         self.phDsys.AOP.setGBW(self.gbwALI.getRealValue())
@@ -210,13 +206,13 @@ class MainWindow(QMainWindow):
         self.phDsys.setCphd(self.cphdBack.getRealValue()*1e-12)
         self.phDsys.setRe(self.reBack.getRealValue())
         self.phDsys.setRt(self.rtBack.getRealValue())       
-        sysCompletTF = self.phDsys.transferFunction()
-        self.simu.setModel(sysCompletTF)
-        timeData[:,5], timeSignal[:,5] = self.simu.timeResponse()
-        freqData[:,5], freqSignalM[:,5], freqSigP = self.simu.freqResponse()
-                
-        freqSignalM[:,4] = freqSignalM[:,4] / 100
-        freqSignalM[:,5] = freqSignalM[:,5] / 100
+        sysCompletTF = self.simu.cachedModel(keys[5], self.phDsys.transferFunction)
+        models.append(sysCompletTF)
+        
+        # All the models in one batch : one column of each matrix by model
+        timeData, timeSignal = self.simu.batchTimeResponse(models, keys)
+        freqData, freqSignalM, freqSignalP = self.simu.batchFreqResponse(models, keys)
+        freqSignalM[:,2:] = freqSignalM[:,2:] / 100
 
         return timeData, timeSignal, timeDataZ, timeSignalZ, freqData, freqSignalM
     
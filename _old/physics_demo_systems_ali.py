@@ -15,6 +15,7 @@ from PyQt5.QtWidgets import (QMainWindow, QApplication, QWidget,
 
 import graphicalLEnsE as gL
 import systemSimu as sS
+import fast_response as fr
 import control as ct
 
 '''
@@ -115,7 +116,7 @@ class MainWindow(QMainWindow):
         self.order1fcFeedBack.asignal.connect(self.updateFeedback)
         
         ''' model for simulation '''
-        self.simu = sS.systemSimulation()
+        self.simu = fr.fastSimulation(sS.systemSimulation())
         self.aliModel = sS.compALI()
         self.order1ModelLP = sS.firstOrderSystem()
         
@@ -166,20 +167,13 @@ class MainWindow(QMainWindow):
         
         ''' Open Loop ALI '''
         # Initial model - text 
-        self.aliModel.setGain(self.gainALI.getUserValue())
-        self.aliModel.setGBW(self.gbwALI.getUserValue())
-        self.aliInitTF = self.aliModel.transferFunction()
-        self.simu.setModel(self.aliInitTF)
-        timeData[:,0], timeSignal[:,0] = self.simu.timeResponse()
-        freqData[:,0], freqSignalM[:,0], freqSignalInitP = self.simu.freqResponse()
-        
+        self.aliInitKey, self.aliInitTF = self.aliTransferFunction(
+            self.gainALI.getUserValue(), self.gbwALI.getUserValue())
         # Slider model
-        self.aliModel.setGain(self.gainALI.getRealValue())
-        self.aliModel.setGBW(self.gbwALI.getRealValue())
-        self.aliTF = self.aliModel.transferFunction()
-        self.simu.setModel(self.aliTF)
-        timeData[:,1], timeSignal[:,1] = self.simu.timeResponse()
-        freqData[:,1], freqSignalM[:,1], freqSigP = self.simu.freqResponse()
+        self.aliKey, self.aliTF = self.aliTransferFunction(
+            self.gainALI.getRealValue(), self.gbwALI.getRealValue())
+        self.simulate([self.aliInitKey, self.aliKey], [self.aliInitTF, self.aliTF], 
+                      timeData[:,:2], timeSignal[:,:2], freqData[:,:2], freqSignalM[:,:2])
 
 
         ''' FeedBack Loop - Control '''
@@ -187,97 +181,74 @@ class MainWindow(QMainWindow):
             
             # Initial model - text 
             self.gainFB = self.gainFeedBack.getUserValue()
-            self.modelInitFB = ct.tf([self.gainFB],[1])
-            self.simu.setModel(self.modelInitFB)
-            timeData[:,2], timeSignal[:,2] = self.simu.timeResponse()
-            freqData[:,2], freqSignalM[:,2], freqSignalInitFBP = self.simu.freqResponse()
+            initKey = ('gain', self.gainFB)
+            self.modelInitFB = self.simu.cachedModel(initKey, lambda: ct.tf([self.gainFB],[1]))
                 
             # Slider model
             self.gainFB = self.gainFeedBack.getRealValue()
-            self.modelFB = ct.tf([self.gainFB],[1])
-            self.simu.setModel(self.modelFB)
-            timeData[:,3], timeSignal[:,3] = self.simu.timeResponse()
-            freqData[:,3], freqSignalM[:,3], freqSigFBP = self.simu.freqResponse()
-            
-            ## Control system
-            self.closedLoopInit = ct.feedback(self.aliInitTF, self.modelInitFB)
-            self.closedLoop = ct.feedback(self.aliTF, self.modelFB)
-            self.simu.setModel(self.closedLoopInit)
-            timeData[:,4], timeSignal[:,4] = self.simu.timeResponse()
-            freqData[:,4], freqSignalM[:,4], freqSigInitCLP = self.simu.freqResponse()
-            self.simu.setModel(self.closedLoop)
-            timeData[:,5], timeSignal[:,5] = self.simu.timeResponse()
-            freqData[:,5], freqSignalM[:,5], freqSigCLP = self.simu.freqResponse()
+            key = ('gain', self.gainFB)
+            self.modelFB = self.simu.cachedModel(key, lambda: ct.tf([self.gainFB],[1]))
             
-            ## Zoom figure
-            self.simu.setTimeParams(0, 0.001, samplesT)
-            self.aliModel.setGain(self.gainALI.getRealValue())
-            self.aliModel.setGBW(self.gbwALI.getRealValue())
-            self.aliTF = self.aliModel.transferFunction()
-            self.simu.setModel(self.aliTF)
-            timeDataZ[:,1], timeSignalZ[:,1] = self.simu.timeResponse()
-            
-            self.gainFB = self.gainFeedBack.getRealValue()
-            self.modelFB = ct.tf([self.gainFB],[1])
-            self.simu.setModel(self.modelFB)
-            timeDataZ[:,3], timeSignalZ[:,3] = self.simu.timeResponse()
-            
-            self.closedLoop = ct.feedback(self.aliTF, self.modelFB)
-            self.simu.setModel(self.closedLoop)
-            timeDataZ[:,5], timeSignalZ[:,5] = self.simu.timeResponse()
+            self.updateControl(initKey, key, True, samplesT, timeData, timeSignal, 
+                               timeDataZ, timeSignalZ, freqData, freqSignalM)
             
         
         if(self.order1FeedBackLabel.isChecked()): # Order 1 model 
             # Initial model - text 
             self.gainFB = self.order1gainFeedBack.getUserValue()
-            self.order1ModelLP.setGain(self.gainFB)
             self.fc = self.order1fcFeedBack.getUserValue()
-            self.order1ModelLP.setCutFreq(self.fc)
-            self.modelInitFB = self.order1ModelLP.transferFunction()
-            self.simu.setModel(self.modelInitFB)
-            timeData[:,2], timeSignal[:,2] = self.simu.timeResponse()
-            freqData[:,2], freqSignalM[:,2], freqSignalInitFBP = self.simu.freqResponse()
+            initKey, self.modelInitFB = self.order1TransferFunction(self.gainFB, self.fc)
                 
             # Slider model
             self.gainFB = self.order1gainFeedBack.getRealValue()
-            self.order1ModelLP.setGain(self.gainFB)
             self.fc = self.order1fcFeedBack.getRealValue()
-            self.order1ModelLP.setCutFreq(self.fc)            
-            self.modelFB = self.order1ModelLP.transferFunction()
-            self.simu.setModel(self.modelInitFB)
-            timeData[:,3], timeSignal[:,3] = self.simu.timeResponse()
-            freqData[:,3], freqSignalM[:,3], freqSigFBP = self.simu.freqResponse()
-            
-            ''' A CHANGER !!! '''
-            ## Control system
-            self.closedLoopInit = ct.feedback(self.aliInitTF, self.modelInitFB)
-            self.closedLoop = ct.feedback(self.aliTF, self.modelFB)
-            self.simu.setModel(self.closedLoopInit)
-            timeData[:,4], timeSignal[:,4] = self.simu.timeResponse()
-            freqData[:,4], freqSignalM[:,4], freqSigInitCLP = self.simu.freqResponse()
-            self.simu.setModel(self.closedLoop)
-            timeData[:,5], timeSignal[:,5] = self.simu.timeResponse()
-            freqData[:,5], freqSignalM[:,5], freqSigCLP = self.simu.freqResponse()
-            
-            ## Zoom figure
-            self.simu.setTimeParams(0, 0.001, samplesT)
-            self.aliModel.setGain(self.gainALI.getRealValue())
-            self.aliModel.setGBW(self.gbwALI.getRealValue())
-            self.aliTF = self.aliModel.transferFunction()
-            self.simu.setModel(self.aliTF)
-            timeDataZ[:,1], timeSignalZ[:,1] = self.simu.timeResponse()
+            key, self.modelFB = self.order1TransferFunction(self.gainFB, self.fc)
             
-            self.gainFB = self.gainFeedBack.getRealValue()
-            self.modelFB = ct.tf([self.gainFB],[1])
-            self.simu.setModel(self.modelFB)
-            timeDataZ[:,3], timeSignalZ[:,3] = self.simu.timeResponse()
-            
-            self.closedLoop = ct.feedback(self.aliTF, self.modelFB)
-            self.simu.setModel(self.closedLoop)
-            timeDataZ[:,5], timeSignalZ[:,5] = self.simu.timeResponse()
+            # The graph shows the initial model in the column of the slider model
+            self.updateControl(initKey, key, False, samplesT, timeData, timeSignal, 
+                               timeDataZ, timeSignalZ, freqData, freqSignalM)
         
         return timeData, timeSignal, timeDataZ, timeSignalZ, freqData, freqSignalM
     
+    def updateControl(self, initKey, key, sliderShown, samplesT, timeData, timeSignal, 
+                      timeDataZ, timeSignalZ, freqData, freqSignalM):
+        ''' Feedback and closed loop columns, and zoom figure '''
+        ## Control system
+        closedLoopInitKey = ('closedLoop', self.aliInitKey, initKey)
+        self.closedLoopInit = self.simu.cachedModel(closedLoopInitKey, 
+            lambda: ct.feedback(self.aliInitTF, self.modelInitFB))
+        closedLoopKey = ('closedLoop', self.aliKey, key)
+        self.closedLoop = self.simu.cachedModel(closedLoopKey, 
+            lambda: ct.feedback(self.aliTF, self.modelFB))
+        shownKey, shownFB = (key, self.modelFB) if sliderShown else (initKey, self.modelInitFB)
+        self.simulate([initKey, shownKey, closedLoopInitKey, closedLoopKey],
+                      [self.modelInitFB, shownFB, self.closedLoopInit, self.closedLoop],
+                      timeData[:,2:], timeSignal[:,2:], freqData[:,2:], freqSignalM[:,2:])
+        
+        ## Zoom figure
+        self.simu.setTimeParams(0, 0.001, samplesT)
+        timeDataZ[:,1::2], timeSignalZ[:,1::2] = self.simu.batchTimeResponse(
+            [self.aliTF, self.modelFB, self.closedLoop], [self.aliKey, key, closedLoopKey])
+    
+    def simulate(self, keys, models, timeData, timeSignal, freqData, freqSignalM):
+        ''' Responses of the models, in the columns of the matrices '''
+        timeData[:], timeSignal[:] = self.simu.batchTimeResponse(models, keys)
+        freqData[:], freqSignalM[:], _ = self.simu.batchFreqResponse(models, keys)
+    
+    def aliTransferFunction(self, gain, gbw):
+        ''' ALI model, built once for each value of the controls '''
+        self.aliModel.setGain(gain)
+        self.aliModel.setGBW(gbw)
+        key = ('ALI', gain, gbw)
+        return key, self.simu.cachedModel(key, self.aliModel.transferFunction)
+    
+    def order1TransferFunction(self, gain, fc):
+        ''' Order 1 feedback model, built once for each value of the controls '''
+        self.order1ModelLP.setGain(gain)
+        self.order1ModelLP.setCutFreq(fc)
+        key = ('order1', gain, fc)
+        return key, self.simu.cachedModel(key, self.order1ModelLP.transferFunction)
+    
     def updateGraph(self, timeData, timeSignal, timeDataZ, timeSignalZ, freqData, freqSignalM):
         # Step response
         self.graphT.setData(timeData, timeSignal)
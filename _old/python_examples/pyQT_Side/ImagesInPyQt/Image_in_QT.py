@@ -13,15 +13,19 @@ Version : 1.0 - 2023-03-08
 
 #   Libraries to import
 # Graphical interface
-from PyQt5 import QtGui
 from PyQt5.QtWidgets import ( QApplication, QMainWindow )
 from PyQt5.uic import loadUi
-from PyQt5.QtGui import QPixmap, QImage
 
 # Standard
 import numpy as np
 import cv2
 import sys
+import os
+
+# NumPy to QImage conversion of the LEnsE GUI applications (gui.qimage_conversion)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 
+                                '..', '..', '..', '..', 'progs', 'photonics', 'diffraction_airy'))
+from gui.qimage_conversion import QImageConverter
 
 #-----------------------------------------------------------------------------------------------
 
@@ -47,6 +51,10 @@ class MainWindow(QMainWindow):
         self.refreshBt.clicked.connect(self.refreshGraph)
         self.closeBt.clicked.connect(self.closeApp)
 
+        # Image conversion (buffers reused from one frame to the next)
+        self.converter = QImageConverter()
+        self.rng = np.random.default_rng()
+
         self.refreshGraph()
         
     def refreshGraph(self):
@@ -61,12 +69,8 @@ class MainWindow(QMainWindow):
         print("refresh")
         
         #image=cv2.imread('python.png')
-        image = np.random.randint(255, size=(144, 144),dtype=np.uint8)
-        print(type(image))
-        image = QImage(image, image.shape[1],image.shape[0], image.shape[1], QImage.Format_Grayscale8)
-
-        pix = QPixmap(image)
-        self.cameraDisplay.setPixmap(QtGui.QPixmap(pix))
+        image = self.rng.integers(255, size=(144, 144), dtype=np.uint8)
+        self.cameraDisplay.setPixmap(self.converter.to_pixmap(image))
                 
     
     
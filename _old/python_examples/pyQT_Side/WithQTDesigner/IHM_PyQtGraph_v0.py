@@ -14,7 +14,10 @@ import numpy as np
 import pyqtgraph as pg
 
 data = np.random.normal(size=1000)
-pg.plot(data, title="Simplest possible plotting example")
+plotWidget = pg.plot(data, title="Simplest possible plotting example")
+# Long signals : only the min/max of each pixel of the visible range is drawn
+plotWidget.setDownsampling(auto=True, mode='peak')
+plotWidget.setClipToView(True)
 
 #data = np.random.normal(size=(500,500))
 #pg.image(data, title="Simplest possible image example")
@@ -37,19 +37,24 @@ class MainWindow(QtWidgets.QMainWindow):
         self.mainLayout.addWidget(self.plotWidget)
         
         self.x = np.linspace(0, SAMPLES, SAMPLES)
-        self.data = np.random.random_sample(size=SAMPLES)
+        self.rng = np.random.default_rng()
+        self.data = self.rng.random(SAMPLES)
 
         self.plotWidget.setBackground('w')
         self.plotWidget.setYRange(0, 1, padding=0)
+        # Long signals : only the min/max of each pixel of the visible range is drawn
+        self.plotWidget.setDownsampling(auto=True, mode='peak')
+        self.plotWidget.setClipToView(True)
 
         self.pen = pg.mkPen(color=(255, 0, 0), width=5)
         self.plot1 = self.plotWidget.plot(self.x, self.data, pen=self.pen)
         
     def refreshGraph(self):
         print("refresh")
-        self.plotWidget.removeItem(self.plot1)
-        self.data = np.random.random_sample(size=SAMPLES)
-        self.plot1 = self.plotWidget.plot(self.x, self.data, pen=self.pen)
+        # Same curve and same array : new values, no new plot item
+        self.rng.random(out=self.data)
+        self.plot1.setData(self.x, self.data)
+        # See strip_chart.py for a real-time scrolling version
 
     def closeEvent(self, event):
         QApplication.quit()
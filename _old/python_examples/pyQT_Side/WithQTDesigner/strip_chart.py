@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+Real-time scrolling plot (strip chart) with pyQtGraph in PyQt5
+
+The samples are kept in a preallocated circular buffer. The curve is
+never rebuilt : at each frame, the two segments of the buffer (oldest
+and newest samples) are given to two persistent curves, as views
+without any copy.
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Created on 19/oct/2026
+
+@author: julien.villemejane
+"""
+
+import time
+import numpy as np
+import pyqtgraph as pg
+
+from PyQt5 import QtCore
+from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel
+
+import sys
+
+
+class RingBuffer:
+    """
+    Circular buffer of samples, preallocated.
+    """
+
+    def __init__(self, capacity, dtype=float):
+        """
+        Parameters
+        ----------
+        capacity : integer
+            maximum number of samples kept.
+        dtype : numpy dtype, optional
+            type of the samples. The default is float.
+
+        """
+        self.data = np.zeros(capacity, dtype=dtype)
+        self.capacity = capacity
+        self.position = 0       # index of the next sample to write
+        self.count = 0          # number of valid samples
+
+    def clear(self):
+        self.position = 0
+        self.count = 0
+
+    def append(self, samples):
+        """
+        Adds samples at the end of the buffer (the oldest are overwritten)
+        """
+        n = len(samples)
+        if n >= self.capacity:
+            self.data[:] = samples[-self.capacity:]
+            self.position = 0
+            self.count = self.capacity
+            return
+        first = min(n, self.capacity - self.position)
+        self.data[self.position:self.position+first] = samples[:first]
+        self.data[:n-first] = samples[first:]
+        self.position = (self.position + n) % self.capacity
+        self.count = min(self.count + n, self.capacity)
+
+    def get_segments(self):
+        """
+        Returns the valid samples as two views (no copy) :
+        the oldest samples, then the newest ones.
+        """
+        if self.count < self.capacity:
+            return self.data[:0], self.data[:self.count]
+        return self.data[self.position:], self.data[:self.position]
+
+
+class SyntheticSource:
+    """
+    Local source of samples, at a given sampling frequency : each call to
+    read gives the samples produced since the previous call (sine wave
+    and gaussian noise).
+    """
+
+    def __init__(self, Fe=1e6, frequency=50.0, noise=0.1, seed=None,
+                 max_block=2**20):
+        """
+        Parameters
+        ----------
+        Fe : double, optional
+            sampling frequency. The default is 1e6 (1 MS/s).
+        frequency : double, optional
+            frequency of the sine wave. The default is 50.0.
+        noise : double, optional
+            standard deviation of the noise. The default is 0.1.
+        seed : integer, optional
+            seed of the noise. The default is None.
+        max_block : integer, optional
+            maximum number of samples given by one call. The default is 2**20.
+
+        """
+        self.Fe = Fe
+        self.omega = 2 * np.pi * frequency / Fe
+        self.noise = noise
+        self.rng = np.random.default_rng(seed)
+        self.buffer = np.empty(max_block)
+        self.index = np.arange(max_block, dtype=float)
+        self.samples = 0
+        self.start = time.perf_counter()
+
+    def read(self):
+        """
+        Returns the samples produced since the last call
+        (view on an internal buffer, overwritten by the next call)
+        """
+        expected = int((time.perf_counter() - self.start) * self.Fe)
+        n = min(expected - self.samples, len(self.buffer))
+        block = self.buffer[:n]
+        self.rng.standard_normal(out=block)
+        block *= self.noise
+        phase = self.omega * self.samples
+        block += np.sin(self.omega * self.index[:n] + phase)
+        self.samples = expected
+        return block
+
+
+class StripChartWidget(pg.PlotWidget):
+    """
+    Scrolling plot of the last {duration} seconds of a signal.
+    """
+
+    def __init__(self, duration=1.0, Fe=1e6, pen=None, parent=None):
+        """
+        Parameters
+        ----------
+        duration : double, optional
+            displayed duration in seconds. The default is 1.0.
+        Fe : double, optional
+            sampling frequency. The default is 1e6.
+        pen : pyqtgraph pen, optional
+            pen of the curve.
+
+        """
+        super().__init__(parent=parent)
+        self.setBackground('w')
+        self.Fe = Fe
+        capacity = int(duration * Fe)
+        self.buffer = RingBuffer(capacity)
+        # Time axis, the newest sample at 0 s
+        self.time = (np.arange(capacity) - capacity + 1) / Fe
+        self.setXRange(self.time[0], 0, padding=0)
+        self.setLabel('bottom', 'Time (s)')
+        pen = pen if pen is not None else pg.mkPen(color=(255, 0, 0), width=1)
+        # One persistent curve for each segment of the ring buffer
+        self.curves = [self.plot(pen=pen), self.plot(pen=pen)]
+        for curve in self.curves:
+            curve.setDownsampling(auto=True, method='peak')
+            curve.setClipToView(True)
+            curve.setSkipFiniteCheck(True)
+
+    def append(self, samples):
+        self.buffer.append(samples)
+
+    def refresh(self):
+        """
+        Updates the curves with the content of the buffer
+        """
+        older, newer = self.buffer.get_segments()
+        count = len(older) + len(newer)
+        start = len(self.time) - count
+        self.curves[0].setData(self.time[start:start+len(older)], older)
+        self.curves[1].setData(self.time[start+len(older):], newer)
+
+
+"""
+MainWindow class : strip chart fed by a synthetic source
+"""
+class MainWindow(QMainWindow):
+
+    def __init__(self, Fe=1e6, fps=60):
+        super().__init__(parent=None)
+        self.setWindowTitle('Strip chart')
+        widget = QWidget()
+        layout = QVBoxLayout()
+        widget.setLayout(layout)
+        self.setCentralWidget(widget)
+        self.chart = StripChartWidget(duration=1.0, Fe=Fe)
+        self.chart.setYRange(-1.5, 1.5, padding=0)
+        layout.addWidget(self.chart)
+        self.rateLabel = QLabel('')
+        layout.addWidget(self.rateLabel)
+
+        self.source = SyntheticSource(Fe)
+        self.frames = 0
+        self.received = 0
+        self.last = time.perf_counter()
+        self.timer = QtCore.QTimer()
+        self.timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self.timer.timeout.connect(self.refreshGraph)
+        self.timer.start(int(1000 / fps))
+
+    def refreshGraph(self):
+        samples = self.source.read()
+        self.chart.append(samples)
+        self.chart.refresh()
+        self.frames += 1
+        self.received += len(samples)
+        now = time.perf_counter()
+        if now - self.last > 1:
+            duration = now - self.last
+            self.rateLabel.setText(f'{self.frames / duration:.1f} fps - '
+                                   f'{self.received / duration / 1e6:.2f} MS/s')
+            self.frames = 0
+            self.received = 0
+            self.last = now
+
+    def closeEvent(self, event):
+        self.timer.stop()
+        QApplication.quit()
+
+
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    main = MainWindow()
+    main.show()
+    sys.exit(app.exec_())
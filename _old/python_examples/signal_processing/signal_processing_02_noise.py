@@ -8,6 +8,8 @@ Version : 1.0 - 2022-12-14
 """
 
 from signal_processing import generate_sinus_freq, calculate_FFT_1D, generate_noise, generate_sinus_time
+from signal_processing import welch_psd
+from signal_processing import NoiseStatistics, calculate_noise_statistics, fit_gaussian, gaussian_pdf
 import matplotlib.pyplot as plt
 import numpy as np
 
@@ -45,12 +47,49 @@ plt.show()
 
 # Calculate FFT of the noise
 f, tf_mod = calculate_FFT_1D(noise, 1e4)
+# Power Spectral Density of the noise (Welch method)
+f_psd, psd_noise, rms_noise = welch_psd(noise, 1e4, nperseg=256)
 plt.figure()
+plt.subplot(1, 2, 1)
 plt.plot(f, np.abs(tf_mod))
 plt.title('Fourier Transform of the noise')
+plt.xlabel('Frequency (Hz)')
+plt.subplot(1, 2, 2)
+plt.semilogy(f_psd, psd_noise)
+plt.title(f'PSD of the noise - {rms_noise:.3f} Vrms')
+plt.xlabel('Frequency (Hz)')
+plt.ylabel('PSD (V2/Hz)')
 plt.show()
 
 # Histogram of the noise signal
+noise_stats = NoiseStatistics(-1, 1, 100)
+noise_stats.update(noise)
+centers, density = noise_stats.histogram.get_density()
+summary = noise_stats.get_summary()
+mean_fit, std_fit = fit_gaussian(noise_stats.histogram)
+plt.figure()
+plt.bar(centers, density, width=centers[1]-centers[0], label='Noise')
+plt.plot(centers, gaussian_pdf(centers, mean_fit, std_fit), 'r', label='Gaussian fit')
+plt.title(f'Histogram of the noise - mean {summary["mean"]:.3f} / std {summary["std"]:.3f}\n'
+          f'skewness {summary["skewness"]:.3f} / kurtosis {summary["kurtosis"]:.3f}')
+plt.xlabel('Amplitude (V)')
+plt.ylabel('Probability density')
+plt.legend()
+plt.show()
+
+# Histogram of a long gaussian noise (10^8 samples, in parallel processes)
+if __name__ == '__main__':
+    long_stats = calculate_noise_statistics(10**8, -5, 5, 200, std=1.0, seed=0)
+    centers, density = long_stats.histogram.get_density()
+    mean_fit, std_fit = fit_gaussian(long_stats.histogram)
+    plt.figure()
+    plt.semilogy(centers, density, '.')
+    plt.semilogy(centers, gaussian_pdf(centers, mean_fit, std_fit), 'r')
+    plt.title(f'Histogram of a gaussian noise - {long_stats.moments.count:.0e} samples\n'
+              f'kurtosis {long_stats.moments.get_kurtosis():.4f}')
+    plt.xlabel('Amplitude (V)')
+    plt.ylabel('Probability density')
+    plt.show()
 
 
 # Display of the noisy signal
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Physics Demo / Tests of the fast step and frequency responses
+(fast_response), against a reference simulation by python-control
+
+Run from _old : python -m pytest tests
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Version : 1.1 - 2026-10-19
+"""
+import os
+import sys
+import numpy as np
+import control as ct
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fast_response import fastSimulation, getCoefficients
+
+
+class referenceSimulation:
+    """
+    Simulation with the calls of systemSimu.systemSimulation : linear
+    time grid, logarithmic frequency grid, all the responses computed by
+    python-control
+    """
+
+    def __init__(self, hertz=True, degrees=True, offset=0.0):
+        self.hertz = hertz
+        self.degrees = degrees
+        self.offset = offset
+        self.calls = 0
+
+    def setTimeParams(self, start, stop, samples):
+        self.time = np.linspace(start, stop, samples)
+
+    def setFreqParams(self, start, stop, samples):
+        self.freq = np.logspace(start, stop, samples)
+
+    def setModel(self, model):
+        self.model = model
+
+    def timeResponse(self):
+        self.calls += 1
+        time, signal = ct.step_response(self.model, self.time)
+        return time, np.ravel(signal) + self.offset
+
+    def freqResponse(self):
+        self.calls += 1
+        omega = 2 * np.pi * self.freq if self.hertz else self.freq
+        response = np.ravel(self.model(1j * omega))
+        phase = np.unwrap(np.angle(response))
+        return self.freq, np.abs(response), np.degrees(phase) if self.degrees else phase
+
+
+MODELS = [ct.tf([10], [1e-4, 1]), ct.tf([0.5], [1]), ct.tf([1], [1e-3, 1e-1, 1]),
+          ct.feedback(ct.tf([10], [1e-4, 1]), ct.tf([0.4], [1e-3, 1])),
+          ct.tf([1], [1e-6, 3e-4, 3e-2, 1]), ct.tf([1, 0], [1e-2, 1]),
+          ct.ss(ct.tf([1], [1e-2, 1]))]
+
+
+def setParams(*simulations):
+    for simu in simulations:
+        simu.setTimeParams(0, 0.1, 1001)
+        simu.setFreqParams(0, 6, 1001)
+
+
+@pytest.mark.parametrize('hertz, degrees', [(True, True), (False, False)])
+def test_responses(hertz, degrees):
+    # Fast path : same responses as the simulation
+    simu = referenceSimulation(hertz, degrees)
+    fast = fastSimulation(referenceSimulation(hertz, degrees))
+    setParams(simu, fast)
+    for model in MODELS:
+        simu.setModel(model)
+        fast.setModel(model)
+        t, s = simu.timeResponse()
+        time, signal = fast.timeResponse()
+        assert np.allclose(time, t)
+        assert np.max(np.abs(signal - s)) < 1e-6 * np.max(np.abs(s))
+        f, m, p = simu.freqResponse()
+        freq, magnitude, phase = fast.freqResponse()
+        assert np.allclose(freq, f)
+        assert np.allclose(magnitude, m, rtol=1e-9)
+        assert np.allclose(phase, p, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize('hertz, degrees', [(True, True), (False, False)])
+def test_batch_responses(hertz, degrees):
+    # Batched responses : same as the simulation of each model
+    simu = referenceSimulation(hertz, degrees)
+    fast = fastSimulation(referenceSimulation(hertz, degrees))
+    setParams(simu, fast)
+    time, signal = fast.batchTimeResponse(MODELS)
+    freq, magnitude, phase = fast.batchFreqResponse(MODELS)
+    for k, model in enumerate(MODELS):
+        simu.setModel(model)
+        t, s = simu.timeResponse()
+        assert np.allclose(time[:, k], t)
+        assert np.max(np.abs(signal[:, k] - s)) < 1e-6 * np.max(np.abs(s))
+        f, m, p = simu.freqResponse()
+        assert np.allclose(freq[:, k], f)
+        assert np.allclose(magnitude[:, k], m, rtol=1e-9)
+        assert np.allclose(phase[:, k], p, rtol=1e-9, atol=1e-9)
+        # Same responses, model by model
+        fast.setModel(model)
+        assert np.allclose(fast.timeResponse()[1], signal[:, k])
+        assert np.allclose(fast.freqResponse()[1], magnitude[:, k])
+
+
+def test_batch_threshold():
+    fast = fastSimulation(referenceSimulation(), batchThreshold=10)
+    batched = fastSimulation(referenceSimulation(), batchThreshold=1)
+    setParams(fast, batched)
+    assert np.allclose(fast.batchTimeResponse(MODELS)[1],
+                       batched.batchTimeResponse(MODELS)[1], atol=1e-9)
+
+
+def test_calibration_fallback():
+    # Another convention of the simulation : its own responses are used
+    simu = referenceSimulation(offset=0.1)
+    fast = fastSimulation(simu)
+    setParams(fast)
+    assert fast.getTimeGrid() is None
+    assert fast.getFreqGrid() is not None
+    fast.setModel(MODELS[2])
+    simu.setModel(MODELS[2])
+    assert np.array_equal(fast.timeResponse()[1], simu.timeResponse()[1])
+    _, signal = fast.batchTimeResponse(MODELS[:3])
+    assert np.array_equal(signal[:, 2], simu.timeResponse()[1])
+
+
+def test_cached_responses():
+    simu = referenceSimulation()
+    fast = fastSimulation(simu)
+    setParams(fast)
+    built = []
+    keys = [('model', k) for k in range(len(MODELS))]
+    models = [fast.cachedModel(key, lambda: built.append(key) or model)
+              for key, model in zip(keys, MODELS)]
+    _, signal = fast.batchTimeResponse(models, keys)
+    _, magnitude, _ = fast.batchFreqResponse(models, keys)
+    calls = simu.calls
+    signal[:] = 0       # the cached responses are copies
+    models = [fast.cachedModel(key, lambda: built.append(key)) for key in keys]
+    _, cached = fast.batchTimeResponse(models, keys)
+    _, cachedMagnitude, _ = fast.batchFreqResponse(models, keys)
+    assert simu.calls == calls and len(built) == len(MODELS)
+    fast.setModel(MODELS[3])
+    assert np.allclose(cached[:, 3], fast.timeResponse()[1])
+    assert np.array_equal(cachedMagnitude, magnitude)
+    # Responses keyed by the grid
+    fast.setTimeParams(0, 0.001, 1001)
+    _, signal = fast.batchTimeResponse(models[:1], keys[:1])
+    assert not np.allclose(signal[:, 0], cached[:, 0])
+
+
+def test_getCoefficients():
+    num, den = getCoefficients(ct.tf([2, 0], [0, 1e-2, 1]))
+    assert np.array_equal(num, [2, 0]) and np.array_equal(den, [1e-2, 1])
+    assert getCoefficients(ct.tf([1, 0, 0], [1, 1])) is None
+    num, den = getCoefficients(ct.ss(ct.tf([1], [2, 1])))
+    assert np.allclose(num / den[-1], [0, 1]) and np.allclose(den / den[-1], [2, 1])
+    assert getCoefficients(ct.tf([1], [1, 1]), maxOrder=0) is None
+    assert getCoefficients(ct.tf([1], [1, 1], 0.1)) is None
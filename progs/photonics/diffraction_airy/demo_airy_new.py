@@ -35,6 +35,8 @@ from gui.params_widget import ParamsWidget
 from gui.slice_params_widget import SliceParamsWidget
 from process.image_slice import ImageSlice
 from process.airy import AiryDisc
+from process.profile_alignment import ProfileAlignment
+from process.ring_analysis import RingAnalysis
 
 
 # -------------------------------
@@ -63,6 +65,8 @@ class MainWindow(QMainWindow):
         
         self.image_slice = ImageSlice()
         self.airy_simulation = AiryDisc()
+        self.profile_alignment = ProfileAlignment()
+        self.ring_analysis = RingAnalysis()
         
         # Define Window title
         self.setWindowTitle("LEnsE - Demo of Airy Disc")
@@ -167,8 +171,11 @@ class MainWindow(QMainWindow):
         x_axis_d = x_lin
         if mean.size != 0:
             y_list.append(mean)
+        self.refresh_rings(y_list[-1])
         if self.simulation :
             dist, diam, wale, pixw = self.params_area.get_data()
+            if self.slice_params.is_auto_align():
+                g_pos = self.align_graph(y_list[-1], diam, dist, wale, pixw)
             # X Axis
             min_ax = (-(self.image_width)-g_pos)/2*pixw*1e-6
             max_ax = ((self.image_width)-g_pos)/2*pixw*1e-6
@@ -181,6 +188,39 @@ class MainWindow(QMainWindow):
             self.graph_area.set_x_label('Position in um')
         self.graph_area.set_data(x_axis_d, y_list)
 
+    def refresh_rings(self, profile):
+        """
+        Detect the rings of the measured profile and display
+        the estimated resolution under the graph.
+        """
+        lambda_z_d = self.ring_analysis.process(profile)
+        if lambda_z_d == 0:
+            self.graph_area.set_info('No ring detected')
+            return
+        radius = self.ring_analysis.get_first_ring_radius()
+        text = f'1.22 λz/D = {radius:.1f} px'
+        if self.simulation:
+            dist, diam, wale, pixw = self.params_area.get_data()
+            est_diam = self.ring_analysis.get_diameter(pixw, dist, wale)
+            est_wale = self.ring_analysis.get_wavelength(pixw, dist, diam)
+            text += f' = {radius*pixw:.1f} um'
+            text += f' / Estimated D = {est_diam:.3f} mm'
+            text += f' / Estimated λ = {est_wale:.0f} nm'
+        self.graph_area.set_info(text)
+
+    def align_graph(self, profile, diam, dist, wale, pixw) -> float:
+        """
+        Find the graph position that aligns the simulated Airy disc
+        on the measured profile and update the graph position slider.
+        """
+        # Simulated disc centered on the slice (g_pos = 0)
+        max_ax = self.image_width/2*pixw*1e-6
+        x_axis = np.linspace(-max_ax, max_ax, self.image_width)
+        centered_disc = self.airy_simulation.get_j(x_axis, diam, dist, wale)
+        g_pos = self.profile_alignment.get_graph_position(profile, centered_disc)
+        g_pos = round(g_pos, 1)
+        self.slice_params.set_graph_position(g_pos, signal=False)
+        return g_pos
     
     def params_changed(self, event):
         try:
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""Demo of imaging through a circular pupil
+
+Simulation of the image of an object (test target) given by an
+optical system limited by diffraction (Airy disc).
+
+This GUI is developped in Python 3 and is based on
+PyQt6 for graphical objects.
+
+---------------------------------------
+(c) 2026 - LEnsE - Institut d'Optique
+---------------------------------------
+
+Modifications
+-------------
+    Creation on 2026/10/19
+
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Created on 19/oct/2026
+
+@author: julien.villemejane
+"""
+
+# Libraries to import
+import sys
+import numpy as np
+from PyQt6.QtWidgets import QApplication, QMainWindow, QGridLayout, QWidget
+import cv2
+
+from gui.title_widget import TitleWidget
+from gui.open_widget import OpenFileWidget
+from gui.image_widget import ImageWidget
+from gui.params_widget import ParamsWidget
+from process.imaging_simulation import ImagingSimulation
+
+
+# -------------------------------
+
+class MainWindow(QMainWindow):
+    """
+    Our main window.
+
+    Args:
+        QMainWindow (class): QMainWindow can contain several widgets.
+    """
+
+    def __init__(self):
+        """
+        Initialisation of the main Window.
+        """
+        super().__init__()
+
+        self.image_name = ''
+        self.image = None
+        self.imaging_simulation = ImagingSimulation()
+
+        # Define Window title
+        self.setWindowTitle("LEnsE - Demo of Imaging / Airy Disc")
+        self.setGeometry(50, 50, 500, 400)
+        # Main Widget
+        self.main_widget = QWidget()
+
+        # Main Layout
+        self.main_layout = QGridLayout()
+        self.main_layout.setColumnStretch(0, 1)
+        self.main_layout.setColumnStretch(1, 1)
+        self.main_layout.setRowStretch(0, 1) # Title
+        self.main_layout.setRowStretch(1, 10) # Main
+        self.main_layout.setRowStretch(2, 3) # Params
+
+        self.main_widget.setLayout(self.main_layout)
+        self.setCentralWidget(self.main_widget)
+
+        # Title Area
+        self.title_area = TitleWidget(title='Imaging / Diffraction limit')
+        self.open_file_area = OpenFileWidget(title='Open File')
+        self.open_file_area.opened.connect(self.init_image)
+
+        # Image Areas
+        self.object_area = ImageWidget(title='Object')
+        self.image_area = ImageWidget(title='Image')
+        self.params_area = ParamsWidget(title='Params')
+        self.params_area.intensity.setEnabled(False)
+
+        # Include graphical elements in the window application
+        self.main_layout.addWidget(self.title_area, 0, 0, 1, 2)
+        self.main_layout.addWidget(self.object_area, 1, 0)
+        self.main_layout.addWidget(self.image_area, 1, 1)
+        self.main_layout.addWidget(self.open_file_area, 2, 0)
+        self.main_layout.addWidget(self.params_area, 2, 1)
+
+        self.init_image('')
+        self.params_area.changed.connect(self.params_changed)
+
+    def init_image(self, event):
+        if event != '':
+            self.image_name = event
+        """ Opening image """
+        if self.image_name == '':
+            self.image = self.create_target()
+        else:
+            self.image = cv2.imread(self.image_name, cv2.IMREAD_GRAYSCALE)
+        self.object_area.set_image_from_array(self.image)
+        self.image_area.set_image_from_array(self.image)
+
+    def create_target(self, height=512, width=1024) -> np.ndarray:
+        """
+        Default object : groups of bars with a decreasing period
+        """
+        target = np.zeros((height, width), dtype=np.uint8)
+        group_width = width // 8
+        for k, period in enumerate([64, 32, 16, 8, 6, 4, 3, 2]):
+            x = np.arange(group_width)
+            bars = np.where((x % period) < period/2, 255, 0)
+            target[height//4:3*height//4, k*group_width:(k+1)*group_width] = bars
+        return target
+
+    def refresh_image(self):
+        """
+        Simulate the image of the object with the current parameters
+        """
+        dist, diam, wale, pixw = self.params_area.get_data()
+        self.imaging_simulation.set_params(pixw, diam, dist, wale)
+        simulated = self.imaging_simulation.process(self.image)
+        simulated = np.clip(simulated, 0, 255).astype(np.uint8)
+        self.image_area.set_image_from_array(simulated)
+
+    def params_changed(self, event):
+        try:
+            if event == 'params' or self.params_area.distance.slider.isEnabled():
+                self.refresh_image()
+        except Exception as e:
+            print("Exception - params_changed: " + str(e) + "")
+
+# -------------------------------
+
+# Launching as main for tests
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+
+    window = MainWindow()
+    window.show()
+
+    sys.exit(app.exec())
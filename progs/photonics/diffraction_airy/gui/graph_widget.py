@@ -70,6 +70,10 @@ class GraphWidget(QWidget):
 
         # row = 0
         self.layout.addWidget(self.plot_area, 0, 0) 
+        # row = 1 - Results of the analysis
+        self.info_label = QLabel('')
+        self.info_label.setStyleSheet("font: 12px;")
+        self.layout.addWidget(self.info_label, 1, 0)
 
     def set_data(self, x_axis: np.ndarray, y_axis: list[np.ndarray]) -> None:
         '''
@@ -90,6 +94,10 @@ class GraphWidget(QWidget):
     def set_x_label(self, label):
         """Update the label for X-Axis"""
         self.plot_area.setLabel('bottom', label)
+
+    def set_info(self, text: str) -> None:
+        """Update the text displayed under the graph"""
+        self.info_label.setText(text)
         
 #--------------
 # Example to test the Simple_Widget class
@@ -23,6 +23,7 @@ from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget, QLabel, QPushBut
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QPixmap
 from lensepy.pyqt6.widget_image_display import WidgetImageDisplay
+from gui.qimage_conversion import QImageConverter
 
 
 
@@ -42,16 +43,45 @@ class ImageWidget(WidgetImageDisplay):
         self.background_color = background_color
         self.text_color = text_color
         self.image_copy = None
-        
+        self.converter = QImageConverter()
+
     def set_image_from_array(self, pixels: np.ndarray) -> None:
-        super().set_image_from_array(pixels)
-        self.image_copy = pixels.copy()
-    
+        """
+        Display a new image from an array (uint8 or uint16, any strides).
+        """
+        # One copy : to_8bits may return the array itself or a reused buffer
+        self.image_copy = self.converter.to_8bits(pixels).copy()
+        # The working image (with lines) is allocated again only if its size changes
+        if getattr(self, 'image', None) is None or self.image.shape != self.image_copy.shape:
+            self.image = self.image_copy.copy()
+        else:
+            np.copyto(self.image, self.image_copy)
+        self.refresh_display()
+
+    def refresh_display(self) -> None:
+        """
+        Display the current image, scaled to the size of the area
+        """
+        if self.image_copy is None:
+            return
+        pixmap = self.converter.to_pixmap(self.image)
+        self.image_display.setPixmap(pixmap.scaled(self.image_area.size(),
+                                                   Qt.AspectRatioMode.KeepAspectRatio,
+                                                   Qt.TransformationMode.SmoothTransformation))
+
+    def resizeEvent(self, event) -> None:
+        """
+        Action performed when the widget is resized (or the image modified).
+        """
+        self.refresh_display()
+        if event is not None:
+            QWidget.resizeEvent(self, event)
+
     def init_image(self) -> None:
         """
         Reinit the image to the original one - without lines
         """
-        self.image = self.image_copy.copy()
+        np.copyto(self.image, self.image_copy)
         self.resizeEvent(None)
     
     def draw_h_line(self, position: int, gray_color:int = 120, width: int = 2) -> None:
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+Conversion of NumPy arrays to QImage for LEnsE GUI Application
+
+Arrays with contiguous rows (uint8, gray or RGB) are wrapped as QImage
+without any copy, with their own stride. High bit depth images
+(uint16) are converted to 8 bits into a buffer reused from one frame to
+the next : by a shift of the most significant bits, or by a display LUT
+of the bit depth when display levels are set.
+
+The Qt binding (PyQt6, or PyQt5 for the older applications) is selected
+by gui.qt_binding.
+
+---------------------------------------
+(c) 2026 - LEnsE - Institut d'Optique
+---------------------------------------
+
+Modifications
+-------------
+    Creation on 2026/10/19
+
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Created on 19/oct/2026
+
+@author: julien.villemejane
+"""
+
+from functools import lru_cache
+import numpy as np
+from gui.qt_binding import QT_BINDING, sip, QImage, QPixmap
+
+
+# QImage format of each number of channels
+QIMAGE_FORMATS = {
+    1: QImage.Format.Format_Grayscale8,
+    3: QImage.Format.Format_RGB888,
+    4: QImage.Format.Format_RGBA8888,
+}
+
+
+@lru_cache(maxsize=8)
+def get_display_lut(bits_depth: int = 16, black: int = 0, white: int = None) -> np.ndarray:
+    """
+    Return the 8 bits display LUT of a high bit depth image.
+
+    :param bits_depth: Number of bits of the pixels.
+    :param black: Value displayed in black (0).
+    :param white: Value displayed in white (255). Default is 2**bits_depth - 1.
+    :return: LUT of 2**bits_depth values (uint8, read-only).
+    """
+    if white is None:
+        white = 2**bits_depth - 1
+    values = np.arange(2**bits_depth, dtype=float)
+    lut = np.clip((values - black) * 255 / max(white - black, 1) + 0.5, 0, 255)
+    lut = lut.astype(np.uint8)
+    lut.flags.writeable = False
+    return lut
+
+
+def _has_contiguous_rows(array: np.ndarray) -> bool:
+    """
+    Test if the pixels of each row of an uint8 array are contiguous
+    (the rows themselves can be separated by any stride).
+    """
+    if array.dtype != np.uint8 or array.strides[0] <= 0:
+        return False
+    if array.ndim == 2:
+        return array.strides[1] == 1
+    return array.strides[2] == 1 and array.strides[1] == array.shape[2]
+
+
+class QImageConverter:
+    """
+    Conversion of NumPy arrays to QImage, for the display of a sequence
+    of frames.
+
+    The QImage shares the memory of the array (or of the internal buffer)
+    and is only valid until the next conversion : it keeps a reference to
+    its data (attribute source) but must be copied into a QPixmap (see
+    to_pixmap) to be kept.
+    """
+
+    def __init__(self, bits_depth: int = None, black: int = 0, white: int = None) -> None:
+        """
+        Initialisation of the converter.
+
+        :param bits_depth: Number of bits of the high bit depth images
+            (uint16). Default is None : 16 bits.
+        :param black: Value displayed in black (0).
+        :param white: Value displayed in white (255). Default is the maximum value.
+        """
+        self.bits_depth = bits_depth
+        self.black = black
+        self.white = white
+        self.buffer = None
+        self.qimage = None
+
+    def set_levels(self, black: int = 0, white: int = None) -> None:
+        """
+        Set the display levels of the high bit depth images.
+
+        :param black: Value displayed in black (0).
+        :param white: Value displayed in white (255). Default is the maximum value.
+        """
+        self.black = black
+        self.white = white
+
+    def _get_buffer(self, shape: tuple) -> np.ndarray:
+        """
+        Return the 8 bits buffer of the converted frames (allocated again
+        only when the shape of the frames changes).
+        """
+        if self.buffer is None or self.buffer.shape != shape:
+            self.buffer = np.empty(shape, dtype=np.uint8)
+        return self.buffer
+
+    def to_8bits(self, array: np.ndarray) -> np.ndarray:
+        """
+        Return an array with contiguous rows of 8 bits pixels.
+
+        :param array: Image, 2D (gray) or 3D (RGB or RGBA).
+        :return: The array itself when possible, else the internal buffer.
+        """
+        array = np.asarray(array)
+        if _has_contiguous_rows(array):
+            return array
+        buffer = self._get_buffer(array.shape)
+        if array.dtype == np.uint16:
+            bits_depth = self.bits_depth if self.bits_depth is not None else 16
+            if self.black == 0 and self.white is None:
+                # No display levels : the 8 most significant bits
+                np.right_shift(array, max(bits_depth - 8, 0), out=buffer, casting='unsafe')
+            else:
+                # LUT of the bit depth (kept in cache), pixels above clipped to white
+                lut = get_display_lut(bits_depth, self.black, self.white)
+                np.take(lut, array, out=buffer, mode='clip')
+        else:
+            np.copyto(buffer, array, casting='unsafe')
+        return buffer
+
+    def to_qimage(self, array: np.ndarray) -> QImage:
+        """
+        Convert an array to a QImage, without copy for the arrays
+        of uint8 with contiguous rows.
+
+        :param array: Image, 2D (gray) or 3D (RGB or RGBA).
+        :return: QImage sharing the memory of the array (or of the buffer).
+        """
+        data = self.to_8bits(array)
+        channels = 1 if data.ndim == 2 else data.shape[2]
+        height, width = data.shape[:2]
+        self.qimage = QImage(sip.voidptr(data.ctypes.data), width, height,
+                             data.strides[0], QIMAGE_FORMATS[channels])
+        # Lifetime guard : the data lives as long as the QImage
+        self.qimage.source = data
+        return self.qimage
+
+    def to_pixmap(self, array: np.ndarray) -> QPixmap:
+        """
+        Convert an array to a QPixmap (one copy, into the QPixmap).
+
+        :param array: Image, 2D (gray) or 3D (RGB or RGBA).
+        :return: QPixmap of the image.
+        """
+        return QPixmap.fromImage(self.to_qimage(array))
+
+
+def array_to_qimage(array: np.ndarray, bits_depth: int = None) -> QImage:
+    """
+    Convert an array to a QImage (see QImageConverter.to_qimage).
+
+    :param array: Image, 2D (gray) or 3D (RGB or RGBA).
+    :param bits_depth: Number of bits of the high bit depth images.
+    :return: QImage of the image, keeping a reference to its data.
+    """
+    return QImageConverter(bits_depth).to_qimage(array)
+
+
+if __name__ == '__main__':
+    import sys
+    import time
+    from importlib import import_module
+    QApplication = import_module(QT_BINDING + '.QtWidgets').QApplication
+
+    app = QApplication(sys.argv)
+    rng = np.random.default_rng()
+
+    def benchmark(name, convert, frames, duration=1.0):
+        """ Frames per second of a conversion to QPixmap """
+        count = 0
+        start = time.perf_counter()
+        while time.perf_counter() - start < duration:
+            convert(frames[count % len(frames)])
+            count += 1
+        print(f'{name:>40} : {count / (time.perf_counter() - start):8.1f} fps')
+
+    def naive(array):
+        """ Former conversion : copy to uint8, QImage, then QPixmap """
+        image = np.array(array, dtype='uint8')
+        qimage = QImage(image, image.shape[1], image.shape[0], image.shape[1],
+                        QImage.Format.Format_Grayscale8)
+        return QPixmap(qimage)
+
+    converter = QImageConverter()
+    frames_8 = rng.integers(0, 256, size=(4, 1024, 1280), dtype=np.uint8)
+    benchmark('uint8 1280x1024 - former', naive, frames_8)
+    benchmark('uint8 1280x1024 - zero-copy', converter.to_pixmap, frames_8)
+    benchmark('uint8 crop 1000x800 - zero-copy', converter.to_pixmap,
+              frames_8[:, 100:900, 100:1100])
+    converter_12 = QImageConverter(bits_depth=12)
+    frames_12 = rng.integers(0, 4096, size=(4, 1024, 1280), dtype=np.uint16)
+    benchmark('uint16 (12 bits) 1280x1024 - shift', lambda f: naive(f >> 4), frames_12)
+    benchmark('uint16 (12 bits) 1280x1024 - converter', converter_12.to_pixmap, frames_12)
+    converter_12.set_levels(100, 3000)
+    benchmark('uint16 (12 bits) 1280x1024 - levels LUT', converter_12.to_pixmap, frames_12)
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+Qt binding of the LEnsE GUI modules shared with PyQt5 applications
+
+PyQt6 by default, PyQt5 when the application has already imported it
+(and not PyQt6).
+
+---------------------------------------
+(c) 2026 - LEnsE - Institut d'Optique
+---------------------------------------
+
+Modifications
+-------------
+    Creation on 2026/10/19
+
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Created on 19/oct/2026
+
+@author: julien.villemejane
+"""
+
+import sys
+
+if 'PyQt5' in sys.modules and 'PyQt6' not in sys.modules:
+    QT_BINDING = 'PyQt5'
+    from PyQt5 import sip
+    from PyQt5.QtGui import QImage, QPixmap
+else:
+    QT_BINDING = 'PyQt6'
+    from PyQt6 import sip
+    from PyQt6.QtGui import QImage, QPixmap
+
+__all__ = ['QT_BINDING', 'sip', 'QImage', 'QPixmap']
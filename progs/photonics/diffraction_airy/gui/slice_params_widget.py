@@ -20,7 +20,7 @@ Created on 01/jun/2024
 
 
 # Graphical interface
-from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget, QLabel, QPushButton, QGridLayout
+from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget, QLabel, QPushButton, QGridLayout, QCheckBox
 from PyQt6.QtCore import Qt, pyqtSignal
 from gui.v_slider_widget import VSliderWidget
 
@@ -61,17 +61,21 @@ class SliceParamsWidget(QWidget):
         self.mean_size.slider.setMinimumHeight(100)
         self.mean_size.set_units('px')
         self.mean_size.changed.connect(self.params_changed)
-        self.graph_position = VSliderWidget(name='Graph position', integer=True)
+        self.graph_position = VSliderWidget(name='Graph position')
         self.graph_position.slider.setMinimumHeight(100)
         self.graph_position.set_min_max_slider(-100, 100)
         self.graph_position.set_units('')
         self.graph_position.changed.connect(self.params_changed)
+        self.auto_align = QCheckBox('Auto align')
+        self.auto_align.setEnabled(False)
+        self.auto_align.stateChanged.connect(self.auto_align_changed)
 
         # Layout
         self.layout.addWidget(QLabel('Image (pixels)'), 0, 0) 
         self.layout.addWidget(self.position, 1, 0, 2, 1)  
         self.layout.addWidget(self.mean_size, 1, 1) 
         self.layout.addWidget(self.graph_position, 2, 1) 
+        self.layout.addWidget(self.auto_align, 3, 1)
     
     
     def get_data(self) -> (int, int, int):
@@ -92,11 +96,26 @@ class SliceParamsWidget(QWidget):
     def set_graph_position_min_max(self, min_v, max_v) -> None:
         self.graph_position.set_min_max_slider(min_v, max_v)
         
-    def set_graph_position(self, value: int) -> None:
-        self.graph_position.set_value(value)
+    def set_graph_position(self, value: float, signal: bool = True) -> None:
+        if signal:
+            self.graph_position.set_value(value)
+        else:
+            # No changed signal - used by the auto alignment at each refresh
+            self.graph_position.slider.blockSignals(True)
+            self.graph_position.set_value(value)
+            self.graph_position.slider.blockSignals(False)
+            self.graph_position.update_display()
         
     def set_graph_position_enabled(self, value:bool) -> None:
         self.graph_position.setEnabled(value)
+        self.auto_align.setEnabled(value)
+
+    def is_auto_align(self) -> bool:
+        return self.auto_align.isChecked()
+
+    def auto_align_changed(self, event):
+        self.graph_position.set_slider_enabled(not self.is_auto_align())
+        self.params_changed('auto_align')
     
     def params_changed(self, event):
         try:
@@ -53,6 +53,31 @@ class AiryDisc:
         k = diameter*1e-3/(distance*1e-2*wavelength*1e-9)
         J = (2*j1(np.pi*k*x_axis)/(np.pi*k*x_axis))**2
         return J
+
+    def get_psf(self, size, pixel_size, diameter, distance, wavelength) -> np.ndarray:
+        """
+        Return a 2D Airy disc (point spread function), normalized to a sum of 1.
+
+        :param size: Half size of the PSF (pixels). The PSF is (2*size+1) square
+        :type size: int
+        :param pixel_size: Size of a pixel of the sensor (um)
+        :type pixel_size: float
+        :param diameter: Diameter of the diffractive hole (mm)
+        :type diameter: float
+        :param distance: Distance between the diffractive hole and the sensor (cm)
+        :type distance: float
+        :param wavelength: Wavelenght of the signal (nm)
+        :type wavelength: float
+        :return: Array containing the PSF.
+        :rtype: np.ndarray
+        """
+        axis = np.arange(-size, size+1) * pixel_size*1e-6
+        radius = np.hypot(axis[:, np.newaxis], axis[np.newaxis, :])
+        # Limit in 0 of (2*J1(x)/x)**2 is 1
+        radius[size, size] = 1.0
+        psf = self.get_j(radius, diameter, distance, wavelength)
+        psf[size, size] = 1.0
+        return psf / np.sum(psf)
 #--------------
 # Example to test the Simple_Widget class
 
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+ImagingSimulation for Airy Disc demonstration
+LEnsE GUI Application
+
+---------------------------------------
+(c) 2026 - LEnsE - Institut d'Optique
+---------------------------------------
+
+Modifications
+-------------
+    Creation on 2026/10/19
+
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Created on 19/oct/2026
+
+@author: julien.villemejane
+"""
+
+from collections import OrderedDict
+import numpy as np
+from scipy import fft
+
+from process.airy import AiryDisc
+
+
+class ImagingSimulation:
+    """
+    ImagingSimulation class for simulating the image of an object through
+    a circular pupil, by convolution with the Airy disc (PSF).
+
+    Convolutions are computed with real 2D FFT. The spectra of the PSF are
+    cached for each set of parameters. Images bigger than max_size are
+    processed by tiles (overlap-add method).
+    """
+
+    def __init__(self, rings: int = 10, max_size: int = 2048,
+                 tile_size: int = 512, cache_size: int = 8) -> None:
+        """
+        Initialisation of the class.
+
+        :param rings: Number of dark rings included in the PSF
+        :type rings: int
+        :param max_size: Maximum size of an image processed in one transform
+        :type max_size: int
+        :param tile_size: Size of the tiles for bigger images
+        :type tile_size: int
+        :param cache_size: Maximum number of PSF spectra to keep
+        :type cache_size: int
+        """
+        self.airy = AiryDisc()
+        self.rings = rings
+        self.max_size = max_size
+        self.tile_size = tile_size
+        self.cache_size = cache_size
+        self.spectrum_cache = OrderedDict()
+        self.params = (1.0, 1.0, 1.0, 1.0)  # pixel size, diameter, distance, wavelength
+
+    def set_params(self, pixel_size, diameter, distance, wavelength) -> None:
+        """
+        Set the parameters of the imaging system.
+
+        :param pixel_size: Size of a pixel of the sensor (um)
+        :type pixel_size: float
+        :param diameter: Diameter of the diffractive hole (mm)
+        :type diameter: float
+        :param distance: Distance between the diffractive hole and the sensor (cm)
+        :type distance: float
+        :param wavelength: Wavelenght of the signal (nm)
+        :type wavelength: float
+        """
+        self.params = (pixel_size, diameter, distance, wavelength)
+
+    def get_psf_size(self) -> int:
+        """
+        Return the half size of the PSF (pixels), including self.rings rings
+        """
+        pixel_size, diameter, distance, wavelength = self.params
+        lambda_z_d = wavelength*1e-9*distance*1e-2 / (diameter*1e-3)
+        # The m-th dark ring is close to (m+0.25)*lambda.z/D
+        radius = (self.rings+0.25) * lambda_z_d / (pixel_size*1e-6)
+        return max(1, min(int(np.ceil(radius)), self.max_size//2))
+
+    def get_psf(self) -> np.ndarray:
+        """
+        Return the PSF corresponding to the parameters
+        """
+        pixel_size, diameter, distance, wavelength = self.params
+        return self.airy.get_psf(self.get_psf_size(), pixel_size,
+                                 diameter, distance, wavelength)
+
+    def get_psf_spectrum(self, shape: tuple) -> np.ndarray:
+        """
+        Return the real 2D FFT of the PSF, zero padded to shape.
+
+        Spectra are cached by (parameters, shape), the least recently
+        used ones are removed when the cache is full.
+        """
+        key = (self.params, shape)
+        if key in self.spectrum_cache:
+            self.spectrum_cache.move_to_end(key)
+            return self.spectrum_cache[key]
+        spectrum = fft.rfft2(self.get_psf(), shape, workers=-1)
+        self.spectrum_cache[key] = spectrum
+        if len(self.spectrum_cache) > self.cache_size:
+            self.spectrum_cache.popitem(last=False)
+        return spectrum
+
+    def process(self, image: np.ndarray) -> np.ndarray:
+        """
+        Return the image of the object through the imaging system.
+
+        :param image: Object (gray image)
+        :type image: np.ndarray
+        :return: Simulated image, with the same size as the object.
+        :rtype: np.ndarray
+        """
+        image = np.asarray(image, dtype=np.float32)
+        height, width = image.shape
+        psf_size = self.get_psf_size()
+        kernel = 2*psf_size + 1
+        if max(height, width) + kernel - 1 <= self.max_size:
+            shape = (fft.next_fast_len(height + kernel - 1, True),
+                     fft.next_fast_len(width + kernel - 1, True))
+            spectrum = fft.rfft2(image, shape, workers=-1)
+            spectrum *= self.get_psf_spectrum(shape)
+            output = fft.irfft2(spectrum, shape, workers=-1)
+        else:
+            output = self._overlap_add(image, kernel)
+        # Same size as the object - PSF centered on each pixel
+        return output[psf_size:psf_size+height, psf_size:psf_size+width]
+
+    def _overlap_add(self, image: np.ndarray, kernel: int) -> np.ndarray:
+        """
+        Convolution of a big image by tiles (overlap-add method)
+        """
+        height, width = image.shape
+        tile = self.tile_size
+        shape = (fft.next_fast_len(tile + kernel - 1, True),) * 2
+        spectrum_psf = self.get_psf_spectrum(shape)
+        output = np.zeros((height + shape[0], width + shape[1]), dtype=np.float32)
+        for row in range(0, height, tile):
+            for col in range(0, width, tile):
+                block = image[row:row+tile, col:col+tile]
+                spectrum = fft.rfft2(block, shape, workers=-1)
+                spectrum *= spectrum_psf
+                output[row:row+shape[0], col:col+shape[1]] += \
+                    fft.irfft2(spectrum, shape, workers=-1)
+        return output
+
+
+#--------------
+# Example to test the ImagingSimulation class
+# python -m process.imaging_simulation
+
+if __name__ == '__main__':
+    import time
+    simulation = ImagingSimulation()
+    simulation.set_params(5.3, 1.0, 10, 633)
+    test_image = np.zeros((1024, 1280))
+    test_image[::64, ::64] = 255
+    start = time.perf_counter()
+    result = simulation.process(test_image)
+    print(f'First call : {(time.perf_counter()-start)*1e3:.1f} ms')
+    start = time.perf_counter()
+    result = simulation.process(test_image)
+    print(f'Cached PSF : {(time.perf_counter()-start)*1e3:.1f} ms')
+    simulation.max_size = 512
+    tiled = simulation.process(test_image)
+    print(f'Overlap-add error : {np.max(np.abs(tiled - result)):.2e}')
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+ProfileAlignment for Airy Disc demonstration
+LEnsE GUI Application
+
+---------------------------------------
+(c) 2026 - LEnsE - Institut d'Optique
+---------------------------------------
+
+Modifications
+-------------
+    Creation on 2026/10/19
+
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Created on 19/oct/2026
+
+@author: julien.villemejane
+"""
+
+import numpy as np
+
+
+class ProfileAlignment:
+    """
+    ProfileAlignment class for finding the lateral shift between a measured
+    profile and a simulated one, by FFT cross-correlation.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialisation of the class.
+        """
+        self.shift = 0.0        # last shift found (in samples)
+        self.fft_size = 0       # size of the FFT used for the correlation
+
+    def find_shift(self, measured: np.ndarray, simulated: np.ndarray) -> float:
+        """
+        Return the shift (in samples) to apply to the simulated profile
+        to match the measured one.
+
+        The cross-correlation is computed in O(N log N) with real FFT
+        and its maximum is refined with a parabolic interpolation.
+        For each lag, the correlation is normalized on the overlap of the
+        two profiles, with the mean of each profile on this overlap
+        (Pearson coefficient) : a global mean would bias the shift when
+        the Airy disc is large compared to the slice.
+
+        :param measured: Measured profile (slice of the image)
+        :type measured: np.ndarray
+        :param simulated: Simulated profile, with the same size
+        :type simulated: np.ndarray
+        :return: Sub-pixel shift. A positive value means that the
+            simulated profile has to be moved to the right.
+        :rtype: float
+        """
+        size = measured.size
+        measured = np.asarray(measured, dtype=float)
+        simulated = np.nan_to_num(np.asarray(simulated, dtype=float),
+                                  nan=np.nanmax(simulated))
+        # Zero padding to avoid circular correlation
+        self.fft_size = 1 << int(2*size-1).bit_length()
+        spectrum = np.fft.rfft(measured, self.fft_size)
+        spectrum *= np.conj(np.fft.rfft(simulated, self.fft_size))
+        correlation = np.fft.irfft(spectrum, self.fft_size)
+        # Negative lags are at the end of the array
+        correlation = np.roll(correlation, size-1)[:2*size-1]
+        correlation = self._normalize(correlation, measured, simulated)
+        peak = int(np.argmax(correlation))
+        # Sub-pixel refinement - parabola through the 3 points around the peak
+        delta = 0.0
+        if 0 < peak < correlation.size-1:
+            y_m, y_0, y_p = correlation[peak-1:peak+2]
+            denominator = y_m - 2*y_0 + y_p
+            if np.isfinite(denominator) and denominator != 0:
+                delta = 0.5*(y_m - y_p) / denominator
+        self.shift = peak - (size-1) + delta
+        return self.shift
+
+    @staticmethod
+    def _normalize(correlation: np.ndarray, measured: np.ndarray,
+                   simulated: np.ndarray) -> np.ndarray:
+        """
+        Return the correlation normalized on the overlap of the profiles.
+
+        At the lag k, the overlap is measured[k:] and simulated[:size-k]
+        (measured[:size+k] and simulated[-k:] for a negative lag).
+        Their sums are given by cumulative sums. The lags with an overlap
+        of less than half the profile are set to -inf.
+
+        :param correlation: Raw cross-correlation, for lags -(size-1)..size-1
+        :type correlation: np.ndarray
+        :return: Normalized cross-correlation (between -1 and 1)
+        :rtype: np.ndarray
+        """
+        size = measured.size
+        lags = np.arange(-(size-1), size)
+        length = size - np.abs(lags)
+
+        def overlap_sums(values):
+            # Sums of the head (values[:n]) and of the tail (values[-n:])
+            cumsum = np.concatenate(([0.0], np.cumsum(values)))
+            head = cumsum[length]
+            tail = cumsum[-1] - cumsum[size-length]
+            return head, tail
+
+        m_head, m_tail = overlap_sums(measured)
+        m2_head, m2_tail = overlap_sums(measured**2)
+        s_head, s_tail = overlap_sums(simulated)
+        s2_head, s2_tail = overlap_sums(simulated**2)
+        positive = lags >= 0
+        sum_m = np.where(positive, m_tail, m_head)
+        sum_m2 = np.where(positive, m2_tail, m2_head)
+        sum_s = np.where(positive, s_head, s_tail)
+        sum_s2 = np.where(positive, s2_head, s2_tail)
+        covariance = correlation - sum_m*sum_s/length
+        variance = (sum_m2 - sum_m**2/length) * (sum_s2 - sum_s**2/length)
+        normalized = np.full(correlation.size, -np.inf)
+        valid = (2*length >= size) & (variance > 0)
+        normalized[valid] = covariance[valid] / np.sqrt(variance[valid])
+        return normalized
+
+    def get_graph_position(self, measured: np.ndarray,
+                           simulated: np.ndarray) -> float:
+        """
+        Return the graph position (g_pos) that aligns the simulated
+        profile on the measured one.
+
+        The simulated profile has to be computed with a graph position of 0,
+        i.e. centered on the slice. In the main window, the Airy disc is
+        centered at the index (width+g_pos)/2*(width-1)/width.
+
+        :param measured: Measured profile (slice of the image)
+        :type measured: np.ndarray
+        :param simulated: Simulated profile centered on the slice
+        :type simulated: np.ndarray
+        :return: Graph position.
+        :rtype: float
+        """
+        size = measured.size
+        shift = self.find_shift(measured, simulated)
+        return 2*shift*size/(size-1)
+
+
+#--------------
+# Example to test the ProfileAlignment class
+
+if __name__ == '__main__':
+    x = np.linspace(-10, 10, 1001)
+    profile_ref = np.sinc(x)**2
+    profile_meas = np.sinc(x-1.234)**2
+    alignment = ProfileAlignment()
+    print(alignment.find_shift(profile_meas, profile_ref)*(x[1]-x[0]))
+
+    # Known offsets with large Airy discs (lambda.z/D up to 200 px)
+    from scipy.special import j1
+    pixels = np.arange(1024) - 511.5
+    for lambda_z_d in [10, 126, 200]:
+        for offset in [37.3, -80.6, 200.2]:
+            u_ref = np.pi*pixels/lambda_z_d
+            u_meas = np.pi*(pixels-offset)/lambda_z_d
+            profile_ref = (2*j1(u_ref)/u_ref)**2
+            profile_meas = (2*j1(u_meas)/u_meas)**2
+            shift = alignment.find_shift(profile_meas, profile_ref)
+            print(f'lambda.z/D = {lambda_z_d} px / offset = {offset} px / '
+                  f'shift = {shift:.3f} px')
+            assert abs(shift - offset) < 0.05
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+RingAnalysis for Airy Disc demonstration
+LEnsE GUI Application
+
+---------------------------------------
+(c) 2026 - LEnsE - Institut d'Optique
+---------------------------------------
+
+Modifications
+-------------
+    Creation on 2026/10/19
+
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Created on 19/oct/2026
+
+@author: julien.villemejane
+"""
+
+import numpy as np
+from scipy.special import jn_zeros
+from scipy.signal import find_peaks
+
+
+class RingAnalysis:
+    """
+    RingAnalysis class for detecting the dark and bright rings of a measured
+    Airy disc profile and estimating the lambda.z/D ratio.
+
+    The radius of the m-th dark ring is j1_m/pi * lambda.z/D, where j1_m is
+    the m-th zero of J1. The m-th bright ring is given by the zeros of J2.
+    """
+
+    def __init__(self, max_rings: int = 5, sigma: float = 1.5,
+                 prominence: float = 0.01) -> None:
+        """
+        Initialisation of the class.
+
+        :param max_rings: Maximum number of rings to detect on each side
+        :type max_rings: int
+        :param sigma: Width of the gaussian smoothing kernel (pixels)
+        :type sigma: float
+        :param prominence: Minimum prominence of a ring, relative to the
+            maximum of the profile
+        :type prominence: float
+        """
+        self.max_rings = max_rings
+        self.prominence = prominence
+        self.kernel = np.array([1.0])
+        self.set_sigma(sigma)
+        # Cached zeros of J1 (dark rings) and J2 (bright rings), in lambda.z/D
+        self.dark_zeros = jn_zeros(1, max_rings) / np.pi
+        self.bright_zeros = jn_zeros(2, max_rings) / np.pi
+        # Results of the last analysis
+        self.center = 0.0
+        self.minima = np.array([])      # sub-pixel positions of the minima
+        self.maxima = np.array([])      # sub-pixel positions of the maxima
+        self.dark_radii = np.array([])  # radii of the dark rings (pixels)
+        self.bright_radii = np.array([])    # radii of the bright rings (pixels)
+        self.lambda_z_d = 0.0           # estimated lambda.z/D (pixels)
+
+    def set_sigma(self, sigma: float) -> None:
+        """
+        Set the width of the gaussian smoothing kernel (pixels)
+        """
+        if sigma <= 0:
+            self.kernel = np.array([1.0])
+            return
+        half_size = int(np.ceil(3*sigma))
+        x = np.arange(-half_size, half_size+1)
+        kernel = np.exp(-0.5*(x/sigma)**2)
+        self.kernel = kernel / np.sum(kernel)
+
+    def smooth(self, profile: np.ndarray) -> np.ndarray:
+        """
+        Return the profile smoothed by the gaussian kernel.
+
+        :param profile: Profile to smooth
+        :type profile: np.ndarray
+        :return: Smoothed profile, with the same size.
+        :rtype: np.ndarray
+        """
+        half_size = self.kernel.size // 2
+        padded = np.pad(np.asarray(profile, dtype=float), half_size,
+                        mode='reflect')
+        return np.convolve(padded, self.kernel, mode='valid')
+
+    def find_extrema(self, profile: np.ndarray) -> (np.ndarray, np.ndarray):
+        """
+        Return the sub-pixel positions of the local minima and maxima
+        of a (smoothed) profile.
+
+        Extrema with a prominence lower than the threshold (relative to
+        the maximum of the profile) are rejected. Positions are refined
+        with a parabola through the 3 points around each extremum.
+
+        :param profile: Profile to analyse
+        :type profile: np.ndarray
+        :return: Positions of the minima and of the maxima.
+        :rtype: tuple of np.ndarray
+        """
+        threshold = self.prominence * np.max(profile)
+        min_ind, _ = find_peaks(-profile, prominence=threshold)
+        max_ind, _ = find_peaks(profile, prominence=threshold)
+        return (self._refine(profile, min_ind),
+                self._refine(profile, max_ind))
+
+    def _refine(self, profile: np.ndarray, indices: np.ndarray) -> np.ndarray:
+        """
+        Parabolic sub-pixel refinement of extrema positions
+        """
+        y_m = profile[indices-1]
+        y_0 = profile[indices]
+        y_p = profile[indices+1]
+        denominator = y_m - 2*y_0 + y_p
+        delta = np.divide(0.5*(y_m - y_p), denominator,
+                          out=np.zeros(indices.size), where=denominator != 0)
+        return indices + np.clip(delta, -0.5, 0.5)
+
+    def process(self, profile: np.ndarray) -> float:
+        """
+        Analyse a measured profile and return the estimated lambda.z/D.
+
+        The center of the disc is the middle of the first dark ring. Rings
+        are paired on each side of the center, so the radii do not depend
+        on the position of the disc in the image.
+
+        :param profile: Measured profile (slice of the image)
+        :type profile: np.ndarray
+        :return: Estimated lambda.z/D in pixels, 0 if no ring was found.
+        :rtype: float
+        """
+        smoothed = self.smooth(profile)
+        self.minima, self.maxima = self.find_extrema(smoothed)
+        self.dark_radii = np.array([])
+        self.bright_radii = np.array([])
+        self.lambda_z_d = 0.0
+        peak = np.argmax(smoothed)
+        left = self.minima[self.minima < peak][::-1]
+        right = self.minima[self.minima > peak]
+        rings = min(left.size, right.size, self.max_rings)
+        if rings == 0:
+            return self.lambda_z_d
+        self.dark_radii = (right[:rings] - left[:rings]) / 2
+        self.center = (right[0] + left[0]) / 2
+        # Bright rings : maxima outside the first dark ring
+        left = self.maxima[self.maxima < left[0]][::-1]
+        right = self.maxima[self.maxima > right[0]]
+        bright = min(left.size, right.size, rings)
+        self.bright_radii = (right[:bright] - left[:bright]) / 2
+        # Least square fit of radius = zero * lambda.z/D
+        zeros = np.concatenate((self.dark_zeros[:rings],
+                                self.bright_zeros[:bright]))
+        radii = np.concatenate((self.dark_radii, self.bright_radii))
+        self.lambda_z_d = np.dot(radii, zeros) / np.dot(zeros, zeros)
+        return self.lambda_z_d
+
+    def get_first_ring_radius(self) -> float:
+        """
+        Return the radius of the first dark ring (1.22 lambda.z/D), in pixels
+        """
+        return self.dark_zeros[0] * self.lambda_z_d
+
+    def get_diameter(self, pixel_size: float, distance: float,
+                     wavelength: float) -> float:
+        """
+        Return the estimated diameter of the diffractive hole (mm)
+
+        :param pixel_size: Size of a pixel of the sensor (um)
+        :type pixel_size: float
+        :param distance: Distance between the diffractive hole and the sensor (cm)
+        :type distance: float
+        :param wavelength: Wavelength of the signal (nm)
+        :type wavelength: float
+        """
+        if self.lambda_z_d == 0:
+            return 0.0
+        ratio = self.lambda_z_d * pixel_size*1e-6
+        return wavelength*1e-9 * distance*1e-2 / ratio * 1e3
+
+    def get_wavelength(self, pixel_size: float, distance: float,
+                       diameter: float) -> float:
+        """
+        Return the estimated wavelength of the signal (nm)
+
+        :param pixel_size: Size of a pixel of the sensor (um)
+        :type pixel_size: float
+        :param distance: Distance between the diffractive hole and the sensor (cm)
+        :type distance: float
+        :param diameter: Diameter of the diffractive hole (mm)
+        :type diameter: float
+        """
+        ratio = self.lambda_z_d * pixel_size*1e-6
+        return ratio * diameter*1e-3 / (distance*1e-2) * 1e9
+
+
+#--------------
+# Example to test the RingAnalysis class
+
+if __name__ == '__main__':
+    from scipy.special import j1
+    x = np.arange(1001) - 500.3
+    x[x == 0] = 1e-9
+    lambda_z_d = 40.0
+    profile = (2*j1(np.pi*x/lambda_z_d)/(np.pi*x/lambda_z_d))**2
+    analysis = RingAnalysis()
+    print(analysis.process(255*profile), analysis.center)
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the conversion of NumPy arrays to QImage (gui.qimage_conversion)
+
+Run from the application : python -m pytest tests
+
+---------------------------------------
+(c) 2026 - LEnsE - Institut d'Optique
+---------------------------------------
+
+Modifications
+-------------
+    Creation on 2026/10/19
+
+
+Author : Julien VILLEMEJANE
+Laboratoire d Enseignement Experimental - Institut d Optique Graduate School
+Created on 19/oct/2026
+
+@author: julien.villemejane
+"""
+
+import os
+import sys
+import timeit
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gui.qimage_conversion import QImageConverter, array_to_qimage, get_display_lut
+
+
+def get_frame(bits_depth=12, shape=(1024, 1280)):
+    return np.random.default_rng(0).integers(0, 2**bits_depth, size=shape, dtype=np.uint16)
+
+
+def get_time(function, number=5):
+    """ Best time of a function over a few repeats """
+    return min(timeit.repeat(function, number=number, repeat=5)) / number
+
+
+def test_uint8_zero_copy():
+    frame = np.random.default_rng(0).integers(0, 256, size=(100, 120, 3), dtype=np.uint8)
+    converter = QImageConverter()
+    for array in (frame[:, :, 0].copy(), frame, frame[10:90, 20:100]):
+        assert converter.to_8bits(array) is array
+        qimage = converter.to_qimage(array)
+        assert (qimage.width(), qimage.height()) == (array.shape[1], array.shape[0])
+        assert qimage.bytesPerLine() == array.strides[0]
+        assert qimage.source is array
+    # Columns not contiguous : copied into the buffer
+    column = frame[:, :, 0]
+    assert np.array_equal(converter.to_8bits(column), column)
+    assert converter.to_8bits(column) is converter.buffer
+
+
+def test_qimage_pixels():
+    frame = np.arange(12 * 10, dtype=np.uint8).reshape(10, 12)
+    qimage = array_to_qimage(frame[2:8, 3:11])
+    assert qimage.pixelColor(0, 0).red() == frame[2, 3]
+    assert qimage.pixelColor(7, 5).red() == frame[7, 10]
+
+
+def test_uint16_shift():
+    for bits_depth in (10, 12, 16):
+        frame = get_frame(bits_depth, (64, 80))
+        converter = QImageConverter(bits_depth)
+        assert np.array_equal(converter.to_8bits(frame), frame >> (bits_depth - 8))
+    assert np.array_equal(QImageConverter().to_8bits(frame), frame >> 8)
+
+
+def test_uint16_levels():
+    frame = get_frame(12, (64, 80))
+    frame[0, 0] = 5000      # above the bit depth : white
+    converter = QImageConverter(12, 100, 3000)
+    reference = np.clip((frame - 100.0) * 255 / 2900 + 0.5, 0, 255).astype(np.uint8)
+    reference[0, 0] = 255
+    assert np.array_equal(converter.to_8bits(frame), reference)
+    assert len(get_display_lut(12, 100, 3000)) == 4096
+
+
+def test_uint16_speed():
+    frame = get_frame()
+    converter = QImageConverter(12)
+    # Without levels : a shift, faster than the former shift and copy
+    shift = get_time(lambda: converter.to_8bits(frame))
+    former = get_time(lambda: np.array(frame >> 4, dtype=np.uint8))
+    assert shift < former
+    # With levels : the LUT, faster than the computation of the levels
+    converter.set_levels(100, 3000)
+    lut = get_time(lambda: converter.to_8bits(frame))
+    levels = get_time(lambda: np.clip((frame - 100.0) * 255 / 2900 + 0.5, 0, 255).astype(np.uint8))
+    assert lut < levels